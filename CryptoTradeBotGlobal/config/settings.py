@@ -103,6 +103,7 @@ class TradingSettings(BaseSettings):
     order_timeout_seconds: int = Field(default=30, description="Order timeout in seconds")
     slippage_tolerance: float = Field(default=0.001, description="Slippage tolerance (0.1%)")
     min_order_size: float = Field(default=10.0, description="Minimum order size")
+    completed_orders_cap: int = Field(default=100000, description="Completed orders kept in memory")
     
     # Strategy settings
     enabled_strategies: List[str] = Field(
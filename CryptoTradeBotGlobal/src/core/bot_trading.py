@@ -13,6 +13,9 @@ import time
 from src.utils.logger import obter_logger, log_performance, GerenciadorContextoLog
 from config import ConfiguracoesGlobais, ConfiguracaoExchange
 
+_UM = Decimal('1')
+_CEM = Decimal('100')
+
 
 class GerenciadorRiscoSimplificado:
     """Gerenciador de risco simplificado para o bot"""
@@ -40,6 +43,14 @@ class GerenciadorRiscoSimplificado:
         self.perda_diaria = 0.0
         self.inicio_dia = datetime.now().date()
         
+        # Limites percentuais da configuração convertidos uma única vez para Decimal
+        self._fracao_max_posicao = Decimal(str(self.config.tamanho_maximo_posicao_pct)) / _CEM
+        self._limite_perda_diaria = self.valor_inicial * Decimal(str(self.config.perda_maxima_diaria_pct)) / _CEM
+        fracao_stop = Decimal(str(self.config.stop_loss_pct)) / _CEM
+        fracao_take = Decimal(str(self.config.take_profit_pct)) / _CEM
+        self._fatores_compra = (_UM - fracao_stop, _UM + fracao_take)
+        self._fatores_venda = (_UM + fracao_stop, _UM - fracao_take)
+        
     async def validar_ordem(self, simbolo: str, lado: str, quantidade: Decimal, preco: Decimal) -> tuple[bool, str, Decimal]:
         """
         Valida se uma ordem pode ser executada
@@ -62,7 +73,7 @@ class GerenciadorRiscoSimplificado:
             valor_ordem = quantidade * preco
             
             # Verificar tamanho máximo da posição
-            tamanho_max_posicao = (self.valor_atual * Decimal(str(self.config.tamanho_maximo_posicao_pct))) / Decimal('100')
+            tamanho_max_posicao = self.valor_atual * self._fracao_max_posicao
             if valor_ordem > tamanho_max_posicao:
                 # Ajustar quantidade
                 quantidade_ajustada = tamanho_max_posicao / preco
@@ -74,7 +85,7 @@ class GerenciadorRiscoSimplificado:
                 return False, "Muitas perdas consecutivas - período de cooling off", quantidade
             
             # Verificar perda diária
-            if self.perda_diaria >= (self.valor_inicial * Decimal(str(self.config.perda_maxima_diaria_pct)) / Decimal('100')):
+            if self.perda_diaria >= self._limite_perda_diaria:
                 return False, "Limite de perda diária atingido", quantidade
             
             # Verificar drawdown máximo
@@ -98,16 +109,8 @@ class GerenciadorRiscoSimplificado:
         Returns:
             (stop_loss, take_profit)
         """
-        stop_loss_pct = Decimal(str(self.config.stop_loss_pct))
-        take_profit_pct = Decimal(str(self.config.take_profit_pct))
-        if lado.upper() == 'BUY':
-            stop_loss = preco_entrada * (Decimal('1') - (stop_loss_pct / Decimal('100')))
-            take_profit = preco_entrada * (Decimal('1') + (take_profit_pct / Decimal('100')))
-        else:  # SELL
-            stop_loss = preco_entrada * (Decimal('1') + (stop_loss_pct / Decimal('100')))
-            take_profit = preco_entrada * (Decimal('1') - (take_profit_pct / Decimal('100')))
-        
-        return stop_loss, take_profit
+        fator_stop, fator_take = self._fatores_compra if lado.upper() == 'BUY' else self._fatores_venda
+        return preco_entrada * fator_stop, preco_entrada * fator_take
     
     async def atualizar_posicao(self, simbolo: str, quantidade: Decimal, preco: Decimal, lado: str):
         """
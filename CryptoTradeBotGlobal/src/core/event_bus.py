@@ -6,7 +6,7 @@ Enterprise-grade event-driven architecture for real-time trading
 import asyncio
 import logging
 import time
-from typing import Dict, List, Callable, Any, Optional, Set
+from typing import Dict, List, Callable, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import defaultdict
@@ -163,6 +163,10 @@ class EventBus:
         self._handlers: Dict[EventType, List[EventHandler]] = defaultdict(list)
         self._wildcard_handlers: List[EventHandler] = []
         
+        # Per-event-type handler lists (specific + wildcard), rebuilt lazily
+        # after any subscription change
+        self._resolved_handlers: Dict[EventType, Tuple[EventHandler, ...]] = {}
+        
         # Event queues by priority
         self._event_queues: Dict[EventPriority, asyncio.Queue] = {
             priority: asyncio.Queue(maxsize=max_queue_size)
@@ -220,6 +224,7 @@ class EventBus:
             self._handlers[event_type].append(event_handler)
             # Sort by priority (descending)
             self._handlers[event_type].sort(key=lambda h: h.priority, reverse=True)
+            self._resolved_handlers.clear()
             
             # Initialize handler stats
             self._handler_stats[event_handler.handler_id] = {
@@ -246,6 +251,7 @@ class EventBus:
         with self._lock:
             self._wildcard_handlers.append(event_handler)
             self._wildcard_handlers.sort(key=lambda h: h.priority, reverse=True)
+            self._resolved_handlers.clear()
         
         self.logger.info(f"Subscribed wildcard handler {event_handler.handler_id}")
         return event_handler.handler_id
@@ -263,6 +269,7 @@ class EventBus:
             self._wildcard_handlers = [
                 h for h in self._wildcard_handlers if h.handler_id != handler_id
             ]
+            self._resolved_handlers.clear()
             
             # Remove stats
             if handler_id in self._handler_stats:
@@ -409,8 +416,9 @@ class EventBus:
         
         try:
             # Get handlers for this event type
-            handlers = self._handlers.get(event.event_type, []).copy()
-            handlers.extend(self._wildcard_handlers.copy())
+            handlers = self._resolved_handlers.get(event.event_type)
+            if handlers is None:
+                handlers = self._resolve_handlers(event.event_type)
             
             if not handlers:
                 self.logger.debug(f"No handlers for event {event.event_type.value}")
@@ -445,6 +453,13 @@ class EventBus:
                 except asyncio.QueueFull:
                     self.logger.error(f"Dead letter queue full, dropping event {event.event_id}")
     
+    def _resolve_handlers(self, event_type: EventType) -> Tuple[EventHandler, ...]:
+        """Build and cache the handler tuple for an event type"""
+        with self._lock:
+            handlers = tuple(self._handlers.get(event_type, ())) + tuple(self._wildcard_handlers)
+            self._resolved_handlers[event_type] = handlers
+        return handlers
+    
     async def _process_dead_letter_queue(self) -> None:
         """Process dead letter queue"""
         while self._running:
@@ -4,6 +4,7 @@ Advanced performance monitoring and optimization for institutional trading
 """
 
 import asyncio
+import sys
 import time
 import psutil
 import gc
@@ -505,5 +506,12 @@ class PerformanceOptimizer:
 # Global performance optimizer instance
 performance_optimizer = PerformanceOptimizer()
 
-# Decorator for easy function profiling
-profile = performance_optimizer.profiler.profile_function
+
+def _no_profile(func_name: str = None):
+    """Pass-through replacement for `profile` under `python -O`"""
+    return lambda func: func
+
+
+# Decorator for easy function profiling; compiled out of optimized
+# (`python -O`) production runs so hot paths carry no timing wrapper
+profile = _no_profile if sys.flags.optimize else performance_optimizer.profiler.profile_function
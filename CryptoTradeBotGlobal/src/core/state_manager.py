@@ -6,17 +6,18 @@ Enterprise-grade state persistence and recovery for trading operations
 import asyncio
 import json
 import logging
+import os
 import time
 import threading
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, Optional, List, Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
-import pickle
 import sqlite3
+import zlib
 from datetime import datetime, timedelta
 
 from .event_bus import EventBus, EventType, EventPriority, Event
-from .performance_optimizer import profile
+from .performance_optimizer import profile, performance_optimizer
 from config.settings import get_settings
 
 
@@ -34,7 +35,32 @@ class SystemState:
     uptime_seconds: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        """Shallow dictionary view sharing the nested dicts (no copy)"""
+        return {
+            'timestamp': self.timestamp,
+            'trading_engine_state': self.trading_engine_state,
+            'active_orders': self.active_orders,
+            'active_positions': self.active_positions,
+            'portfolio_metrics': self.portfolio_metrics,
+            'risk_metrics': self.risk_metrics,
+            'performance_metrics': self.performance_metrics,
+            'configuration_hash': self.configuration_hash,
+            'uptime_seconds': self.uptime_seconds
+        }
+    
+    def to_dict_copy(self) -> Dict[str, Any]:
+        """Dictionary with copies of the mutable dicts, safe to keep"""
+        return {
+            'timestamp': self.timestamp,
+            'trading_engine_state': self.trading_engine_state,
+            'active_orders': self.active_orders.copy(),
+            'active_positions': self.active_positions.copy(),
+            'portfolio_metrics': self.portfolio_metrics.copy(),
+            'risk_metrics': self.risk_metrics.copy(),
+            'performance_metrics': self.performance_metrics.copy(),
+            'configuration_hash': self.configuration_hash,
+            'uptime_seconds': self.uptime_seconds
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SystemState':
@@ -58,6 +84,7 @@ class StateManager:
         self.logger = logging.getLogger(__name__)
         self.event_bus = event_bus
         self.settings = get_settings()
+        self._perf_optimizer = performance_optimizer
         
         # State storage
         self.current_state = SystemState()
@@ -71,18 +98,33 @@ class StateManager:
         self.state_file = self.data_dir / "system_state.json"
         self.backup_dir = self.data_dir / "backups"
         self.backup_dir.mkdir(exist_ok=True)
+        self._backup_count = self._count_state_backups()
         
         # Database for historical data
         self.db_file = self.data_dir / "trading_history.db"
         self.db_connection: Optional[sqlite3.Connection] = None
+        self.fetch_batch_size = 1000
+        
+        # Buffered performance_metrics rows, written with executemany
+        self._perf_buffer: List[tuple] = []
+        self.perf_flush_size = 10
+        
+        # Snapshot delta encoding (full base every N snapshots)
+        self.snapshot_base_interval = 50
+        self._last_snapshot_dict: Optional[Dict[str, Any]] = None
+        self._last_base_id: Optional[int] = None
+        self._snapshots_since_base = 0
         
         # Control flags
         self.running = False
         self.snapshot_interval = 30.0  # seconds
         self.backup_interval = 3600.0  # 1 hour
         
-        # Thread safety
-        self.lock = threading.RLock()
+        # Thread safety (orders and positions never interact, so they get
+        # their own locks; lock order is state -> orders -> positions)
+        self._state_lock = threading.Lock()
+        self._orders_lock = threading.Lock()
+        self._positions_lock = threading.Lock()
         
         # Tasks
         self.snapshot_task: Optional[asyncio.Task] = None
@@ -106,14 +148,16 @@ class StateManager:
             # Create tables
             self.db_connection.executescript("""
                 CREATE TABLE IF NOT EXISTS state_snapshots (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     timestamp REAL NOT NULL,
-                    state_data TEXT NOT NULL,
+                    state_data BLOB NOT NULL,
+                    is_delta INTEGER NOT NULL DEFAULT 0,
+                    base_id INTEGER,
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 );
                 
                 CREATE TABLE IF NOT EXISTS trading_events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     event_id TEXT NOT NULL,
                     event_type TEXT NOT NULL,
                     event_data TEXT NOT NULL,
@@ -122,7 +166,7 @@ class StateManager:
                 );
                 
                 CREATE TABLE IF NOT EXISTS performance_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER PRIMARY KEY,
                     timestamp REAL NOT NULL,
                     cpu_usage REAL,
                     memory_usage REAL,
@@ -134,8 +178,10 @@ class StateManager:
                 CREATE INDEX IF NOT EXISTS idx_snapshots_timestamp 
                 ON state_snapshots(timestamp);
                 
-                CREATE INDEX IF NOT EXISTS idx_events_timestamp 
-                ON trading_events(timestamp);
+                DROP INDEX IF EXISTS idx_events_timestamp;
+                
+                CREATE INDEX IF NOT EXISTS idx_events_ts_type 
+                ON trading_events(timestamp DESC, event_type, event_id);
                 
                 CREATE INDEX IF NOT EXISTS idx_events_type 
                 ON trading_events(event_type);
@@ -144,6 +190,20 @@ class StateManager:
                 ON performance_metrics(timestamp);
             """)
             
+            # Upgrade snapshot tables created before delta encoding
+            columns = {
+                row[1] for row in
+                self.db_connection.execute("PRAGMA table_info(state_snapshots)")
+            }
+            if 'is_delta' not in columns:
+                self.db_connection.execute(
+                    "ALTER TABLE state_snapshots ADD COLUMN is_delta INTEGER NOT NULL DEFAULT 0"
+                )
+            if 'base_id' not in columns:
+                self.db_connection.execute(
+                    "ALTER TABLE state_snapshots ADD COLUMN base_id INTEGER"
+                )
+            
             self.db_connection.commit()
             self.logger.info("Database initialized successfully")
             
@@ -153,17 +213,19 @@ class StateManager:
     
     def _setup_event_handlers(self):
         """Setup event handlers for state tracking"""
-        # Subscribe to all events for logging
-        self.event_bus.subscribe_all(self._handle_event_for_logging, priority=10)
+        # State update handlers dispatched from the single logging subscription
+        self._handlers = {
+            EventType.ORDER_PLACED: self._handle_order_event,
+            EventType.ORDER_FILLED: self._handle_order_event,
+            EventType.ORDER_CANCELLED: self._handle_order_event,
+            EventType.POSITION_OPENED: self._handle_position_event,
+            EventType.POSITION_CLOSED: self._handle_position_event,
+            EventType.SYSTEM_STARTUP: self._handle_system_event,
+            EventType.SYSTEM_SHUTDOWN: self._handle_system_event,
+        }
         
-        # Subscribe to specific events for state updates
-        self.event_bus.subscribe(EventType.ORDER_PLACED, self._handle_order_event)
-        self.event_bus.subscribe(EventType.ORDER_FILLED, self._handle_order_event)
-        self.event_bus.subscribe(EventType.ORDER_CANCELLED, self._handle_order_event)
-        self.event_bus.subscribe(EventType.POSITION_OPENED, self._handle_position_event)
-        self.event_bus.subscribe(EventType.POSITION_CLOSED, self._handle_position_event)
-        self.event_bus.subscribe(EventType.SYSTEM_STARTUP, self._handle_system_event)
-        self.event_bus.subscribe(EventType.SYSTEM_SHUTDOWN, self._handle_system_event)
+        # Subscribe to all events for logging and state updates
+        self.event_bus.subscribe_all(self._handle_event_for_logging, priority=10)
     
     async def start(self):
         """Start state management"""
@@ -218,6 +280,7 @@ class StateManager:
             
             # Save final state
             await self._save_state()
+            self._flush_performance_metrics()
             
             # Close database connection
             if self.db_connection:
@@ -231,7 +294,11 @@ class StateManager:
     
     @profile("state_manager.handle_event_logging")
     async def _handle_event_for_logging(self, event: Event):
-        """Handle event for logging purposes"""
+        """Handle event for logging purposes and dispatch state updates"""
+        handler = self._handlers.get(event.event_type)
+        if handler:
+            handler(event)
+        
         if not self.db_connection:
             return
         
@@ -253,7 +320,7 @@ class StateManager:
         except Exception as e:
             self.logger.error(f"Failed to log event {event.event_id}: {e}")
     
-    async def _handle_order_event(self, event: Event):
+    def _handle_order_event(self, event: Event):
         """Handle order-related events"""
         try:
             order_data = event.data
@@ -262,7 +329,7 @@ class StateManager:
             if not order_id:
                 return
             
-            with self.lock:
+            with self._orders_lock:
                 if event.event_type == EventType.ORDER_PLACED:
                     self.current_state.active_orders[order_id] = order_data
                 elif event.event_type in [EventType.ORDER_FILLED, EventType.ORDER_CANCELLED]:
@@ -271,7 +338,7 @@ class StateManager:
         except Exception as e:
             self.logger.error(f"Error handling order event: {e}")
     
-    async def _handle_position_event(self, event: Event):
+    def _handle_position_event(self, event: Event):
         """Handle position-related events"""
         try:
             position_data = event.data
@@ -280,7 +347,7 @@ class StateManager:
             if not position_id:
                 return
             
-            with self.lock:
+            with self._positions_lock:
                 if event.event_type == EventType.POSITION_OPENED:
                     self.current_state.active_positions[position_id] = position_data
                 elif event.event_type == EventType.POSITION_CLOSED:
@@ -289,10 +356,10 @@ class StateManager:
         except Exception as e:
             self.logger.error(f"Error handling position event: {e}")
     
-    async def _handle_system_event(self, event: Event):
+    def _handle_system_event(self, event: Event):
         """Handle system-related events"""
         try:
-            with self.lock:
+            with self._state_lock:
                 if event.event_type == EventType.SYSTEM_STARTUP:
                     self.current_state.trading_engine_state = "running"
                 elif event.event_type == EventType.SYSTEM_SHUTDOWN:
@@ -301,12 +368,37 @@ class StateManager:
         except Exception as e:
             self.logger.error(f"Error handling system event: {e}")
     
+    async def _sleep_until(self, deadline: float, interval: float, loop_name: str) -> float:
+        """
+        Sleep until a monotonic loop deadline
+        
+        If the loop has fallen more than two intervals behind, the deadline
+        is reset to now instead of firing a burst of catch-up iterations.
+        
+        Returns:
+            Deadline actually waited for
+        """
+        now = asyncio.get_running_loop().time()
+        
+        if now - deadline > 2 * interval:
+            self.logger.warning(
+                f"{loop_name} loop fell {now - deadline:.1f}s behind schedule, resynchronizing"
+            )
+            deadline = now
+        
+        await asyncio.sleep(max(0.0, deadline - now))
+        return deadline
+    
     async def _snapshot_loop(self):
         """Periodic state snapshot loop"""
+        deadline = asyncio.get_running_loop().time()
+        
         while self.running:
             try:
                 await self._create_snapshot()
-                await asyncio.sleep(self.snapshot_interval)
+                deadline = await self._sleep_until(
+                    deadline + self.snapshot_interval, self.snapshot_interval, "Snapshot"
+                )
                 
             except asyncio.CancelledError:
                 break
@@ -316,10 +408,14 @@ class StateManager:
     
     async def _backup_loop(self):
         """Periodic backup loop"""
+        deadline = asyncio.get_running_loop().time()
+        
         while self.running:
             try:
                 await self._create_backup()
-                await asyncio.sleep(self.backup_interval)
+                deadline = await self._sleep_until(
+                    deadline + self.backup_interval, self.backup_interval, "Backup"
+                )
                 
             except asyncio.CancelledError:
                 break
@@ -331,20 +427,22 @@ class StateManager:
     async def _create_snapshot(self):
         """Create state snapshot"""
         try:
-            with self.lock:
+            with self._state_lock:
                 # Update current state with latest data
                 self.current_state.timestamp = time.time()
                 
-                # Get performance metrics if available
-                try:
-                    from .performance_optimizer import performance_optimizer
-                    perf_report = performance_optimizer.get_performance_report()
-                    self.current_state.performance_metrics = perf_report
-                except Exception:
-                    pass
+                # Get performance metrics if available; on failure the
+                # snapshot keeps the last report
+                if self._perf_optimizer is not None:
+                    try:
+                        perf_report = self._perf_optimizer.get_performance_report()
+                        self.current_state.performance_metrics = perf_report
+                        self._buffer_performance_metrics(perf_report)
+                    except Exception as e:
+                        self.logger.debug(f"Performance report unavailable for snapshot: {e}")
                 
                 # Add to history
-                snapshot = SystemState(**asdict(self.current_state))
+                snapshot = SystemState.from_dict(self._current_state_dict())
                 self.state_history.append(snapshot)
                 
                 # Limit history size
@@ -353,23 +451,146 @@ class StateManager:
                 
                 # Store in database
                 if self.db_connection:
-                    self.db_connection.execute(
-                        """INSERT INTO state_snapshots (timestamp, state_data) 
-                           VALUES (?, ?)""",
-                        (snapshot.timestamp, json.dumps(snapshot.to_dict()))
-                    )
-                    self.db_connection.commit()
+                    self._store_snapshot(snapshot)
             
             self.logger.debug("State snapshot created")
             
         except Exception as e:
             self.logger.error(f"Failed to create snapshot: {e}")
     
+    def _buffer_performance_metrics(self, perf_report: Dict[str, Any]):
+        """Queue system metrics from a performance report for batched insert"""
+        system_metrics = perf_report.get('system_metrics')
+        if not system_metrics:
+            return
+        
+        self._perf_buffer.append((
+            perf_report['timestamp'],
+            system_metrics['avg_cpu_usage'],
+            system_metrics['avg_memory_usage'],
+            system_metrics['avg_event_rate'],
+            system_metrics['avg_latency_ms']
+        ))
+        
+        if len(self._perf_buffer) >= self.perf_flush_size:
+            self._flush_performance_metrics()
+    
+    def _flush_performance_metrics(self):
+        """Write buffered performance metrics in a single transaction"""
+        if not self._perf_buffer or not self.db_connection:
+            return
+        
+        try:
+            self.db_connection.executemany(
+                """INSERT INTO performance_metrics 
+                   (timestamp, cpu_usage, memory_usage, event_processing_rate, average_latency) 
+                   VALUES (?, ?, ?, ?, ?)""",
+                self._perf_buffer
+            )
+            self.db_connection.commit()
+            self._perf_buffer.clear()
+            
+        except Exception as e:
+            self.logger.error(f"Failed to flush performance metrics: {e}")
+    
+    def _store_snapshot(self, snapshot: SystemState):
+        """
+        Persist snapshot as a compressed delta against the previous one
+        
+        Only the top-level fields that changed since the last snapshot are
+        written; a full base snapshot is stored every `snapshot_base_interval`
+        snapshots to bound the reconstruction chain.
+        """
+        state_dict = snapshot.to_dict()
+        
+        # System metrics are columnized in performance_metrics
+        state_dict['performance_metrics'] = {
+            key: value for key, value in state_dict['performance_metrics'].items()
+            if key != 'system_metrics'
+        }
+        
+        previous = self._last_snapshot_dict
+        
+        if previous is None or self._snapshots_since_base >= self.snapshot_base_interval:
+            payload, is_delta, base_id = state_dict, 0, None
+        else:
+            payload = {
+                key: value for key, value in state_dict.items()
+                if previous.get(key) != value
+            }
+            is_delta, base_id = 1, self._last_base_id
+        
+        cursor = self.db_connection.execute(
+            """INSERT INTO state_snapshots (timestamp, state_data, is_delta, base_id) 
+               VALUES (?, ?, ?, ?)""",
+            (
+                snapshot.timestamp,
+                zlib.compress(json.dumps(payload).encode('utf-8')),
+                is_delta,
+                base_id
+            )
+        )
+        self.db_connection.commit()
+        
+        if is_delta:
+            self._snapshots_since_base += 1
+        else:
+            self._last_base_id = cursor.lastrowid
+            self._snapshots_since_base = 0
+        self._last_snapshot_dict = state_dict
+    
+    @staticmethod
+    def _decode_snapshot_data(state_data: Any) -> Dict[str, Any]:
+        """Decode stored snapshot payload (compressed or legacy plain JSON)"""
+        if isinstance(state_data, bytes):
+            state_data = zlib.decompress(state_data).decode('utf-8')
+        return json.loads(state_data)
+    
+    def load_snapshot(self, snapshot_id: int) -> Optional[SystemState]:
+        """Load snapshot from database, applying deltas from its base snapshot"""
+        if not self.db_connection:
+            return None
+        
+        try:
+            row = self.db_connection.execute(
+                "SELECT state_data, is_delta, base_id FROM state_snapshots WHERE id = ?",
+                (snapshot_id,)
+            ).fetchone()
+            
+            if row is None:
+                return None
+            
+            state_data, is_delta, base_id = row
+            if not is_delta:
+                return SystemState.from_dict(self._decode_snapshot_data(state_data))
+            
+            cursor = self.db_connection.execute(
+                """SELECT state_data FROM state_snapshots 
+                   WHERE id >= ? AND id <= ?
+                   ORDER BY id""",
+                (base_id, snapshot_id)
+            )
+            
+            state_dict: Dict[str, Any] = {}
+            for (chunk,) in cursor:
+                state_dict.update(self._decode_snapshot_data(chunk))
+            
+            return SystemState.from_dict(state_dict)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to load snapshot {snapshot_id}: {e}")
+            return None
+    
+    def _current_state_dict(self) -> Dict[str, Any]:
+        """Copy current state while holding the order and position locks"""
+        with self._orders_lock, self._positions_lock:
+            return self.current_state.to_dict_copy()
+    
     async def _save_state(self):
         """Save current state to file"""
         try:
-            with self.lock:
-                state_data = self.current_state.to_dict()
+            with self._state_lock:
+                state_data = self._current_state_dict()
                 
                 # Write to temporary file first
                 temp_file = self.state_file.with_suffix('.tmp')
@@ -394,7 +615,7 @@ class StateManager:
             with open(self.state_file, 'r') as f:
                 state_data = json.load(f)
             
-            with self.lock:
+            with self._state_lock:
                 self.current_state = SystemState.from_dict(state_data)
             
             self.logger.info("Previous state loaded successfully")
@@ -411,6 +632,8 @@ class StateManager:
             
             # Backup state file
             if self.state_file.exists():
+                if not backup_file.exists():
+                    self._backup_count += 1
                 with open(self.state_file, 'r') as src:
                     with open(backup_file, 'w') as dst:
                         dst.write(src.read())
@@ -430,41 +653,55 @@ class StateManager:
         except Exception as e:
             self.logger.error(f"Failed to create backup: {e}")
     
+    def _count_state_backups(self) -> int:
+        """Count state backup files in the backup directory"""
+        with os.scandir(self.backup_dir) as entries:
+            return sum(
+                1 for entry in entries
+                if "_backup_" in entry.name and entry.name.endswith(".json")
+            )
+    
     async def _cleanup_old_backups(self):
         """Clean up old backup files"""
         try:
-            cutoff_time = time.time() - (24 * 3600)  # 24 hours ago
-            
-            for backup_file in self.backup_dir.glob("*_backup_*.json"):
-                if backup_file.stat().st_mtime < cutoff_time:
-                    backup_file.unlink()
-            
-            for backup_file in self.backup_dir.glob("*_backup_*.db"):
-                if backup_file.stat().st_mtime < cutoff_time:
-                    backup_file.unlink()
+            # Backup names embed a fixed-width timestamp, so a string compare
+            # against the cutoff replaces a stat() per file
+            cutoff = (datetime.now() - timedelta(hours=24)).strftime("%Y%m%d_%H%M%S")
+            
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    _, separator, suffix = entry.name.partition("_backup_")
+                    if not separator:
+                        continue
+                    
+                    backup_timestamp, extension = os.path.splitext(suffix)
+                    if extension in (".json", ".db") and backup_timestamp < cutoff:
+                        os.unlink(entry.path)
+                        if extension == ".json":
+                            self._backup_count -= 1
             
         except Exception as e:
             self.logger.error(f"Failed to cleanup old backups: {e}")
     
     def get_current_state(self) -> SystemState:
         """Get current system state"""
-        with self.lock:
-            return SystemState(**asdict(self.current_state))
+        with self._state_lock:
+            return SystemState.from_dict(self._current_state_dict())
     
     def get_state_history(self, hours: int = 1) -> List[SystemState]:
         """Get state history for specified hours"""
         cutoff_time = time.time() - (hours * 3600)
         
-        with self.lock:
+        with self._state_lock:
             return [
                 state for state in self.state_history
                 if state.timestamp >= cutoff_time
             ]
     
-    def get_trading_events(self, hours: int = 1, event_type: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get trading events from database"""
+    def get_trading_events(self, hours: int = 1, event_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream trading events from database (wrap in list() to materialize)"""
         if not self.db_connection:
-            return []
+            return
         
         try:
             cutoff_time = time.time() - (hours * 3600)
@@ -486,25 +723,25 @@ class StateManager:
                     (cutoff_time,)
                 )
             
-            events = []
-            for row in cursor.fetchall():
-                events.append({
-                    'event_id': row[0],
-                    'event_type': row[1],
-                    'event_data': json.loads(row[2]),
-                    'timestamp': row[3]
-                })
-            
-            return events
+            while True:
+                rows = cursor.fetchmany(self.fetch_batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield {
+                        'event_id': row[0],
+                        'event_type': row[1],
+                        'event_data': json.loads(row[2]),
+                        'timestamp': row[3]
+                    }
             
         except Exception as e:
             self.logger.error(f"Failed to get trading events: {e}")
-            return []
     
-    def get_performance_history(self, hours: int = 1) -> List[Dict[str, Any]]:
-        """Get performance metrics history"""
+    def get_performance_history(self, hours: int = 1) -> Iterator[Dict[str, Any]]:
+        """Stream performance metrics history (wrap in list() to materialize)"""
         if not self.db_connection:
-            return []
+            return
         
         try:
             cutoff_time = time.time() - (hours * 3600)
@@ -518,21 +755,21 @@ class StateManager:
                 (cutoff_time,)
             )
             
-            metrics = []
-            for row in cursor.fetchall():
-                metrics.append({
-                    'timestamp': row[0],
-                    'cpu_usage': row[1],
-                    'memory_usage': row[2],
-                    'event_processing_rate': row[3],
-                    'average_latency': row[4]
-                })
-            
-            return metrics
+            while True:
+                rows = cursor.fetchmany(self.fetch_batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield {
+                        'timestamp': row[0],
+                        'cpu_usage': row[1],
+                        'memory_usage': row[2],
+                        'event_processing_rate': row[3],
+                        'average_latency': row[4]
+                    }
             
         except Exception as e:
             self.logger.error(f"Failed to get performance history: {e}")
-            return []
     
     async def restore_from_backup(self, backup_timestamp: str) -> bool:
         """Restore state from backup"""
@@ -547,7 +784,7 @@ class StateManager:
             with open(backup_file, 'r') as f:
                 state_data = json.load(f)
             
-            with self.lock:
+            with self._state_lock:
                 self.current_state = SystemState.from_dict(state_data)
             
             # Save as current state
@@ -562,9 +799,9 @@ class StateManager:
     
     def get_system_stats(self) -> Dict[str, Any]:
         """Get system statistics"""
-        with self.lock:
+        with self._state_lock:
             return {
-                'current_state': self.current_state.to_dict(),
+                'current_state': self._current_state_dict(),
                 'history_size': len(self.state_history),
                 'database_connected': self.db_connection is not None,
                 'running': self.running,
@@ -572,7 +809,7 @@ class StateManager:
                 'backup_interval': self.backup_interval,
                 'data_directory': str(self.data_dir),
                 'state_file_exists': self.state_file.exists(),
-                'backup_count': len(list(self.backup_dir.glob("*_backup_*.json")))
+                'backup_count': self._backup_count
             }
     
     async def health_check(self) -> Dict[str, Any]:
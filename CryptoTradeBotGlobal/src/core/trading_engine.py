@@ -5,21 +5,24 @@ Enterprise-grade trading orchestration with institutional risk controls
 
 import asyncio
 import logging
+import sys
 import time
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
+from operator import attrgetter
+from collections import Counter, deque
 from enum import Enum
 import uuid
-from datetime import datetime, timedelta
-import threading
-from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
+import numpy as np
 
 from .event_bus import EventBus, EventType, EventPriority, Event
 from .performance_optimizer import performance_optimizer, profile
 from config.settings import get_settings
 
 
-class TradingState(Enum):
+class TradingState(str, Enum):
     """Trading engine states"""
     STOPPED = "stopped"
     STARTING = "starting"
@@ -29,7 +32,7 @@ class TradingState(Enum):
     ERROR = "error"
 
 
-class OrderType(Enum):
+class OrderType(str, Enum):
     """Order types"""
     MARKET = "market"
     LIMIT = "limit"
@@ -38,7 +41,7 @@ class OrderType(Enum):
     STOP_LIMIT = "stop_limit"
 
 
-class OrderStatus(Enum):
+class OrderStatus(str, Enum):
     """Order status"""
     PENDING = "pending"
     SUBMITTED = "submitted"
@@ -49,16 +52,27 @@ class OrderStatus(Enum):
     EXPIRED = "expired"
 
 
-class PositionSide(Enum):
+class PositionSide(str, Enum):
     """Position side"""
     LONG = "long"
     SHORT = "short"
 
 
-@dataclass
+# Random per-process prefix + counter: unique like uuid4 without the
+# urandom read on every id
+_ID_PREFIX = uuid.uuid4().hex[:16]
+_id_counter = itertools.count()
+
+
+def _next_id() -> str:
+    """Process-unique identifier for signals, orders and positions"""
+    return f"{_ID_PREFIX}-{next(_id_counter):016x}"
+
+
+@dataclass(slots=True)
 class TradingSignal:
     """Trading signal data structure"""
-    signal_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    signal_id: str = field(default_factory=_next_id)
     strategy_name: str = ""
     symbol: str = ""
     side: PositionSide = PositionSide.LONG
@@ -67,23 +81,21 @@ class TradingSignal:
     timestamp: float = field(default_factory=time.time)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    _FIELDS = (
+        'signal_id', 'strategy_name', 'symbol', 'side', 'strength', 'price',
+        'timestamp', 'metadata'
+    )
+    _GETTER = attrgetter(*_FIELDS)
+    
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'signal_id': self.signal_id,
-            'strategy_name': self.strategy_name,
-            'symbol': self.symbol,
-            'side': self.side.value,
-            'strength': self.strength,
-            'price': self.price,
-            'timestamp': self.timestamp,
-            'metadata': self.metadata
-        }
+        # str-valued enums serialize as their values without conversion
+        return dict(zip(self._FIELDS, self._GETTER(self)))
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order data structure"""
-    order_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    order_id: str = field(default_factory=_next_id)
     symbol: str = ""
     side: PositionSide = PositionSide.LONG
     order_type: OrderType = OrderType.MARKET
@@ -98,33 +110,26 @@ class Order:
     filled_quantity: float = 0.0
     average_price: float = 0.0
     fees: float = 0.0
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    stop_loss: Optional[float] = None
+    take_profit: Optional[float] = None
+    metadata: Optional[Dict[str, Any]] = None  # allocated only when used
+    
+    _FIELDS = (
+        'order_id', 'symbol', 'side', 'order_type', 'quantity', 'price', 'stop_price',
+        'status', 'exchange', 'strategy_name', 'created_at', 'updated_at',
+        'filled_quantity', 'average_price', 'fees', 'stop_loss', 'take_profit', 'metadata'
+    )
+    _GETTER = attrgetter(*_FIELDS)
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'order_id': self.order_id,
-            'symbol': self.symbol,
-            'side': self.side.value,
-            'order_type': self.order_type.value,
-            'quantity': self.quantity,
-            'price': self.price,
-            'stop_price': self.stop_price,
-            'status': self.status.value,
-            'exchange': self.exchange,
-            'strategy_name': self.strategy_name,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at,
-            'filled_quantity': self.filled_quantity,
-            'average_price': self.average_price,
-            'fees': self.fees,
-            'metadata': self.metadata
-        }
+        # str-valued enums serialize as their values without conversion
+        return dict(zip(self._FIELDS, self._GETTER(self)))
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Position data structure"""
-    position_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    position_id: str = field(default_factory=_next_id)
     symbol: str = ""
     side: PositionSide = PositionSide.LONG
     quantity: float = 0.0
@@ -138,7 +143,7 @@ class Position:
     updated_at: float = field(default_factory=time.time)
     stop_loss: Optional[float] = None
     take_profit: Optional[float] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None  # allocated only when used
     
     def calculate_pnl(self, current_price: float) -> float:
         """Calculate unrealized PnL"""
@@ -147,24 +152,306 @@ class Position:
         else:
             return (self.entry_price - current_price) * self.quantity
     
+    _FIELDS = (
+        'position_id', 'symbol', 'side', 'quantity', 'entry_price', 'current_price',
+        'unrealized_pnl', 'realized_pnl', 'exchange', 'strategy_name', 'opened_at',
+        'updated_at', 'stop_loss', 'take_profit', 'metadata'
+    )
+    _GETTER = attrgetter(*_FIELDS)
+    
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'position_id': self.position_id,
-            'symbol': self.symbol,
-            'side': self.side.value,
-            'quantity': self.quantity,
-            'entry_price': self.entry_price,
-            'current_price': self.current_price,
-            'unrealized_pnl': self.unrealized_pnl,
-            'realized_pnl': self.realized_pnl,
-            'exchange': self.exchange,
-            'strategy_name': self.strategy_name,
-            'opened_at': self.opened_at,
-            'updated_at': self.updated_at,
-            'stop_loss': self.stop_loss,
-            'take_profit': self.take_profit,
-            'metadata': self.metadata
-        }
+        # str-valued enums serialize as their values without conversion
+        return dict(zip(self._FIELDS, self._GETTER(self)))
+
+
+def _position_size_core(portfolio_value: float, risk_per_trade: float,
+                        price: float, strength: float) -> float:
+    """Risk-based position size for a signal, assuming a 3% stop loss distance"""
+    stop_loss_distance = price * 0.03
+    
+    if stop_loss_distance <= 0:
+        return 0.0
+    
+    quantity = portfolio_value * risk_per_trade / stop_loss_distance * strength
+    return max(0.0, quantity)
+
+
+def _risk_score_core(price: float, quantity: float, strength: float,
+                     portfolio_value: float, drawdown: float, max_drawdown: float) -> float:
+    """
+    Weighted risk score in [0, 1] for a sized signal
+    
+    Factors and weights: concentration 0.3, volatility (fixed 0.3) 0.2,
+    inverse signal strength 0.3, drawdown usage 0.2.
+    """
+    concentration = min(price * quantity / portfolio_value * 2, 1.0)
+    risk_score = (
+        concentration * 0.3
+        + 0.3 * 0.2
+        + (1.0 - strength) * 0.3
+        + drawdown / max_drawdown * 0.2
+    )
+    return min(risk_score, 1.0)
+
+
+def _position_size_batch(portfolio_value: float, risk_per_trade: float,
+                         prices: np.ndarray, strengths: np.ndarray) -> np.ndarray:
+    """Vectorized `_position_size_core` over arrays of signal prices and strengths"""
+    stop_loss_distance = prices * 0.03
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        quantities = portfolio_value * risk_per_trade / stop_loss_distance * strengths
+    
+    return np.where((stop_loss_distance > 0) & (quantities > 0), quantities, 0.0)
+
+
+def _risk_score_batch(prices: np.ndarray, quantities: np.ndarray, strengths: np.ndarray,
+                      portfolio_value: float, drawdown: float, max_drawdown: float) -> np.ndarray:
+    """Vectorized `_risk_score_core` over arrays of sized signals"""
+    concentration = np.minimum(prices * quantities / portfolio_value * 2, 1.0)
+    risk_scores = (
+        concentration * 0.3
+        + 0.3 * 0.2
+        + (1.0 - strengths) * 0.3
+        + drawdown / max_drawdown * 0.2
+    )
+    return np.minimum(risk_scores, 1.0)
+
+
+# Stop-loss / take-profit price multipliers:
+# (long stop, long take profit, short stop, short take profit)
+_DEFAULT_SL_TP = np.array([0.97, 1.06, 1.03, 0.94])  # 3% stop loss, 6% take profit
+
+
+def _build_sl_tp_table(strategy_configs: Optional[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Precompute per-strategy stop-loss/take-profit multipliers from strategies.yaml"""
+    table = {}
+    
+    for name, config in ((strategy_configs or {}).get('strategies') or {}).items():
+        parameters = (config or {}).get('parameters') or {}
+        stop_loss_pct = parameters.get('stop_loss_pct')
+        if stop_loss_pct is None:
+            continue
+        
+        take_profit_pct = parameters.get('take_profit_pct')
+        if take_profit_pct is None:
+            take_profit_pct = stop_loss_pct * parameters.get('take_profit_ratio', 2.0)
+        
+        table[name] = np.array([
+            1.0 - stop_loss_pct, 1.0 + take_profit_pct,
+            1.0 + stop_loss_pct, 1.0 - take_profit_pct
+        ])
+    
+    return table
+
+
+class PositionStore:
+    """
+    Structure-of-arrays store of open positions
+    
+    Prices, quantities and risk levels live in float64 NumPy columns so a
+    price tick marks every position on a symbol to market and evaluates its
+    stop loss / take profit in a single vectorized pass. Rows freed by closed
+    positions are reused; missing stop/take-profit levels are stored as NaN
+    so they never trigger.
+    """
+    
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.entry_price = np.zeros(capacity)
+        self.quantity = np.zeros(capacity)
+        self.side_sign = np.zeros(capacity)
+        self.stop_loss = np.full(capacity, np.nan)
+        self.take_profit = np.full(capacity, np.nan)
+        self.current_price = np.zeros(capacity)
+        self.unrealized_pnl = np.zeros(capacity)
+        
+        # Running sum of the unrealized_pnl column, maintained by deltas
+        self._total_unrealized_pnl = 0.0
+        
+        self.positions: List[Optional[Position]] = [None] * capacity
+        self.symbol_index: Dict[str, List[int]] = {}
+        self._index_arrays: Dict[str, np.ndarray] = {}
+        self._rows: Dict[str, int] = {}
+        self._free_rows: List[int] = list(range(capacity - 1, -1, -1))
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def _grow(self):
+        """Double the column capacity"""
+        old_capacity = self.capacity
+        self.capacity *= 2
+        
+        for name in ('entry_price', 'quantity', 'side_sign', 'current_price', 'unrealized_pnl'):
+            column = np.zeros(self.capacity)
+            column[:old_capacity] = getattr(self, name)
+            setattr(self, name, column)
+        
+        for name in ('stop_loss', 'take_profit'):
+            column = np.full(self.capacity, np.nan)
+            column[:old_capacity] = getattr(self, name)
+            setattr(self, name, column)
+        
+        self.positions.extend([None] * old_capacity)
+        self._free_rows.extend(range(self.capacity - 1, old_capacity - 1, -1))
+    
+    def add(self, position: Position):
+        """Register a position in the store"""
+        if position.position_id in self._rows:
+            return
+        
+        if not self._free_rows:
+            self._grow()
+        row = self._free_rows.pop()
+        
+        self.entry_price[row] = position.entry_price
+        self.quantity[row] = position.quantity
+        self.side_sign[row] = 1.0 if position.side == PositionSide.LONG else -1.0
+        self.stop_loss[row] = position.stop_loss if position.stop_loss else np.nan
+        self.take_profit[row] = position.take_profit if position.take_profit else np.nan
+        self.current_price[row] = position.current_price
+        self.unrealized_pnl[row] = position.unrealized_pnl
+        self._total_unrealized_pnl += position.unrealized_pnl
+        
+        self.positions[row] = position
+        self.symbol_index.setdefault(position.symbol, []).append(row)
+        self._index_arrays.pop(position.symbol, None)
+        self._rows[position.position_id] = row
+    
+    def remove(self, position: Position):
+        """Release the row held by a position"""
+        row = self._rows.pop(position.position_id, None)
+        if row is None:
+            return
+        
+        # Zeroed rows contribute nothing to aggregates
+        self._total_unrealized_pnl -= self.unrealized_pnl[row]
+        self.quantity[row] = 0.0
+        self.unrealized_pnl[row] = 0.0
+        self.stop_loss[row] = np.nan
+        self.take_profit[row] = np.nan
+        
+        self._index_arrays.pop(position.symbol, None)
+        rows = self.symbol_index[position.symbol]
+        rows.remove(row)
+        if not rows:
+            del self.symbol_index[position.symbol]
+        
+        self.positions[row] = None
+        self._free_rows.append(row)
+    
+    def sync(self, position: Position):
+        """Copy a position's mark-to-market fields into its row"""
+        row = self._rows.get(position.position_id)
+        if row is not None:
+            self._total_unrealized_pnl += position.unrealized_pnl - self.unrealized_pnl[row]
+            self.current_price[row] = position.current_price
+            self.unrealized_pnl[row] = position.unrealized_pnl
+    
+    def mark_to_market(self, symbol: str, price: float) -> Tuple[List[Position], List[Position]]:
+        """
+        Mark all positions on a symbol to a new price
+        
+        Returns:
+            Positions whose stop loss and take profit were hit, respectively
+        """
+        rows = self.symbol_index.get(symbol)
+        if not rows:
+            return [], []
+        
+        # Row indices per symbol are cached as int64 arrays until the symbol's
+        # positions change
+        idx = self._index_arrays.get(symbol)
+        if idx is None:
+            idx = self._index_arrays[symbol] = np.array(rows, dtype=np.int64)
+        
+        side = self.side_sign[idx]
+        pnl = side * (price - self.entry_price[idx]) * self.quantity[idx]
+        
+        self._total_unrealized_pnl += float(np.sum(pnl - self.unrealized_pnl[idx]))
+        self.current_price[idx] = price
+        self.unrealized_pnl[idx] = pnl
+        
+        # NaN levels compare False, so positions without them never trigger
+        stop_loss = self.stop_loss[idx]
+        take_profit = self.take_profit[idx]
+        long_side = side > 0
+        stop_hit = np.where(long_side, price <= stop_loss, price >= stop_loss)
+        take_hit = np.where(long_side, price >= take_profit, price <= take_profit)
+        
+        now = time.time()
+        for row, row_pnl in zip(rows, pnl.tolist()):
+            position = self.positions[row]
+            position.current_price = price
+            position.unrealized_pnl = row_pnl
+            position.updated_at = now
+        
+        return (
+            [self.positions[rows[i]] for i in np.flatnonzero(stop_hit)],
+            [self.positions[rows[i]] for i in np.flatnonzero(take_hit)]
+        )
+    
+    def total_unrealized_pnl(self) -> float:
+        """Sum of unrealized PnL across all positions (O(1), kept incrementally)"""
+        return float(self._total_unrealized_pnl)
+    
+    def total_exposure(self) -> float:
+        """Gross notional exposure (free rows have zero quantity)"""
+        return float(np.dot(np.abs(self.quantity), self.current_price))
+
+
+# order_id is always a 33-char _next_id(); symbols are unbounded (e.g.
+# "1000SHIB/USDT:USDT") so they are kept as Python objects, not truncated
+_COMPLETED_ORDER_DTYPE = np.dtype([
+    ('order_id', 'U36'),
+    ('symbol', 'O'),
+    ('side_sign', 'f8'),
+    ('quantity', 'f8'),
+    ('price', 'f8'),
+    ('ts', 'f8'),
+])
+
+
+class CompletedOrderRing:
+    """
+    Fixed-size ring of filled orders as a NumPy structured array
+    
+    Rows are overwritten oldest-first once the ring is full, so memory stays
+    bounded and trade analytics can run vectorized over the columns.
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.rows = np.zeros(capacity, dtype=_COMPLETED_ORDER_DTYPE)
+        self._ring_idx = 0
+    
+    def __len__(self) -> int:
+        return min(self._ring_idx, self.capacity)
+    
+    def append(self, order: Order):
+        """Record a filled order, evicting the oldest row when full"""
+        self.rows[self._ring_idx % self.capacity] = (
+            order.order_id,
+            order.symbol,
+            1.0 if order.side == PositionSide.LONG else -1.0,
+            order.filled_quantity,
+            order.average_price,
+            order.updated_at
+        )
+        self._ring_idx += 1
+    
+    def view(self) -> np.ndarray:
+        """Return the recorded rows in chronological order"""
+        if self._ring_idx <= self.capacity:
+            return self.rows[:self._ring_idx]
+        start = self._ring_idx % self.capacity
+        return np.concatenate((self.rows[start:], self.rows[:start]))
+    
+    def filled_notional(self) -> float:
+        """Total notional traded across the recorded rows"""
+        rows = self.rows[:len(self)]
+        return float(np.dot(rows['quantity'], rows['price']))
 
 
 class RiskManager:
@@ -198,225 +485,295 @@ class RiskManager:
         self.peak_portfolio_value = self.current_portfolio_value
         
         # Position tracking
-        self.active_positions: Dict[str, Position] = {}
+        self.active_positions: Dict[Tuple[str, str], Position] = {}
+        self.position_store = PositionStore()
+        self._base_ccy_counts: Counter = Counter()
         self.daily_trades = 0
         self.risk_alerts: List[Dict[str, Any]] = []
         
-        # Thread safety
-        self.lock = threading.RLock()
+        # Portfolio alerts are re-published at most once per interval
+        self.alert_interval = 0.1  # seconds
+        self._last_alert_check = 0.0
+        
+        # No locks: all state is only touched from the event loop, where code
+        # between awaits already runs atomically
     
     @profile("risk_manager.validate_signal")
     async def validate_signal(self, signal: TradingSignal) -> Dict[str, Any]:
         """Validate trading signal against risk parameters"""
+        block_reason = self._trading_block_reason()
+        if block_reason:
+            return self._rejected_validation(block_reason)
+        
+        suggested_quantity = self._calculate_position_size(signal)
+        risk_score = (
+            self._calculate_risk_score(signal, suggested_quantity)
+            if suggested_quantity > 0 else 0.0
+        )
+        
+        return self._build_validation(signal, suggested_quantity, risk_score)
+    
+    @profile("risk_manager.validate_signals")
+    async def validate_signals(self, signals: List[TradingSignal]) -> List[Dict[str, Any]]:
+        """Validate a batch of signals, sizing and scoring them as NumPy arrays"""
+        block_reason = self._trading_block_reason()
+        if block_reason:
+            return [self._rejected_validation(block_reason) for _ in signals]
+        
+        count = len(signals)
+        prices = np.fromiter((signal.price for signal in signals), dtype=np.float64, count=count)
+        strengths = np.fromiter((signal.strength for signal in signals), dtype=np.float64, count=count)
+        
+        quantities = _position_size_batch(
+            self.current_portfolio_value, self.risk_per_trade, prices, strengths
+        )
+        risk_scores = _risk_score_batch(
+            prices, quantities, strengths,
+            self.current_portfolio_value, self.current_drawdown, self.max_drawdown
+        )
+        
+        return [
+            self._build_validation(signal, quantity, risk_score)
+            for signal, quantity, risk_score
+            in zip(signals, quantities.tolist(), risk_scores.tolist())
+        ]
+    
+    def _trading_block_reason(self) -> Optional[str]:
+        """Reason new signals are blocked outright, if any"""
+        # Check if trading is allowed
+        if self.max_daily_loss_reached:
+            return "Daily loss limit reached"
+        
+        # Check drawdown limit
+        if self.current_drawdown >= self.max_drawdown:
+            return "Maximum drawdown exceeded"
+        
+        return None
+    
+    @staticmethod
+    def _rejected_validation(reason: str) -> Dict[str, Any]:
+        return {
+            'approved': False,
+            'reasons': [reason],
+            'suggested_quantity': 0.0,
+            'risk_score': 0.0
+        }
+    
+    def _build_validation(self, signal: TradingSignal, suggested_quantity: float,
+                          risk_score: float) -> Dict[str, Any]:
+        """Apply position, correlation and risk-score limits to a sized signal"""
         validation_result = {
             'approved': False,
             'reasons': [],
-            'suggested_quantity': 0.0,
+            'suggested_quantity': suggested_quantity,
             'risk_score': 0.0
         }
         
-        with self.lock:
-            # Check if trading is allowed
-            if self.max_daily_loss_reached:
-                validation_result['reasons'].append("Daily loss limit reached")
-                return validation_result
-            
-            # Check drawdown limit
-            if self.current_drawdown >= self.max_drawdown:
-                validation_result['reasons'].append("Maximum drawdown exceeded")
-                return validation_result
-            
-            # Calculate position size
-            suggested_quantity = self._calculate_position_size(signal)
-            validation_result['suggested_quantity'] = suggested_quantity
-            
-            if suggested_quantity <= 0:
-                validation_result['reasons'].append("Position size too small")
-                return validation_result
-            
-            # Check position limits
-            if suggested_quantity > self.max_position_size:
-                validation_result['suggested_quantity'] = self.max_position_size
-                validation_result['reasons'].append("Position size reduced to limit")
-            
-            # Check correlation limits (simplified)
-            correlation_risk = self._check_correlation_risk(signal.symbol)
-            if correlation_risk > 0.7:
-                validation_result['reasons'].append("High correlation risk")
-                validation_result['suggested_quantity'] *= 0.5  # Reduce size
-            
-            # Calculate risk score
-            risk_score = self._calculate_risk_score(signal, suggested_quantity)
-            validation_result['risk_score'] = risk_score
-            
-            # Final approval
-            if risk_score <= 0.8 and suggested_quantity > 0:
-                validation_result['approved'] = True
-            else:
-                validation_result['reasons'].append("Risk score too high")
+        if suggested_quantity <= 0:
+            validation_result['reasons'].append("Position size too small")
+            return validation_result
         
-        return validation_result
-    
-    def _calculate_position_size(self, signal: TradingSignal) -> float:
-        """Calculate appropriate position size based on risk parameters"""
-        # Risk-based position sizing
-        risk_amount = self.current_portfolio_value * self.risk_per_trade
+        # Check position limits
+        if suggested_quantity > self.max_position_size:
+            validation_result['suggested_quantity'] = self.max_position_size
+            validation_result['reasons'].append("Position size reduced to limit")
         
-        # Estimate stop loss distance (simplified)
-        stop_loss_distance = signal.price * 0.03  # 3% stop loss
+        # Check correlation limits (simplified)
+        correlation_risk = self._check_correlation_risk(signal.symbol)
+        if correlation_risk > 0.7:
+            validation_result['reasons'].append("High correlation risk")
+            validation_result['suggested_quantity'] *= 0.5  # Reduce size
         
-        if stop_loss_distance <= 0:
-            return 0.0
-        
-        # Calculate quantity based on risk
-        quantity = risk_amount / stop_loss_distance
+        validation_result['risk_score'] = risk_score
         
-        # Apply signal strength multiplier
-        quantity *= signal.strength
+        # Final approval
+        if risk_score <= 0.8:
+            validation_result['approved'] = True
+        else:
+            validation_result['reasons'].append("Risk score too high")
         
-        return max(0.0, quantity)
+        return validation_result
+    
+    def _calculate_position_size(self, signal: TradingSignal) -> float:
+        """Calculate appropriate position size based on risk parameters"""
+        return _position_size_core(
+            self.current_portfolio_value, self.risk_per_trade, signal.price, signal.strength
+        )
     
     def _check_correlation_risk(self, symbol: str) -> float:
         """Check correlation risk with existing positions"""
-        # Simplified correlation check
+        # Simplified correlation check: share of positions on the same base currency
         # In production, this would use actual correlation matrices
-        similar_positions = 0
         total_positions = len(self.active_positions)
         
-        for position in self.active_positions.values():
-            if position.symbol.split('/')[0] == symbol.split('/')[0]:  # Same base currency
-                similar_positions += 1
-        
         if total_positions == 0:
             return 0.0
         
-        return similar_positions / total_positions
+        return self._base_ccy_counts[symbol.partition('/')[0]] / total_positions
     
     def _calculate_risk_score(self, signal: TradingSignal, quantity: float) -> float:
         """Calculate overall risk score for the signal"""
-        # Multiple risk factors
-        factors = []
-        
-        # Portfolio concentration risk
-        position_value = signal.price * quantity
-        concentration = position_value / self.current_portfolio_value
-        factors.append(min(concentration * 2, 1.0))  # Cap at 1.0
-        
-        # Volatility risk (simplified)
-        volatility_risk = 0.3  # Placeholder
-        factors.append(volatility_risk)
-        
-        # Signal strength (inverse risk)
-        signal_risk = 1.0 - signal.strength
-        factors.append(signal_risk)
+        return _risk_score_core(
+            signal.price, quantity, signal.strength,
+            self.current_portfolio_value, self.current_drawdown, self.max_drawdown
+        )
+    
+    def add_position(self, position_key: Tuple[str, str], position: Position):
+        """Start tracking an open position"""
+        previous = self.active_positions.get(position_key)
+        if previous is not None:
+            self._base_ccy_counts[previous.symbol.partition('/')[0]] -= 1
+            self.position_store.remove(previous)
         
-        # Current drawdown impact
-        drawdown_risk = self.current_drawdown / self.max_drawdown
-        factors.append(drawdown_risk)
+        self.active_positions[position_key] = position
+        self.position_store.add(position)
+        self._base_ccy_counts[position.symbol.partition('/')[0]] += 1
+    
+    def remove_position(self, position_key: Tuple[str, str]) -> Optional[Position]:
+        """Stop tracking a closed position"""
+        position = self.active_positions.pop(position_key, None)
+        if position is not None:
+            self.position_store.remove(position)
+            self._base_ccy_counts[position.symbol.partition('/')[0]] -= 1
+        return position
+    
+    @profile("risk_manager.update_symbol_price")
+    async def update_symbol_price(self, symbol: str, current_price: float):
+        """Mark every position on a symbol to market and fire stop/take-profit events"""
+        stop_hits, take_hits = self.position_store.mark_to_market(symbol, current_price)
         
-        # Weighted average of risk factors
-        weights = [0.3, 0.2, 0.3, 0.2]
-        risk_score = sum(f * w for f, w in zip(factors, weights))
+        for position in stop_hits:
+            await self.event_bus.publish_event(
+                EventType.STOP_LOSS_TRIGGERED,
+                {
+                    'position_id': position.position_id,
+                    'symbol': position.symbol,
+                    'current_price': current_price,
+                    'stop_loss': position.stop_loss
+                },
+                priority=EventPriority.HIGH
+            )
         
-        return min(risk_score, 1.0)
+        for position in take_hits:
+            await self.event_bus.publish_event(
+                EventType.TAKE_PROFIT_TRIGGERED,
+                {
+                    'position_id': position.position_id,
+                    'symbol': position.symbol,
+                    'current_price': current_price,
+                    'take_profit': position.take_profit
+                },
+                priority=EventPriority.HIGH
+            )
     
     @profile("risk_manager.update_position")
     async def update_position(self, position: Position, current_price: float):
         """Update position with current market price"""
-        with self.lock:
-            position.current_price = current_price
-            position.unrealized_pnl = position.calculate_pnl(current_price)
-            position.updated_at = time.time()
-            
-            # Check stop loss
-            if position.stop_loss:
-                if ((position.side == PositionSide.LONG and current_price <= position.stop_loss) or
-                    (position.side == PositionSide.SHORT and current_price >= position.stop_loss)):
-                    
-                    await self.event_bus.publish_event(
-                        EventType.STOP_LOSS_TRIGGERED,
-                        {
-                            'position_id': position.position_id,
-                            'symbol': position.symbol,
-                            'current_price': current_price,
-                            'stop_loss': position.stop_loss
-                        },
-                        priority=EventPriority.HIGH
-                    )
-            
-            # Check take profit
-            if position.take_profit:
-                if ((position.side == PositionSide.LONG and current_price >= position.take_profit) or
-                    (position.side == PositionSide.SHORT and current_price <= position.take_profit)):
-                    
-                    await self.event_bus.publish_event(
-                        EventType.TAKE_PROFIT_TRIGGERED,
-                        {
-                            'position_id': position.position_id,
-                            'symbol': position.symbol,
-                            'current_price': current_price,
-                            'take_profit': position.take_profit
-                        },
-                        priority=EventPriority.HIGH
-                    )
-    
-    async def update_portfolio_metrics(self):
-        """Update portfolio-level risk metrics"""
-        with self.lock:
-            # Calculate total unrealized PnL
-            total_unrealized_pnl = sum(pos.unrealized_pnl for pos in self.active_positions.values())
-            
-            # Update current portfolio value
-            current_value = self.current_portfolio_value + total_unrealized_pnl
-            
-            # Update peak value and drawdown
-            if current_value > self.peak_portfolio_value:
-                self.peak_portfolio_value = current_value
-                self.current_drawdown = 0.0
-            else:
-                self.current_drawdown = (self.peak_portfolio_value - current_value) / self.peak_portfolio_value
-            
-            # Check daily loss limit
-            if abs(self.daily_pnl) >= self.max_portfolio_risk:
-                self.max_daily_loss_reached = True
+        position.current_price = current_price
+        position.unrealized_pnl = position.calculate_pnl(current_price)
+        position.updated_at = time.time()
+        self.position_store.sync(position)
+        
+        # Check stop loss
+        if position.stop_loss:
+            if ((position.side == PositionSide.LONG and current_price <= position.stop_loss) or
+                (position.side == PositionSide.SHORT and current_price >= position.stop_loss)):
+                
                 await self.event_bus.publish_event(
-                    EventType.RISK_LIMIT_EXCEEDED,
+                    EventType.STOP_LOSS_TRIGGERED,
                     {
-                        'type': 'daily_loss_limit',
-                        'current_loss': self.daily_pnl,
-                        'limit': self.max_portfolio_risk
+                        'position_id': position.position_id,
+                        'symbol': position.symbol,
+                        'current_price': current_price,
+                        'stop_loss': position.stop_loss
                     },
-                    priority=EventPriority.CRITICAL
+                    priority=EventPriority.HIGH
                 )
-            
-            # Check drawdown limit
-            if self.current_drawdown >= self.max_drawdown:
+        
+        # Check take profit
+        if position.take_profit:
+            if ((position.side == PositionSide.LONG and current_price >= position.take_profit) or
+                (position.side == PositionSide.SHORT and current_price <= position.take_profit)):
+                
                 await self.event_bus.publish_event(
-                    EventType.DRAWDOWN_ALERT,
+                    EventType.TAKE_PROFIT_TRIGGERED,
                     {
-                        'current_drawdown': self.current_drawdown,
-                        'max_drawdown': self.max_drawdown,
-                        'portfolio_value': current_value
+                        'position_id': position.position_id,
+                        'symbol': position.symbol,
+                        'current_price': current_price,
+                        'take_profit': position.take_profit
                     },
-                    priority=EventPriority.CRITICAL
+                    priority=EventPriority.HIGH
                 )
     
+    async def update_portfolio_metrics(self):
+        """Update portfolio-level risk metrics"""
+        # Calculate total unrealized PnL
+        total_unrealized_pnl = self.position_store.total_unrealized_pnl()
+        
+        # Update current portfolio value
+        current_value = self.current_portfolio_value + total_unrealized_pnl
+        
+        # Update peak value and drawdown
+        if current_value > self.peak_portfolio_value:
+            self.peak_portfolio_value = current_value
+            self.current_drawdown = 0.0
+        else:
+            self.current_drawdown = (self.peak_portfolio_value - current_value) / self.peak_portfolio_value
+        
+        # Risk flags are always evaluated; only the alerts are throttled
+        daily_loss_exceeded = abs(self.daily_pnl) >= self.max_portfolio_risk
+        drawdown_exceeded = self.current_drawdown >= self.max_drawdown
+        if daily_loss_exceeded:
+            self.max_daily_loss_reached = True
+        
+        if not (daily_loss_exceeded or drawdown_exceeded):
+            return
+        
+        now = time.time()
+        if now - self._last_alert_check < self.alert_interval:
+            return
+        self._last_alert_check = now
+        
+        # Check daily loss limit
+        if daily_loss_exceeded:
+            await self.event_bus.publish_event(
+                EventType.RISK_LIMIT_EXCEEDED,
+                {
+                    'type': 'daily_loss_limit',
+                    'current_loss': self.daily_pnl,
+                    'limit': self.max_portfolio_risk
+                },
+                priority=EventPriority.CRITICAL
+            )
+        
+        # Check drawdown limit
+        if drawdown_exceeded:
+            await self.event_bus.publish_event(
+                EventType.DRAWDOWN_ALERT,
+                {
+                    'current_drawdown': self.current_drawdown,
+                    'max_drawdown': self.max_drawdown,
+                    'portfolio_value': current_value
+                },
+                priority=EventPriority.CRITICAL
+            )
+    
     def get_risk_metrics(self) -> Dict[str, Any]:
         """Get current risk metrics"""
-        with self.lock:
-            total_exposure = sum(abs(pos.quantity * pos.current_price) for pos in self.active_positions.values())
-            total_unrealized_pnl = sum(pos.unrealized_pnl for pos in self.active_positions.values())
-            
-            return {
-                'portfolio_value': self.current_portfolio_value + total_unrealized_pnl,
-                'total_exposure': total_exposure,
-                'daily_pnl': self.daily_pnl,
-                'current_drawdown': self.current_drawdown,
-                'max_daily_loss_reached': self.max_daily_loss_reached,
-                'active_positions': len(self.active_positions),
-                'daily_trades': self.daily_trades,
-                'risk_utilization': total_exposure / self.current_portfolio_value if self.current_portfolio_value > 0 else 0
-            }
+        total_exposure = self.position_store.total_exposure()
+        total_unrealized_pnl = self.position_store.total_unrealized_pnl()
+        
+        return {
+            'portfolio_value': self.current_portfolio_value + total_unrealized_pnl,
+            'total_exposure': total_exposure,
+            'daily_pnl': self.daily_pnl,
+            'current_drawdown': self.current_drawdown,
+            'max_daily_loss_reached': self.max_daily_loss_reached,
+            'active_positions': len(self.active_positions),
+            'daily_trades': self.daily_trades,
+            'risk_utilization': total_exposure / self.current_portfolio_value if self.current_portfolio_value > 0 else 0
+        }
 
 
 class TradingEngine:
@@ -444,20 +801,40 @@ class TradingEngine:
         # Components
         self.risk_manager = RiskManager(event_bus)
         
+        # Per-strategy stop-loss/take-profit multipliers
+        self._sl_tp_table = _build_sl_tp_table(self.settings.load_strategy_configs())
+        
         # Data storage
         self.active_orders: Dict[str, Order] = {}
-        self.active_positions: Dict[str, Position] = {}
-        self.completed_orders: List[Order] = []
+        self.active_positions: Dict[Tuple[str, str], Position] = {}
+        self._positions_by_symbol: Dict[str, List[Position]] = {}
         self.closed_positions: List[Position] = []
         
+        # Filled orders are kept in bounded rings to avoid unbounded growth
+        completed_orders_cap = self.settings.trading.completed_orders_cap
+        self.completed_orders: deque = deque(maxlen=completed_orders_cap)
+        self.completed_order_ring = CompletedOrderRing(completed_orders_cap)
+        
         # Performance tracking
         self.signals_processed = 0
         self.orders_placed = 0
         self.successful_trades = 0
         self.failed_trades = 0
         
-        # Thread safety
-        self.lock = threading.RLock()
+        # Signal micro-batching
+        self.signal_batch_window = 0.005  # seconds
+        self._pending_signals: List[TradingSignal] = []
+        self._signal_drain_scheduled = False
+        self._last_signal_batch_size = 0
+        self._signal_drain_handle: Optional[asyncio.TimerHandle] = None
+        self._signal_drain_task: Optional[asyncio.Task] = None
+        
+        # Paper-trading fills: (due_time, sequence, order) min-heap drained
+        # by a single scheduler task
+        self.paper_fill_latency = 0.1  # seconds, simulated network delay
+        self._pending_fills: List[Tuple[float, int, Order]] = []
+        self._fill_sequence = itertools.count()
+        self._fill_scheduler_task: Optional[asyncio.Task] = None
         
         # Subscribe to events
         self._setup_event_handlers()
@@ -516,6 +893,9 @@ class TradingEngine:
         self.state = TradingState.STOPPING
         
         try:
+            # No queued signal may become an order once shutdown begins
+            await self._stop_signal_drain()
+            
             # Cancel all pending orders
             await self._cancel_all_pending_orders()
             
@@ -523,6 +903,9 @@ class TradingEngine:
             if self.settings.trading.mode.value != "live":  # Don't auto-close in live mode
                 await self._close_all_positions()
             
+            # Let closing paper orders fill before shutting down
+            await self._flush_paper_fills()
+            
             # Stop performance monitoring
             await performance_optimizer.stop_monitoring()
             
@@ -550,9 +933,10 @@ class TradingEngine:
         """Handle trading signal"""
         try:
             signal_data = event.data
+            # Intern keys at ingress so later dict lookups compare by identity
             signal = TradingSignal(
-                strategy_name=signal_data.get('strategy_name', ''),
-                symbol=signal_data.get('symbol', ''),
+                strategy_name=sys.intern(signal_data.get('strategy_name', '')),
+                symbol=sys.intern(signal_data.get('symbol', '')),
                 side=PositionSide(signal_data.get('side', 'long')),
                 strength=signal_data.get('strength', 0.0),
                 price=signal_data.get('price', 0.0),
@@ -561,18 +945,82 @@ class TradingEngine:
             
             self.signals_processed += 1
             
-            # Validate signal with risk manager
-            validation = await self.risk_manager.validate_signal(signal)
+            # Queue for batched validation with risk manager
+            self._pending_signals.append(signal)
+            
+            if not self._signal_drain_scheduled:
+                self._schedule_signal_drain()
+                
+        except Exception as e:
+            self.logger.error(f"Error handling signal: {e}")
+    
+    async def _stop_signal_drain(self):
+        """Cancel a scheduled drain, wait for a running one and drop queued signals"""
+        if self._signal_drain_handle is not None:
+            self._signal_drain_handle.cancel()
+            self._signal_drain_handle = None
+        
+        task, self._signal_drain_task = self._signal_drain_task, None
+        if task is not None and not task.done():
+            await task
+        
+        if self._pending_signals:
+            self.logger.info(f"Discarding {len(self._pending_signals)} pending signals on shutdown")
+        self._pending_signals = []
+        self._signal_drain_scheduled = False
+    
+    def _schedule_signal_drain(self):
+        """Schedule the next drain; at most one drain is scheduled or running at a time"""
+        self._signal_drain_scheduled = True
+        # Flush right away when quiet; after a burst, wait for the
+        # window so the next batch can grow
+        delay = self.signal_batch_window if self._last_signal_batch_size > 1 else 0.0
+        self._signal_drain_handle = asyncio.get_running_loop().call_later(
+            delay, self._start_signal_drain
+        )
+    
+    def _start_signal_drain(self):
+        """Start draining pending signals (loop callback)"""
+        self._signal_drain_handle = None
+        self._signal_drain_task = asyncio.ensure_future(self._drain_signals())
+    
+    async def _drain_signals(self):
+        """Validate all pending signals as one batch and place approved orders"""
+        # The scheduled flag stays set until this batch finishes, so signals
+        # arriving meanwhile wait for the next drain instead of starting a
+        # concurrent one against the same pre-batch exposure
+        signals, self._pending_signals = self._pending_signals, []
+        self._last_signal_batch_size = len(signals)
+        
+        try:
+            if self.state != TradingState.RUNNING:
+                if signals:
+                    self.logger.info(f"Discarding {len(signals)} pending signals: engine is {self.state.value}")
+                return
+            
+            validations = await self.risk_manager.validate_signals(signals)
             
-            if validation['approved']:
+            for signal, validation in zip(signals, validations):
+                if not validation['approved']:
+                    self.logger.info(f"Signal rejected: {validation['reasons']}")
+                    continue
+                
+                # Shutdown may begin while this batch is awaiting
+                if self.state != TradingState.RUNNING:
+                    self.logger.info(f"Engine is {self.state.value}; skipping remaining approved signals")
+                    break
+                
                 # Create and place order
                 order = await self._create_order_from_signal(signal, validation['suggested_quantity'])
                 await self._place_order(order)
-            else:
-                self.logger.info(f"Signal rejected: {validation['reasons']}")
-                
+                    
         except Exception as e:
-            self.logger.error(f"Error handling signal: {e}")
+            self.logger.error(f"Error handling signal batch: {e}")
+        
+        finally:
+            self._signal_drain_scheduled = False
+            if self._pending_signals and self.state == TradingState.RUNNING:
+                self._schedule_signal_drain()
     
     async def _create_order_from_signal(self, signal: TradingSignal, quantity: float) -> Order:
         """Create order from validated signal"""
@@ -584,16 +1032,14 @@ class TradingEngine:
             price=signal.price,
             exchange=self.settings.exchange.primary_exchange,
             strategy_name=signal.strategy_name,
-            metadata=signal.metadata
+            metadata=signal.metadata or None
         )
         
         # Add stop loss and take profit based on strategy
-        if signal.side == PositionSide.LONG:
-            order.metadata['stop_loss'] = signal.price * 0.97  # 3% stop loss
-            order.metadata['take_profit'] = signal.price * 1.06  # 6% take profit
-        else:
-            order.metadata['stop_loss'] = signal.price * 1.03
-            order.metadata['take_profit'] = signal.price * 0.94
+        multipliers = self._sl_tp_table.get(signal.strategy_name, _DEFAULT_SL_TP)
+        offset = int(signal.side == PositionSide.SHORT) * 2
+        order.stop_loss = float(signal.price * multipliers[offset])
+        order.take_profit = float(signal.price * multipliers[offset + 1])
         
         return order
     
@@ -601,9 +1047,8 @@ class TradingEngine:
     async def _place_order(self, order: Order):
         """Place order on exchange"""
         try:
-            with self.lock:
-                self.active_orders[order.order_id] = order
-                self.orders_placed += 1
+            self.active_orders[order.order_id] = order
+            self.orders_placed += 1
             
             # In production, this would integrate with exchange adapters
             # For now, simulate order placement
@@ -620,13 +1065,47 @@ class TradingEngine:
             
             # Simulate order fill (in production, this comes from exchange)
             if self.settings.trading.mode.value == "paper":
-                await asyncio.sleep(0.1)  # Simulate network delay
-                await self._simulate_order_fill(order)
+                self._schedule_paper_fill(order)
                 
         except Exception as e:
             order.status = OrderStatus.REJECTED
             self.logger.error(f"Failed to place order {order.order_id}: {e}")
     
+    def _schedule_paper_fill(self, order: Order):
+        """Queue a paper order to fill after the simulated network delay"""
+        due = time.monotonic() + self.paper_fill_latency
+        heapq.heappush(self._pending_fills, (due, next(self._fill_sequence), order))
+        
+        if self._fill_scheduler_task is None or self._fill_scheduler_task.done():
+            self._fill_scheduler_task = asyncio.ensure_future(self._run_fill_scheduler())
+    
+    async def _run_fill_scheduler(self):
+        """Sleep until the earliest due fill, then fill everything that is due"""
+        pending = self._pending_fills
+        while pending:
+            delay = pending[0][0] - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
+            now = time.monotonic()
+            due: List[Order] = []
+            while pending and pending[0][0] <= now:
+                due.append(heapq.heappop(pending)[2])
+            
+            for order in due:
+                if order.status != OrderStatus.SUBMITTED:
+                    continue  # cancelled while in flight
+                try:
+                    await self._simulate_order_fill(order)
+                except Exception as e:
+                    self.logger.error(f"Error filling paper order {order.order_id}: {e}")
+    
+    async def _flush_paper_fills(self):
+        """Wait for the paper fill scheduler to drain all queued fills"""
+        task, self._fill_scheduler_task = self._fill_scheduler_task, None
+        if task is not None:
+            await task
+    
     async def _simulate_order_fill(self, order: Order):
         """Simulate order fill for paper trading"""
         order.status = OrderStatus.FILLED
@@ -656,10 +1135,10 @@ class TradingEngine:
             await self._update_position_from_order(order)
             
             # Move to completed orders
-            with self.lock:
-                del self.active_orders[order_id]
-                self.completed_orders.append(order)
-                self.successful_trades += 1
+            del self.active_orders[order_id]
+            self.completed_orders.append(order)
+            self.completed_order_ring.append(order)
+            self.successful_trades += 1
             
             self.logger.info(f"Order filled: {order_id}")
             
@@ -668,36 +1147,38 @@ class TradingEngine:
     
     async def _update_position_from_order(self, order: Order):
         """Update position from filled order"""
-        position_key = f"{order.symbol}_{order.strategy_name}"
-        
-        with self.lock:
-            if position_key in self.active_positions:
-                # Update existing position
-                position = self.active_positions[position_key]
-                # Position update logic would go here
-            else:
-                # Create new position
-                position = Position(
-                    symbol=order.symbol,
-                    side=order.side,
-                    quantity=order.filled_quantity,
-                    entry_price=order.average_price,
-                    current_price=order.average_price,
-                    exchange=order.exchange,
-                    strategy_name=order.strategy_name,
-                    stop_loss=order.metadata.get('stop_loss'),
-                    take_profit=order.metadata.get('take_profit')
-                )
-                
-                self.active_positions[position_key] = position
-                self.risk_manager.active_positions[position_key] = position
-                
-                # Publish position opened event
-                await self.event_bus.publish_event(
-                    EventType.POSITION_OPENED,
-                    position.to_dict(),
-                    priority=EventPriority.NORMAL
-                )
+        symbol = sys.intern(order.symbol)
+        strategy_name = sys.intern(order.strategy_name)
+        position_key = (symbol, strategy_name)
+        
+        if position_key in self.active_positions:
+            # Update existing position
+            position = self.active_positions[position_key]
+            # Position update logic would go here
+        else:
+            # Create new position
+            position = Position(
+                symbol=symbol,
+                side=order.side,
+                quantity=order.filled_quantity,
+                entry_price=order.average_price,
+                current_price=order.average_price,
+                exchange=order.exchange,
+                strategy_name=strategy_name,
+                stop_loss=order.stop_loss,
+                take_profit=order.take_profit
+            )
+            
+            self.active_positions[position_key] = position
+            self._positions_by_symbol.setdefault(position.symbol, []).append(position)
+            self.risk_manager.add_position(position_key, position)
+            
+            # Publish position opened event
+            await self.event_bus.publish_event(
+                EventType.POSITION_OPENED,
+                position.to_dict(),
+                priority=EventPriority.NORMAL
+            )
     
     async def _handle_price_update(self, event: Event):
         """Handle price update event"""
@@ -708,11 +1189,14 @@ class TradingEngine:
             
             if not symbol or not price:
                 return
+            symbol = sys.intern(symbol)
+            
+            # Ticks for symbols without open positions change nothing
+            if symbol not in self._positions_by_symbol:
+                return
             
-            # Update positions with new price
-            for position in self.active_positions.values():
-                if position.symbol == symbol:
-                    await self.risk_manager.update_position(position, price)
+            # Mark positions on this symbol to market in one vectorized pass
+            await self.risk_manager.update_symbol_price(symbol, price)
             
             # Update portfolio metrics
             await self.risk_manager.update_portfolio_metrics()
@@ -783,31 +1267,34 @@ class TradingEngine:
     
     def get_trading_stats(self) -> Dict[str, Any]:
         """Get trading statistics"""
-        with self.lock:
-            uptime = time.time() - (self.start_time or time.time())
-            
-            return {
-                'state': self.state.value,
-                'uptime_seconds': uptime,
-                'signals_processed': self.signals_processed,
-                'orders_placed': self.orders_placed,
-                'successful_trades': self.successful_trades,
-                'failed_trades': self.failed_trades,
-                'active_orders': len(self.active_orders),
-                'active_positions': len(self.active_positions),
-                'success_rate': self.successful_trades / max(1, self.successful_trades + self.failed_trades),
-                'risk_metrics': self.risk_manager.get_risk_metrics()
-            }
+        uptime = time.time() - self.start_time if self.start_time else 0.0
+        
+        return {
+            'state': self.state.value,
+            'uptime_seconds': uptime,
+            'signals_processed': self.signals_processed,
+            'orders_placed': self.orders_placed,
+            'successful_trades': self.successful_trades,
+            'failed_trades': self.failed_trades,
+            'active_orders': len(self.active_orders),
+            'active_positions': len(self.active_positions),
+            'completed_orders': len(self.completed_orders),
+            'filled_notional': self.completed_order_ring.filled_notional(),
+            'success_rate': self.successful_trades / max(1, self.successful_trades + self.failed_trades),
+            'risk_metrics': self.risk_manager.get_risk_metrics()
+        }
     
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check"""
+        trading_stats = self.get_trading_stats()
+        
         return {
             'status': 'healthy' if self.state == TradingState.RUNNING else self.state.value,
-            'uptime': time.time() - (self.start_time or time.time()),
+            'uptime': trading_stats['uptime_seconds'],
             'components': {
                 'risk_manager': 'healthy',
                 'event_bus': 'healthy',
                 'performance_optimizer': 'healthy'
             },
-            'trading_stats': self.get_trading_stats()
+            'trading_stats': trading_stats
         }
@@ -4,16 +4,21 @@ Sistema de Trading de Criptomoedas - Português Brasileiro
 """
 
 import asyncio
+import heapq
+import time
 from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
 from dataclasses import dataclass
+from operator import itemgetter
+
+import numpy as np
 
 from ..base_strategy import BaseStrategy
 from ...core.exceptions import StrategyExecutionError, InsufficientFundsError
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArbitrageOpportunity:
     """Representa uma oportunidade de arbitragem"""
     symbol: str
@@ -23,7 +28,90 @@ class ArbitrageOpportunity:
     sell_price: float
     profit_percentage: float
     volume_available: float
-    timestamp: datetime
+    timestamp: float  # time.monotonic() da passada de análise
+
+
+@dataclass(slots=True, frozen=True)
+class Ticker:
+    """Cotação normalizada de um símbolo em uma exchange"""
+    bid: float
+    ask: float
+    last: float
+    volume: float
+    timestamp: float  # time.monotonic() em que a cotação entrou no cache
+    
+    @classmethod
+    def from_adapter(cls, ticker: Dict[str, Any], timestamp: float) -> 'Ticker':
+        """Converte o dicionário retornado por `get_ticker` do adaptador"""
+        return cls(
+            bid=ticker['bid_price'],
+            ask=ticker['ask_price'],
+            last=ticker['last_price'],
+            volume=ticker['volume_24h'],
+            timestamp=timestamp
+        )
+
+
+def _exchange_pairs(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Índices de todos os pares ordenados (compra i, venda j) com i != j
+    
+    Args:
+        n: Número de exchanges
+        
+    Returns:
+        Arrays planos com os índices de compra e de venda de cada par
+    """
+    buy_idx, sell_idx = np.nonzero(~np.eye(n, dtype=bool))
+    return buy_idx, sell_idx
+
+
+def _arbitrage_matrix(asks: np.ndarray, bids: np.ndarray, vols: np.ndarray, ts: np.ndarray,
+                      pair_buy: np.ndarray, pair_sell: np.ndarray,
+                      now: float, stale_threshold: float, min_profit: float,
+                      max_position: float, min_volume: float) -> Tuple[np.ndarray, ...]:
+    """
+    Avalia todos os pares (compra, venda) de vários símbolos de uma vez
+    
+    Args:
+        asks, bids, vols, ts: Arrays (símbolos x exchanges) de ask, bid,
+            volume 24h e instante monotônico da cotação
+        pair_buy, pair_sell: Pares de exchanges pré-calculados (`_exchange_pairs`)
+        now: Instante monotônico da análise
+        stale_threshold: Idade máxima de uma cotação, em segundos
+        min_profit: Lucro percentual mínimo
+        max_position: Volume máximo por operação
+        min_volume: Volume mínimo por operação
+        
+    Returns:
+        Índices (símbolo, exchange de compra, exchange de venda) das
+        oportunidades aprovadas, seguidos de seus lucros e volumes
+    """
+    # Apenas cotações recentes e válidas participam
+    fresh = (now - ts <= stale_threshold) & (asks > 0)
+    
+    # Lucro por [símbolo, par]: comprar no ask de i e vender no bid de j;
+    # os pares cobrem as duas direções e já excluem i == j.
+    # As operações reutilizam os buffers (out=) para não criar temporários.
+    buy = asks[:, pair_buy]
+    spread = bids[:, pair_sell]
+    np.subtract(spread, buy, out=spread)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        profit = np.divide(spread, buy)
+    np.multiply(profit, 100, out=profit)
+    
+    # Volume disponível: 1% do menor volume diário do par
+    volume = np.minimum(vols[:, pair_buy], vols[:, pair_sell])
+    np.multiply(volume, 0.01, out=volume)
+    np.minimum(volume, max_position, out=volume)
+    
+    mask = fresh[:, pair_buy] & fresh[:, pair_sell]
+    mask &= spread > 0
+    mask &= profit >= min_profit
+    mask &= volume >= min_volume
+    
+    s, k = np.nonzero(mask)
+    return s, pair_buy[k], pair_sell[k], profit[s, k], volume[s, k]
 
 
 class InterExchangeArb(BaseStrategy):
@@ -31,11 +119,11 @@ class InterExchangeArb(BaseStrategy):
     def _analisar_especifica(self, *args, **kwargs):
         pass
 
-    def _finalizar_especifica(self, *args, **kwargs):
-        pass
+    async def _finalizar_especifica(self, *args, **kwargs):
+        await self._stop_ws_feeds()
 
-    def _inicializar_especifica(self, *args, **kwargs):
-        pass
+    async def _inicializar_especifica(self, *args, **kwargs):
+        await self._start_ws_feeds()
 
     def _validar_configuracao_especifica(self, *args, **kwargs):
         return True
@@ -62,19 +150,110 @@ class InterExchangeArb(BaseStrategy):
         self.min_volume_threshold = config.get('min_volume_threshold', 100.0)
         self.execution_timeout = config.get('execution_timeout', 30)  # segundos
         self.price_update_interval = config.get('price_update_interval', 5)  # segundos
+        self.max_opportunities = config.get('max_opportunities', 5)
+        self._stale_threshold = float(config.get('stale_threshold_s', 60))  # segundos
         
         # Símbolos para monitorar
         self.symbols = config.get('symbols', ['BTC/USDT', 'ETH/USDT', 'BNB/USDT'])
         
         # Cache de preços
-        self.price_cache: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self.price_cache: Dict[str, Dict[str, Ticker]] = {}
+        self._price_cache_size = 0  # total de pares (exchange, símbolo) no cache
         self.last_update: Dict[str, datetime] = {}
         
+        # Relógios lidos uma única vez por passada de análise
+        self._now: float = 0.0
+        self._update_time: datetime = datetime.now()
+        
+        # Livro de preços vetorizado: um array por símbolo, indexado pela
+        # posição da exchange em self._exchange_names
+        self._exchange_names: Tuple[str, ...] = ()
+        self._exchange_index: Dict[str, int] = {}
+        self._symbol_index: Dict[str, int] = {}
+        self._ask_arr: Dict[str, np.ndarray] = {}
+        self._bid_arr: Dict[str, np.ndarray] = {}
+        self._vol_arr: Dict[str, np.ndarray] = {}
+        self._ts_arr: Dict[str, np.ndarray] = {}
+        self._rebuild_exchange_index()
+        
+        # Limite de requisições simultâneas por exchange
+        self.per_exchange_concurrency = config.get('per_exchange_concurrency', 4)
+        self._sem: Dict[str, asyncio.Semaphore] = {
+            name: asyncio.Semaphore(self.per_exchange_concurrency) for name in self._exchange_names
+        }
+        
+        # Feeds de ticker por streaming (quando o adaptador oferece)
+        self._ws_tasks: Dict[str, asyncio.Task] = {}
+        self._ws_healthy: Dict[str, bool] = {name: False for name in self._exchange_names}
+        
         # Oportunidades ativas
         self.active_opportunities: List[ArbitrageOpportunity] = []
         
         self.logger = logging.getLogger(__name__)
     
+    def register_exchange(self, exchange_name: str, exchange: Any):
+        """
+        Adiciona (ou substitui) uma exchange monitorada
+        
+        Args:
+            exchange_name: Nome da exchange
+            exchange: Instância do adaptador da exchange
+        """
+        self.exchanges[exchange_name] = exchange
+        self._sem.setdefault(exchange_name, asyncio.Semaphore(self.per_exchange_concurrency))
+        self._ws_healthy[exchange_name] = False
+        self._rebuild_exchange_index()
+    
+    def unregister_exchange(self, exchange_name: str):
+        """
+        Remove uma exchange monitorada e descarta seus preços
+        
+        Args:
+            exchange_name: Nome da exchange
+        """
+        if self.exchanges.pop(exchange_name, None) is None:
+            return
+        
+        task = self._ws_tasks.pop(exchange_name, None)
+        if task is not None:
+            task.cancel()
+        self._sem.pop(exchange_name, None)
+        self._ws_healthy.pop(exchange_name, None)
+        removed = self.price_cache.pop(exchange_name, None)
+        if removed:
+            self._price_cache_size -= len(removed)
+        self._rebuild_exchange_index()
+    
+    def _rebuild_exchange_index(self):
+        """Recalcula a ordem das exchanges e realoca os arrays de preços"""
+        self._exchange_names = tuple(self.exchanges.keys())
+        self._exchange_index = {name: i for i, name in enumerate(self._exchange_names)}
+        self._pair_buy, self._pair_sell = _exchange_pairs(len(self._exchange_names))
+        
+        # O layout das colunas mudou: os arrays são reconstruídos e
+        # repreenchidos na próxima atualização de preços
+        self._ask_arr.clear()
+        self._bid_arr.clear()
+        self._vol_arr.clear()
+        self._ts_arr.clear()
+        for symbol in self.symbols:
+            self._init_symbol_arrays(symbol)
+    
+    def _init_symbol_arrays(self, symbol: str):
+        """
+        Aloca os arrays de ask/bid/volume/timestamp de um símbolo
+        
+        Args:
+            symbol: Símbolo a registrar
+        """
+        self._symbol_index.setdefault(symbol, len(self._symbol_index))
+        
+        n = len(self._exchange_names)
+        self._ask_arr[symbol] = np.full(n, np.nan)
+        self._bid_arr[symbol] = np.full(n, np.nan)
+        self._vol_arr[symbol] = np.zeros(n)
+        self._ts_arr[symbol] = np.full(n, -np.inf)
+    
     async def analyze(self) -> List[ArbitrageOpportunity]:
         """
         Analisa oportunidades de arbitragem entre exchanges
@@ -83,20 +262,18 @@ class InterExchangeArb(BaseStrategy):
             Lista de oportunidades de arbitragem encontradas
         """
         try:
-            opportunities = []
+            self._now = time.monotonic()
             
             # Atualiza preços de todas as exchanges
             await self._update_prices()
             
-            # Analisa cada símbolo
-            for symbol in self.symbols:
-                symbol_opportunities = await self._analyze_symbol(symbol)
-                opportunities.extend(symbol_opportunities)
+            # Analisa todos os símbolos em uma única passada vetorizada
+            opportunities = self._analyze_symbols(self.symbols)
             
             # Filtra e ordena oportunidades
             filtered_opportunities = self._filter_opportunities(opportunities)
             
-            self.logger.info(f"Encontradas {len(filtered_opportunities)} oportunidades de arbitragem")
+            self.logger.info("Encontradas %d oportunidades de arbitragem", len(filtered_opportunities))
             return filtered_opportunities
             
         except Exception as e:
@@ -105,15 +282,44 @@ class InterExchangeArb(BaseStrategy):
     
     async def _update_prices(self):
         """Atualiza preços de todos os símbolos em todas as exchanges"""
-        tasks = []
+        self._update_time = datetime.now()
         
-        for exchange_name, exchange in self.exchanges.items():
-            for symbol in self.symbols:
-                task = self._get_exchange_price(exchange_name, exchange, symbol)
-                tasks.append(task)
+        # Uma tarefa por exchange: uma exchange lenta não atrasa as demais
+        await asyncio.gather(
+            *(self._update_exchange_prices(name, exchange) for name, exchange in self.exchanges.items()),
+            return_exceptions=True
+        )
+    
+    async def _update_exchange_prices(self, exchange_name: str, exchange: Any):
+        """
+        Atualiza os preços de todos os símbolos em uma exchange
         
-        # Executa todas as requisições em paralelo
-        await asyncio.gather(*tasks, return_exceptions=True)
+        Usa `fetch_tickers` (uma requisição para todos os símbolos) quando o
+        adaptador oferece; caso contrário consulta cada símbolo em paralelo,
+        limitado pelo semáforo da exchange.
+        
+        Args:
+            exchange_name: Nome da exchange
+            exchange: Instância do adaptador da exchange
+        """
+        # Com o stream ativo o cache já está atualizado
+        if self._ws_healthy.get(exchange_name):
+            return
+        
+        if callable(getattr(type(exchange), 'fetch_tickers', None)):
+            try:
+                async with self._sem[exchange_name]:
+                    tickers = await exchange.fetch_tickers(self.symbols)
+                for symbol, ticker in tickers.items():
+                    self._store_ticker(exchange_name, symbol, ticker)
+            except Exception as e:
+                self.logger.warning("Erro ao obter preços da %s: %s", exchange_name, e)
+            return
+        
+        await asyncio.gather(
+            *(self._get_exchange_price(exchange_name, exchange, symbol) for symbol in self.symbols),
+            return_exceptions=True
+        )
     
     async def _get_exchange_price(self, exchange_name: str, exchange: Any, symbol: str):
         """
@@ -125,23 +331,102 @@ class InterExchangeArb(BaseStrategy):
             symbol: Símbolo para consultar
         """
         try:
-            ticker = await exchange.get_ticker(symbol)
+            async with self._sem[exchange_name]:
+                ticker = await exchange.get_ticker(symbol)
             
-            if exchange_name not in self.price_cache:
-                self.price_cache[exchange_name] = {}
-            
-            self.price_cache[exchange_name][symbol] = {
-                'bid': ticker['bid_price'],
-                'ask': ticker['ask_price'],
-                'last': ticker['last_price'],
-                'volume': ticker['volume_24h'],
-                'timestamp': datetime.now()
-            }
-            
-            self.last_update[f"{exchange_name}_{symbol}"] = datetime.now()
+            self._store_ticker(exchange_name, symbol, ticker)
             
         except Exception as e:
-            self.logger.warning(f"Erro ao obter preço {symbol} da {exchange_name}: {str(e)}")
+            self.logger.warning("Erro ao obter preço %s da %s: %s", symbol, exchange_name, e)
+    
+    def _store_ticker(self, exchange_name: str, symbol: str, ticker: Dict[str, Any],
+                      timestamp: Optional[float] = None, updated_at: Optional[datetime] = None):
+        """
+        Grava um ticker no cache de preços e nos arrays do símbolo
+        
+        Args:
+            exchange_name: Nome da exchange
+            symbol: Símbolo do ticker
+            ticker: Dados do ticker retornados pelo adaptador
+            timestamp: Instante monotônico da cotação (padrão: passada atual)
+            updated_at: Horário de parede da cotação (padrão: passada atual)
+        """
+        if timestamp is None:
+            timestamp = self._now
+        if updated_at is None:
+            updated_at = self._update_time
+        
+        quote = Ticker.from_adapter(ticker, timestamp)
+        
+        cache = self.price_cache.get(exchange_name)
+        if cache is None:
+            cache = self.price_cache[exchange_name] = {}
+        if symbol not in cache:
+            self._price_cache_size += 1
+        
+        cache[symbol] = quote
+        
+        self.last_update[f"{exchange_name}_{symbol}"] = updated_at
+        
+        idx = self._exchange_index.get(exchange_name)
+        if idx is not None:
+            if symbol not in self._ask_arr:
+                self._init_symbol_arrays(symbol)
+            self._ask_arr[symbol][idx] = quote.ask
+            self._bid_arr[symbol][idx] = quote.bid
+            self._vol_arr[symbol][idx] = quote.volume
+            self._ts_arr[symbol][idx] = timestamp
+    
+    async def _start_ws_feeds(self):
+        """Inicia um stream de tickers por exchange cujo adaptador oferece `watch_tickers`"""
+        for exchange_name, exchange in self.exchanges.items():
+            if exchange_name in self._ws_tasks:
+                continue
+            if callable(getattr(type(exchange), 'watch_tickers', None)):
+                self._ws_tasks[exchange_name] = asyncio.create_task(
+                    self._ws_feed_loop(exchange_name, exchange)
+                )
+    
+    async def _stop_ws_feeds(self):
+        """Cancela os streams de tickers e aguarda seu encerramento"""
+        tasks = list(self._ws_tasks.values())
+        self._ws_tasks.clear()
+        
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _ws_feed_loop(self, exchange_name: str, exchange: Any):
+        """
+        Consome o stream de tickers de uma exchange e alimenta o cache
+        
+        Enquanto o stream está saudável, `_update_prices` não consulta a
+        exchange via REST; em caso de falha volta ao polling até reconectar.
+        
+        Args:
+            exchange_name: Nome da exchange
+            exchange: Instância do adaptador da exchange
+        """
+        try:
+            while True:
+                try:
+                    tickers = await exchange.watch_tickers(self.symbols)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self._ws_healthy[exchange_name] = False
+                    self.logger.warning("Stream de tickers da %s falhou: %s", exchange_name, e)
+                    await asyncio.sleep(self.price_update_interval)
+                    continue
+                
+                timestamp = time.monotonic()
+                updated_at = datetime.now()
+                for symbol, ticker in tickers.items():
+                    self._store_ticker(exchange_name, symbol, ticker, timestamp, updated_at)
+                
+                self._ws_healthy[exchange_name] = True
+        finally:
+            self._ws_healthy[exchange_name] = False
     
     async def _analyze_symbol(self, symbol: str) -> List[ArbitrageOpportunity]:
         """
@@ -153,83 +438,64 @@ class InterExchangeArb(BaseStrategy):
         Returns:
             Lista de oportunidades encontradas para o símbolo
         """
+        return self._analyze_symbols([symbol])
+    
+    def _analyze_symbols(self, symbols: List[str]) -> List[ArbitrageOpportunity]:
+        """
+        Analisa oportunidades de arbitragem de vários símbolos de uma vez
+        
+        Args:
+            symbols: Símbolos para analisar
+            
+        Returns:
+            Lista de oportunidades encontradas, agrupadas por símbolo
+        """
+        symbols = [symbol for symbol in symbols if symbol in self._ask_arr]
+        if not symbols or not self._exchange_names:
+            return []
+        
+        asks = np.stack([self._ask_arr[symbol] for symbol in symbols])
+        ts = np.stack([self._ts_arr[symbol] for symbol in symbols])
+        
+        # Símbolos com menos de duas cotações recentes não formam par algum
+        fresh = (self._now - ts <= self._stale_threshold) & (asks > 0)
+        keep = np.count_nonzero(fresh, axis=1) >= 2
+        if not keep.any():
+            return []
+        if not keep.all():
+            symbols = [symbol for symbol, k in zip(symbols, keep) if k]
+            asks = asks[keep]
+            ts = ts[keep]
+        
+        bids = np.stack([self._bid_arr[symbol] for symbol in symbols])
+        s_idx, i_idx, j_idx, profit, volume = _arbitrage_matrix(
+            asks,
+            bids,
+            np.stack([self._vol_arr[symbol] for symbol in symbols]),
+            ts,
+            self._pair_buy,
+            self._pair_sell,
+            self._now,
+            self._stale_threshold,
+            self.min_profit_percentage,
+            self.max_position_size,
+            self.min_volume_threshold
+        )
+        
         opportunities = []
-        exchange_names = list(self.exchanges.keys())
         
-        # Compara preços entre todas as combinações de exchanges
-        for i, buy_exchange in enumerate(exchange_names):
-            for sell_exchange in exchange_names[i+1:]:
-                
-                # Verifica se temos dados de preço para ambas as exchanges
-                if (buy_exchange not in self.price_cache or 
-                    sell_exchange not in self.price_cache or
-                    symbol not in self.price_cache[buy_exchange] or
-                    symbol not in self.price_cache[sell_exchange]):
-                    continue
-                
-                buy_data = self.price_cache[buy_exchange][symbol]
-                sell_data = self.price_cache[sell_exchange][symbol]
-                
-                # Verifica se os dados são recentes
-                if (datetime.now() - buy_data['timestamp']).seconds > 60:
-                    continue
-                if (datetime.now() - sell_data['timestamp']).seconds > 60:
-                    continue
-                
-                # Calcula oportunidade: comprar na exchange com menor preço, vender na com maior
-                buy_price = buy_data['ask']  # Preço para comprar
-                sell_price = sell_data['bid']  # Preço para vender
-                
-                if sell_price > buy_price:
-                    profit_percentage = ((sell_price - buy_price) / buy_price) * 100
-                    
-                    if profit_percentage >= self.min_profit_percentage:
-                        # Calcula volume disponível
-                        volume_available = min(
-                            buy_data['volume'] * 0.01,  # 1% do volume diário
-                            sell_data['volume'] * 0.01,
-                            self.max_position_size
-                        )
-                        
-                        if volume_available >= self.min_volume_threshold:
-                            opportunity = ArbitrageOpportunity(
-                                symbol=symbol,
-                                buy_exchange=buy_exchange,
-                                sell_exchange=sell_exchange,
-                                buy_price=buy_price,
-                                sell_price=sell_price,
-                                profit_percentage=profit_percentage,
-                                volume_available=volume_available,
-                                timestamp=datetime.now()
-                            )
-                            opportunities.append(opportunity)
-                
-                # Verifica também a oportunidade inversa
-                buy_price_inv = sell_data['ask']
-                sell_price_inv = buy_data['bid']
-                
-                if sell_price_inv > buy_price_inv:
-                    profit_percentage_inv = ((sell_price_inv - buy_price_inv) / buy_price_inv) * 100
-                    
-                    if profit_percentage_inv >= self.min_profit_percentage:
-                        volume_available_inv = min(
-                            buy_data['volume'] * 0.01,
-                            sell_data['volume'] * 0.01,
-                            self.max_position_size
-                        )
-                        
-                        if volume_available_inv >= self.min_volume_threshold:
-                            opportunity = ArbitrageOpportunity(
-                                symbol=symbol,
-                                buy_exchange=sell_exchange,
-                                sell_exchange=buy_exchange,
-                                buy_price=buy_price_inv,
-                                sell_price=sell_price_inv,
-                                profit_percentage=profit_percentage_inv,
-                                volume_available=volume_available_inv,
-                                timestamp=datetime.now()
-                            )
-                            opportunities.append(opportunity)
+        for k in range(len(s_idx)):
+            s, i, j = s_idx[k], i_idx[k], j_idx[k]
+            opportunities.append(ArbitrageOpportunity(
+                symbol=symbols[s],
+                buy_exchange=self._exchange_names[i],
+                sell_exchange=self._exchange_names[j],
+                buy_price=float(asks[s, i]),
+                sell_price=float(bids[s, j]),
+                profit_percentage=float(profit[k]),
+                volume_available=float(volume[k]),
+                timestamp=self._now
+            ))
         
         return opportunities
     
@@ -243,22 +509,22 @@ class InterExchangeArb(BaseStrategy):
         Returns:
             Lista filtrada e ordenada por lucratividade
         """
-        # Remove oportunidades duplicadas
-        unique_opportunities = []
+        # Remove duplicadas em uma única passada (primeira ocorrência vence);
+        # a chave empacota os índices de símbolo e exchanges em um único int
+        symbol_index = self._symbol_index
+        exchange_index = self._exchange_index
         seen = set()
+        unique_opportunities = (
+            opp for opp in opportunities
+            if (key := (symbol_index[opp.symbol] << 32
+                        | exchange_index[opp.buy_exchange] << 16
+                        | exchange_index[opp.sell_exchange])) not in seen
+            and not seen.add(key)
+        )
         
-        for opp in opportunities:
-            key = f"{opp.symbol}_{opp.buy_exchange}_{opp.sell_exchange}"
-            if key not in seen:
-                unique_opportunities.append(opp)
-                seen.add(key)
-        
-        # Ordena por lucratividade (maior primeiro)
-        unique_opportunities.sort(key=lambda x: x.profit_percentage, reverse=True)
-        
-        # Limita o número de oportunidades
-        max_opportunities = self.config.get('max_opportunities', 5)
-        return unique_opportunities[:max_opportunities]
+        # Seleção parcial das mais lucrativas: O(N log k) em vez de ordenar tudo
+        return heapq.nlargest(self.max_opportunities, unique_opportunities,
+                              key=lambda x: x.profit_percentage)
     
     async def execute_trade(self, opportunity: ArbitrageOpportunity) -> Dict[str, Any]:
         """
@@ -271,9 +537,10 @@ class InterExchangeArb(BaseStrategy):
             Resultado da execução
         """
         try:
-            self.logger.info(f"Executando arbitragem: {opportunity.symbol} "
-                           f"{opportunity.buy_exchange} -> {opportunity.sell_exchange} "
-                           f"Lucro: {opportunity.profit_percentage:.2f}%")
+            # Formatação preguiçosa: só ocorre se o registro for emitido
+            self.logger.info("Executando arbitragem: %s %s -> %s Lucro: %.2f%%",
+                             opportunity.symbol, opportunity.buy_exchange,
+                             opportunity.sell_exchange, opportunity.profit_percentage)
             
             # Calcula quantidade a negociar
             quantity = min(opportunity.volume_available, self.max_position_size)
@@ -314,7 +581,7 @@ class InterExchangeArb(BaseStrategy):
                 'sell_order_id': sell_result['order_id']
             }
             
-            self.logger.info(f"Arbitragem executada com sucesso. Lucro: ${profit:.2f} ({profit_percentage:.2f}%)")
+            self.logger.info("Arbitragem executada com sucesso. Lucro: $%.2f (%.2f%%)", profit, profit_percentage)
             return result
             
         except asyncio.TimeoutError:
@@ -335,9 +602,15 @@ class InterExchangeArb(BaseStrategy):
         # Obtém símbolo base e quote
         base_symbol, quote_symbol = opportunity.symbol.split('/')
         
-        # Verifica saldo para compra
+        # Consulta os saldos das duas exchanges em paralelo (1 RTT em vez de 2)
         buy_exchange = self.exchanges[opportunity.buy_exchange]
-        buy_balance = await buy_exchange.get_balance()
+        sell_exchange = self.exchanges[opportunity.sell_exchange]
+        buy_balance, sell_balance = await asyncio.gather(
+            buy_exchange.get_balance(),
+            sell_exchange.get_balance()
+        )
+        
+        # Verifica saldo para compra
         required_quote = quantity * opportunity.buy_price * 1.01  # 1% margem
         
         if buy_balance.get(quote_symbol, 0) < required_quote:
@@ -348,9 +621,6 @@ class InterExchangeArb(BaseStrategy):
             )
         
         # Verifica saldo para venda
-        sell_exchange = self.exchanges[opportunity.sell_exchange]
-        sell_balance = await sell_exchange.get_balance()
-        
         if sell_balance.get(base_symbol, 0) < quantity:
             raise InsufficientFundsError(
                 f"Saldo insuficiente em {opportunity.sell_exchange}: "
@@ -386,47 +656,45 @@ class InterExchangeArb(BaseStrategy):
             Relatório de discrepâncias encontradas
         """
         try:
+            self._now = time.monotonic()
             await self._update_prices()
+            report_time = self._update_time
             
             discrepancies = {}
             
             for symbol in self.symbols:
                 symbol_discrepancies = []
-                exchange_names = list(self.exchanges.keys())
                 
                 # Coleta preços de todas as exchanges
                 prices = {}
-                for exchange_name in exchange_names:
+                for exchange_name in self._exchange_names:
                     if (exchange_name in self.price_cache and 
                         symbol in self.price_cache[exchange_name]):
-                        prices[exchange_name] = self.price_cache[exchange_name][symbol]['last']
+                        prices[exchange_name] = self.price_cache[exchange_name][symbol].last
                 
                 if len(prices) < 2:
                     continue
                 
-                # Calcula discrepâncias
-                min_price = min(prices.values())
-                max_price = max(prices.values())
+                # Calcula discrepâncias (exchange e preço extremos em uma passada cada)
+                min_exchange, min_price = min(prices.items(), key=itemgetter(1))
+                max_exchange, max_price = max(prices.items(), key=itemgetter(1))
                 max_discrepancy = ((max_price - min_price) / min_price) * 100
                 
-                min_exchange = [k for k, v in prices.items() if v == min_price][0]
-                max_exchange = [k for k, v in prices.items() if v == max_price][0]
-                
                 symbol_discrepancies.append({
                     'min_price': min_price,
                     'max_price': max_price,
                     'min_exchange': min_exchange,
                     'max_exchange': max_exchange,
                     'discrepancy_percentage': max_discrepancy,
-                    'timestamp': datetime.now()
+                    'timestamp': report_time
                 })
                 
                 discrepancies[symbol] = symbol_discrepancies
             
             return {
                 'discrepancies': discrepancies,
-                'timestamp': datetime.now(),
-                'exchanges_monitored': list(self.exchanges.keys()),
+                'timestamp': report_time,
+                'exchanges_monitored': list(self._exchange_names),
                 'symbols_monitored': self.symbols
             }
             
@@ -449,5 +717,5 @@ class InterExchangeArb(BaseStrategy):
             'min_profit_threshold': self.min_profit_percentage,
             'max_position_size': self.max_position_size,
             'last_analysis': self.last_update,
-            'price_cache_size': sum(len(symbols) for symbols in self.price_cache.values())
+            'price_cache_size': self._price_cache_size
         }
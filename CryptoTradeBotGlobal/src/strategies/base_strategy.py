@@ -4,12 +4,52 @@ Classe abstrata base para todas as estratégias de trading
 """
 
 import asyncio
+import json
 import logging
+import numbers
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Any, Tuple, Union
 from decimal import Decimal
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
+from . import indicadores
+
+
+# Campos que todo sinal precisa conter
+_CAMPOS_OBRIGATORIOS = frozenset({'simbolo', 'acao', 'preco', 'timestamp'})
+
+# Tipos aceitos para campos numéricos do sinal
+_NUMEROS = (numbers.Real, Decimal)
+
+# Quantidade máxima de resultados de indicadores mantidos em cache
+_MAX_CACHE_INDICADORES = 128
+
+# Agregação OHLCV usada ao reamostrar candles para um timeframe maior
+_AGREGACAO_OHLCV = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+
+
+def _converter_json(valor: Any) -> Any:
+    """Converte tipos que o módulo json não serializa nativamente"""
+    if isinstance(valor, Decimal):
+        return float(valor)
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, datetime):
+        return valor.isoformat()
+    raise TypeError(f"Tipo não serializável: {type(valor).__name__}")
+
+
+# Codificador compacto reutilizado na emissão de sinais
+_CODIFICADOR_JSON = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False,
+                                     check_circular=False, default=_converter_json)
+
 
 class BaseStrategy(ABC):
     """
@@ -33,6 +73,7 @@ class BaseStrategy(ABC):
         self.ativa = False
         self.inicializada = False
         self.ultima_analise = None
+        self._proxima_analise = 0.0  # instante monotônico liberado para a próxima análise
         
         # Métricas de performance
         self.sinais_gerados = 0
@@ -43,9 +84,19 @@ class BaseStrategy(ABC):
         self.nome = configuracao.get('nome', self.__class__.__name__)
         self.intervalo_analise = configuracao.get('intervalo_analise', 60)  # segundos
         self.min_confianca = configuracao.get('min_confianca', 0.6)
+        self.tf_reamostragem: Optional[str] = configuracao.get('tf_resample')  # ex.: '5min', '1W'
+        
+        # Histórico de sinais (os mais antigos são descartados ao atingir o limite)
+        self.historico_sinais: deque = deque(maxlen=configuracao.get('max_historico', 1000))
+        
+        # Estado dos indicadores incrementais: simbolo -> (indicador, parâmetros) -> estado
+        self._estado_indicadores: Dict[str, Dict[Tuple, Any]] = {}
         
-        # Histórico de sinais
-        self.historico_sinais: List[Dict[str, Any]] = []
+        # Resultados recentes dos indicadores em lote (LRU)
+        self._cache_indicadores: OrderedDict = OrderedDict()
+        
+        # Última reamostragem por símbolo: simbolo -> (chave da fonte, precos, volume)
+        self._cache_reamostragem: Dict[str, Tuple[Tuple, pd.DataFrame, Optional[pd.Series]]] = {}
     
     async def inicializar(self) -> bool:
         """
@@ -55,7 +106,7 @@ class BaseStrategy(ABC):
             True se inicializada com sucesso
         """
         try:
-            self.logger.info(f"Inicializando estratégia {self.nome}")
+            self.logger.info("Inicializando estratégia %s", self.nome)
             
             # Validar configuração
             if not self._validar_configuracao():
@@ -66,11 +117,11 @@ class BaseStrategy(ABC):
             
             self.inicializada = True
             self.ativa = True
-            self.logger.info(f"Estratégia {self.nome} inicializada com sucesso")
+            self.logger.info("Estratégia %s inicializada com sucesso", self.nome)
             return True
             
         except Exception as e:
-            self.logger.error(f"Erro ao inicializar estratégia {self.nome}: {e}")
+            self.logger.error("Erro ao inicializar estratégia %s: %s", self.nome, e)
             return False
     
     async def finalizar(self):
@@ -78,15 +129,18 @@ class BaseStrategy(ABC):
         try:
             self.ativa = False
             await self._finalizar_especifica()
-            self.logger.info(f"Estratégia {self.nome} finalizada")
+            self.logger.info("Estratégia %s finalizada", self.nome)
             
         except Exception as e:
-            self.logger.error(f"Erro ao finalizar estratégia {self.nome}: {e}")
+            self.logger.error("Erro ao finalizar estratégia %s: %s", self.nome, e)
     
     async def analisar(self, dados_mercado: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Análise principal da estratégia
         
+        Chamadas antes de decorrido `intervalo_analise` desde a última
+        análise retornam imediatamente sem sinais.
+        
         Args:
             dados_mercado: Dados de mercado para análise
             
@@ -96,6 +150,12 @@ class BaseStrategy(ABC):
         if not self.inicializada or not self.ativa:
             return []
         
+        # Respeitar o intervalo entre análises antes de qualquer outro trabalho
+        agora = time.monotonic()
+        if agora < self._proxima_analise:
+            return []
+        self._proxima_analise = agora + self.intervalo_analise
+        
         try:
             self.ultima_analise = datetime.now()
             
@@ -103,23 +163,20 @@ class BaseStrategy(ABC):
             sinais = await self._analisar_especifica(dados_mercado)
             
             # Validar e processar sinais
-            sinais_validos = []
-            for sinal in sinais:
-                if self._validar_sinal(sinal):
-                    self.sinais_gerados += 1
-                    self.historico_sinais.append(sinal)
-                    sinais_validos.append(sinal)
-                    
-                    # Limitar histórico
-                    if len(self.historico_sinais) > 1000:
-                        self.historico_sinais.pop(0)
-                    
-                    self.logger.info(f"Sinal gerado: {sinal.get('acao', 'DESCONHECIDO')} {sinal.get('simbolo', '')}")
+            validar = self._validar_sinal
+            sinais_validos = [sinal for sinal in sinais if validar(sinal)]
+            if sinais_validos:
+                self.sinais_gerados += len(sinais_validos)
+                self.historico_sinais.extend(sinais_validos)
+                
+                if self.logger.isEnabledFor(logging.INFO):
+                    for sinal in sinais_validos:
+                        self.logger.info("Sinal gerado: %s %s", sinal.get('acao', 'DESCONHECIDO'), sinal.get('simbolo', ''))
             
             return sinais_validos
             
         except Exception as e:
-            self.logger.error(f"Erro na análise da estratégia {self.nome}: {e}")
+            self.logger.error("Erro na análise da estratégia %s: %s", self.nome, e)
             return []
     
     def obter_metricas_performance(self) -> Dict[str, Any]:
@@ -149,14 +206,14 @@ class BaseStrategy(ABC):
         """Ativa a estratégia"""
         if self.inicializada:
             self.ativa = True
-            self.logger.info(f"Estratégia {self.nome} ativada")
+            self.logger.info("Estratégia %s ativada", self.nome)
         else:
-            self.logger.warning(f"Tentativa de ativar estratégia {self.nome} não inicializada")
+            self.logger.warning("Tentativa de ativar estratégia %s não inicializada", self.nome)
     
     def desativar(self):
         """Desativa a estratégia"""
         self.ativa = False
-        self.logger.info(f"Estratégia {self.nome} desativada")
+        self.logger.info("Estratégia %s desativada", self.nome)
     
     def _validar_configuracao(self) -> bool:
         """
@@ -178,7 +235,7 @@ class BaseStrategy(ABC):
             return self._validar_configuracao_especifica()
             
         except Exception as e:
-            self.logger.error(f"Erro na validação da configuração: {e}")
+            self.logger.error("Erro na validação da configuração: %s", e)
             return False
     
     def _validar_sinal(self, sinal: Dict[str, Any]) -> bool:
@@ -191,31 +248,355 @@ class BaseStrategy(ABC):
         Returns:
             True se sinal é válido
         """
-        try:
-            # Verificar campos obrigatórios
-            campos_obrigatorios = ['simbolo', 'acao', 'preco', 'timestamp']
-            for campo in campos_obrigatorios:
-                if campo not in sinal:
-                    self.logger.warning(f"Campo obrigatório '{campo}' ausente no sinal")
-                    return False
+        if not isinstance(sinal, dict):
+            self.logger.warning("Sinal deve ser um dicionário: %r", sinal)
+            return False
+        
+        # Verificar campos obrigatórios
+        ausentes = _CAMPOS_OBRIGATORIOS - sinal.keys()
+        if ausentes:
+            self.logger.warning("Campos obrigatórios ausentes no sinal: %s", sorted(ausentes))
+            return False
+        
+        # Verificar confiança mínima
+        confianca = sinal.get('confianca', 0.5)
+        if not isinstance(confianca, _NUMEROS) or confianca < self.min_confianca:
+            self.logger.debug("Sinal rejeitado por baixa confiança: %s", confianca)
+            return False
+        
+        # Verificar se preço é válido
+        preco = sinal['preco']
+        if not isinstance(preco, _NUMEROS) or preco <= 0:
+            self.logger.warning("Preço do sinal deve ser positivo")
+            return False
+        
+        return True
+    
+    @staticmethod
+    def sinal_para_json(sinal: Dict[str, Any]) -> bytes:
+        """
+        Serializa um sinal para envio a filas ou ao barramento de eventos
+        
+        Args:
+            sinal: Sinal validado
             
-            # Verificar confiança mínima
-            confianca = sinal.get('confianca', 0.5)
-            if confianca < self.min_confianca:
-                self.logger.debug(f"Sinal rejeitado por baixa confiança: {confianca}")
-                return False
+        Returns:
+            JSON compacto em UTF-8
+        """
+        return _CODIFICADOR_JSON.encode(sinal).encode('utf-8')
+    
+    # ==================== INDICADORES TÉCNICOS ====================
+    
+    def reamostrar(self, simbolo: str, precos: pd.DataFrame,
+                   volume: Optional[pd.Series] = None) -> Tuple[pd.DataFrame, Optional[pd.Series]]:
+        """
+        Reamostra os candles para o timeframe configurado em `tf_resample`
+        
+        Sem `tf_resample` os dados são devolvidos inalterados. O resultado
+        é reaproveitado enquanto a série de origem não avançar nem o último
+        candle (ainda em formação) for atualizado.
+        
+        Args:
+            simbolo: Símbolo dos dados
+            precos: DataFrame OHLC(V) indexado por timestamp
+            volume: Série de volume alinhada a `precos`
             
-            # Verificar se preço é válido
-            preco = sinal.get('preco', 0)
-            if preco <= 0:
-                self.logger.warning("Preço do sinal deve ser positivo")
-                return False
+        Returns:
+            Tupla (precos, volume) no timeframe configurado
+        """
+        if not self.tf_reamostragem or precos.empty:
+            return precos, volume
+        
+        chave = (len(precos), precos.index[0], precos.index[-1], tuple(precos.iloc[-1].tolist()),
+                 None if volume is None else (len(volume), volume.iat[-1]))
+        em_cache = self._cache_reamostragem.get(simbolo)
+        if em_cache is not None and em_cache[0] == chave:
+            return em_cache[1], em_cache[2]
+        
+        agregacao = {coluna: funcao for coluna, funcao in _AGREGACAO_OHLCV.items()
+                     if coluna in precos.columns}
+        reamostrados = precos.resample(self.tf_reamostragem).agg(agregacao).dropna()
+        
+        volume_reamostrado = None
+        if volume is not None:
+            volume_reamostrado = volume.resample(self.tf_reamostragem).sum().reindex(reamostrados.index)
+        
+        self._cache_reamostragem[simbolo] = (chave, reamostrados, volume_reamostrado)
+        return reamostrados, volume_reamostrado
+    
+    def _memorizar(self, chave: Tuple, precos: pd.Series, calcular):
+        """
+        Reaproveita o resultado de um indicador enquanto a série não mudar
+        
+        A série é identificada por nome, tamanho e primeiro/último índice e
+        valor, de modo que um novo candle invalida a entrada.
+        """
+        if precos.empty:
+            return calcular()
+        
+        chave += (precos.name, len(precos), precos.index[0], precos.index[-1], precos.iat[0], precos.iat[-1])
+        resultado = self._cache_indicadores.get(chave)
+        if resultado is not None:
+            self._cache_indicadores.move_to_end(chave)
+            return resultado
+        
+        resultado = self._cache_indicadores[chave] = calcular()
+        if len(self._cache_indicadores) > _MAX_CACHE_INDICADORES:
+            self._cache_indicadores.popitem(last=False)
+        return resultado
+    
+    def calcular_media_movel(self, precos: pd.Series, periodo: int,
+                             como_array: bool = False) -> Union[pd.Series, np.ndarray]:
+        """
+        Calcula a média móvel simples
+        
+        Args:
+            precos: Série de preços
+            periodo: Tamanho da janela
+            como_array: Retorna o np.ndarray sem construir a Série
             
-            return True
+        Returns:
+            Série (ou array) com a média móvel
+        """
+        def calcular():
+            valores = indicadores.media_movel(precos.to_numpy(dtype=np.float64, copy=False), periodo)
+            return valores if como_array else pd.Series(valores, index=precos.index)
+        
+        return self._memorizar(('sma', periodo, como_array), precos, calcular)
+    
+    def calcular_media_exponencial(self, precos: pd.Series, periodo: int,
+                                   como_array: bool = False) -> Union[pd.Series, np.ndarray]:
+        """
+        Calcula a média móvel exponencial com alpha = 2 / (periodo + 1)
+        
+        Usa a recorrência simples, equivalente a `ewm(span=periodo, adjust=False)`,
+        sem a normalização por pesos do modo `adjust=True` do pandas.
+        
+        Args:
+            precos: Série de preços
+            periodo: Span da média
+            como_array: Retorna o np.ndarray sem construir a Série
             
-        except Exception as e:
-            self.logger.error(f"Erro na validação do sinal: {e}")
-            return False
+        Returns:
+            Série (ou array) com a média exponencial
+        """
+        def calcular():
+            valores = indicadores.media_movel_exponencial(
+                precos.to_numpy(dtype=np.float64, copy=False), 2.0 / (periodo + 1)
+            )
+            return valores if como_array else pd.Series(valores, index=precos.index)
+        
+        return self._memorizar(('ema', periodo, como_array), precos, calcular)
+    
+    def calcular_rsi(self, precos: pd.Series, periodo: int = 14,
+                     como_array: bool = False) -> Union[pd.Series, np.ndarray]:
+        """
+        Calcula o RSI (suavização de Wilder)
+        
+        Args:
+            precos: Série de preços de fechamento
+            periodo: Período do RSI
+            como_array: Retorna o np.ndarray sem construir a Série
+            
+        Returns:
+            Série (ou array) com valores de RSI (0-100)
+        """
+        def calcular():
+            valores = indicadores.rsi(precos.to_numpy(dtype=np.float64, copy=False), periodo)
+            return valores if como_array else pd.Series(valores, index=precos.index)
+        
+        return self._memorizar(('rsi', periodo, como_array), precos, calcular)
+    
+    def calcular_bandas_bollinger(self, precos: pd.Series, periodo: int = 20, desvios: float = 2.0,
+                                  como_array: bool = False) -> Tuple[Union[pd.Series, np.ndarray], ...]:
+        """
+        Calcula as Bandas de Bollinger
+        
+        Args:
+            precos: Série de preços de fechamento
+            periodo: Janela da média móvel
+            desvios: Número de desvios padrão
+            como_array: Retorna np.ndarrays sem construir as Séries
+            
+        Returns:
+            Tupla (banda_superior, media_movel, banda_inferior)
+        """
+        def calcular():
+            bandas = indicadores.bandas_bollinger(precos.to_numpy(dtype=np.float64, copy=False), periodo, desvios)
+            return bandas if como_array else tuple(pd.Series(banda, index=precos.index) for banda in bandas)
+        
+        return self._memorizar(('bollinger', periodo, desvios, como_array), precos, calcular)
+    
+    def calcular_volatilidade(self, precos: pd.Series, periodos: int = 20) -> float:
+        """
+        Calcula a volatilidade atual (desvio padrão dos últimos retornos)
+        
+        Args:
+            precos: Série de preços de fechamento
+            periodos: Número de retornos considerados
+            
+        Returns:
+            Volatilidade atual (NaN se não houver dados suficientes)
+        """
+        return indicadores.volatilidade(precos.to_numpy(dtype=np.float64, copy=False), periodos)
+    
+    def calcular_macd(self, precos: pd.Series, rapida: int = 12, lenta: int = 26, sinal: int = 9,
+                      como_array: bool = False) -> Tuple[Union[pd.Series, np.ndarray], ...]:
+        """
+        Calcula o MACD
+        
+        Args:
+            precos: Série de preços de fechamento
+            rapida: Período da média exponencial rápida
+            lenta: Período da média exponencial lenta
+            sinal: Período da linha de sinal
+            como_array: Retorna np.ndarrays sem construir as Séries
+            
+        Returns:
+            Tupla (macd, linha_sinal, histograma)
+        """
+        def calcular():
+            linhas = indicadores.macd(precos.to_numpy(dtype=np.float64, copy=False), rapida, lenta, sinal)
+            return linhas if como_array else tuple(pd.Series(linha, index=precos.index) for linha in linhas)
+        
+        return self._memorizar(('macd', rapida, lenta, sinal, como_array), precos, calcular)
+    
+    def _atualizar_incremental(self, simbolo: str, chave: Tuple, fabrica, preco: float,
+                               historico: Optional[pd.Series]):
+        """
+        Atualiza (ou cria e aquece) o estado incremental de um indicador
+        
+        Na primeira chamada para (simbolo, chave) o estado é reconstruído em
+        lote a partir de `historico`, que já deve incluir `preco`.
+        """
+        estados = self._estado_indicadores.setdefault(simbolo, {})
+        estado = estados.get(chave)
+        if estado is None:
+            estado = estados[chave] = fabrica()
+            if historico is not None and len(historico):
+                return estado.aquecer(historico.to_numpy(dtype=np.float64, copy=False))
+        return estado.atualizar(float(preco))
+    
+    def atualizar_sma(self, simbolo: str, preco: float, periodo: int,
+                      historico: Optional[pd.Series] = None) -> float:
+        """
+        Atualiza a média móvel simples de um símbolo com um novo preço (O(1))
+        
+        Args:
+            simbolo: Símbolo do ativo
+            preco: Preço do novo candle
+            periodo: Tamanho da janela
+            historico: Série completa usada só para aquecer o estado na primeira chamada
+            
+        Returns:
+            Valor atual da média móvel
+        """
+        return self._atualizar_incremental(
+            simbolo, ('sma', periodo), lambda: indicadores.MediaMovelIncremental(periodo), preco, historico
+        )
+    
+    def atualizar_ewma(self, simbolo: str, preco: float, periodo: int,
+                       historico: Optional[pd.Series] = None) -> float:
+        """
+        Atualiza a média móvel exponencial (span = periodo) de um símbolo (O(1))
+        
+        Args:
+            simbolo: Símbolo do ativo
+            preco: Preço do novo candle
+            periodo: Span da média exponencial
+            historico: Série completa usada só para aquecer o estado na primeira chamada
+            
+        Returns:
+            Valor atual da média exponencial
+        """
+        return self._atualizar_incremental(
+            simbolo, ('ewma', periodo),
+            lambda: indicadores.MediaExponencialIncremental(2.0 / (periodo + 1)), preco, historico
+        )
+    
+    def atualizar_rsi(self, simbolo: str, preco: float, periodo: int = 14,
+                      historico: Optional[pd.Series] = None) -> float:
+        """
+        Atualiza o RSI de Wilder de um símbolo com um novo preço (O(1))
+        
+        Args:
+            simbolo: Símbolo do ativo
+            preco: Preço do novo candle
+            periodo: Período do RSI
+            historico: Série completa usada só para aquecer o estado na primeira chamada
+            
+        Returns:
+            Valor atual do RSI
+        """
+        return self._atualizar_incremental(
+            simbolo, ('rsi', periodo), lambda: indicadores.RSIIncremental(periodo), preco, historico
+        )
+    
+    def atualizar_bandas_bollinger(self, simbolo: str, preco: float, periodo: int = 20,
+                                   desvios: float = 2.0,
+                                   historico: Optional[pd.Series] = None) -> Tuple[float, float, float]:
+        """
+        Atualiza as Bandas de Bollinger de um símbolo com um novo preço (O(1))
+        
+        Args:
+            simbolo: Símbolo do ativo
+            preco: Preço do novo candle
+            periodo: Janela da média móvel
+            desvios: Número de desvios padrão
+            historico: Série completa usada só para aquecer o estado na primeira chamada
+            
+        Returns:
+            Tupla (banda_superior, media_movel, banda_inferior)
+        """
+        return self._atualizar_incremental(
+            simbolo, ('bollinger', periodo, desvios),
+            lambda: indicadores.BollingerIncremental(periodo, desvios), preco, historico
+        )
+    
+    def calcular_indicadores_lote(self, precos_por_simbolo: Dict[str, pd.Series],
+                                  periodo_rsi: int = 14, periodo_bollinger: int = 20,
+                                  desvios: float = 2.0) -> Dict[str, Dict[str, float]]:
+        """
+        Calcula os valores atuais de RSI, Bollinger e MACD de vários símbolos de uma vez
+        
+        As séries são alinhadas pelas últimas barras comuns a todos os
+        símbolos e empilhadas numa matriz (símbolos x barras), de modo que
+        cada indicador é calculado por uma única chamada vetorizada.
+        
+        Args:
+            precos_por_simbolo: Série de preços de fechamento por símbolo
+            periodo_rsi: Período do RSI
+            periodo_bollinger: Janela das Bandas de Bollinger
+            desvios: Número de desvios padrão das bandas
+            
+        Returns:
+            Dicionário símbolo -> valores atuais dos indicadores
+        """
+        if not precos_por_simbolo:
+            return {}
+        
+        barras = min(len(serie) for serie in precos_por_simbolo.values())
+        matriz = np.empty((len(precos_por_simbolo), barras))
+        for linha, serie in zip(matriz, precos_por_simbolo.values()):
+            linha[:] = serie.to_numpy(dtype=np.float64, copy=False)[len(serie) - barras:]
+        
+        rsi = indicadores.rsi(matriz, periodo_rsi)[:, -1]
+        superior, media, inferior = (banda[:, -1] for banda in
+                                     indicadores.bandas_bollinger(matriz, periodo_bollinger, desvios))
+        linha_macd, linha_sinal, histograma = (linha[:, -1] for linha in indicadores.macd(matriz))
+        
+        return {
+            simbolo: {
+                'rsi': float(rsi[i]),
+                'banda_superior': float(superior[i]),
+                'media_movel': float(media[i]),
+                'banda_inferior': float(inferior[i]),
+                'macd': float(linha_macd[i]),
+                'macd_sinal': float(linha_sinal[i]),
+                'macd_histograma': float(histograma[i])
+            }
+            for i, simbolo in enumerate(precos_por_simbolo)
+        }
     
     # ==================== MÉTODOS ABSTRATOS ====================
     
@@ -4,16 +4,45 @@ Sistema de Trading de Criptomoedas - Português Brasileiro
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime
 from collections import deque
-import math
+
+import numpy as np
 
 from src.strategies.base_strategy import BaseStrategy
 from src.utils.logger import obter_logger, log_performance
 
 
+# Posição em relação às bandas indexada por 2 * (toca superior) + (toca inferior);
+# a banda superior prevalece quando as duas são tocadas (bandas de largura zero)
+_POSICOES_BANDA = ('MEIO', 'INFERIOR', 'SUPERIOR', 'SUPERIOR')
+
+# Motivos dos sinais, formatados apenas quando o sinal é de fato emitido
+_MOTIVOS_SINAL = {
+    'toque_inferior': "Preço tocou banda inferior: ${preco:.2f} <= ${banda_inferior:.2f}",
+    'primeiro_toque_inferior': "Primeira análise: preço tocou banda inferior: ${preco:.2f} <= ${banda_inferior:.2f}",
+    'toque_superior': "Preço tocou banda superior: ${preco:.2f} >= ${banda_superior:.2f}",
+    'primeiro_toque_superior': "Primeira análise: preço tocou banda superior: ${preco:.2f} >= ${banda_superior:.2f}",
+    'rompimento_superior': "Rompimento da banda superior: ${preco:.2f} > ${banda_superior:.2f}",
+    'rompimento_inferior': "Rompimento da banda inferior: ${preco:.2f} < ${banda_inferior:.2f}",
+}
+
+def _calcular_bandas(media, m2, periodo: int, desvios: float):
+    """
+    Desvio padrão populacional e bandas a partir da média e do M2 da janela
+    
+    Aceita escalares ou arrays NumPy (uma posição por símbolo).
+    
+    Returns:
+        Tupla (desvio_padrao, banda_superior, banda_inferior)
+    """
+    desvio_padrao = (m2 / periodo) ** 0.5
+    afastamento = desvios * desvio_padrao
+    return desvio_padrao, media + afastamento, media - afastamento
+
+
 class EstrategiaBollinger(BaseStrategy):
     # Métodos abstratos mínimos para compatibilidade com testes
     def _analisar_especifica(self, *args, **kwargs):
@@ -57,10 +86,47 @@ class EstrategiaBollinger(BaseStrategy):
         self.usar_breakout = configuracao.get('usar_breakout', False)  # Rompimento das bandas
         self.percentual_banda = Decimal(str(configuracao.get('percentual_banda', 0.02)))  # 2%
         
+        # Cópias em float dos parâmetros usados a cada tick
+        self._desvios_float = float(self.desvios_padrao)
+        self._volume_minimo_float = float(self.volume_minimo)
+        self._inverso_volume_minimo = 1.0 / self._volume_minimo_float if self._volume_minimo_float else None
+        self._percentual_banda_float = float(self.percentual_banda)
+        
+        # Modelo dos parâmetros do sinal, copiado e preenchido a cada sinal emitido
+        self._modelo_parametros = {
+            'banda_superior': 0.0,
+            'banda_inferior': 0.0,
+            'media': 0.0,
+            'posicao_percentual': 0.0,
+            'largura_banda': 0.0,
+            'periodo': self.periodo,
+            'desvios_padrao': self._desvios_float,
+            'volume': 0
+        }
+        
         # Dados históricos
         self.dados_historicos = {simbolo: deque(maxlen=self.periodo + 10) for simbolo in self.simbolos}
         self.bandas_historicas = {simbolo: deque(maxlen=100) for simbolo in self.simbolos}
         
+        # Totais dos históricos mantidos a cada inserção (descontando o limite dos deques)
+        self._total_pontos = 0
+        self._total_bandas = 0
+        self._simbolos_com_dados = 0
+        
+        # Janelas deslizantes de todos os símbolos (uma linha por símbolo, em buffer circular),
+        # com média e M2 de Welford atualizadas em O(1) a cada preço
+        self._linha_simbolo = {simbolo: linha for linha, simbolo in enumerate(self.simbolos)}
+        self._matriz_precos = np.zeros((len(self.simbolos), self.periodo), dtype=np.float64)
+        self._medias_janela = np.zeros(len(self.simbolos), dtype=np.float64)
+        self._m2_janela = np.zeros(len(self.simbolos), dtype=np.float64)
+        self._inicio_buffer = {simbolo: 0 for simbolo in self.simbolos}  # posição do preço mais antigo
+        self._pontos_janela = {simbolo: 0 for simbolo in self.simbolos}
+        self._ultimo_preco = {simbolo: 0.0 for simbolo in self.simbolos}
+        
+        # Últimas bandas calculadas por símbolo, válidas enquanto não chegar novo preço
+        self._atualizacoes = {simbolo: 0 for simbolo in self.simbolos}
+        self._cache_bandas: Dict[str, Tuple[int, Dict[str, float]]] = {}
+        
         # Estado da estratégia
         self.ativa = True  # Garante que a estratégia está ativa após inicialização
         self.sinais_anteriores = {simbolo: 'NEUTRO' for simbolo in self.simbolos}
@@ -95,6 +161,7 @@ class EstrategiaBollinger(BaseStrategy):
         self.ultima_analise = datetime.now()
         
         try:
+            atualizados = []
             for simbolo in self.simbolos:
                 if simbolo not in dados_mercado:
                     continue
@@ -106,22 +173,28 @@ class EstrategiaBollinger(BaseStrategy):
                     continue
                 
                 # Atualizar dados históricos
-                await self._atualizar_dados_historicos(simbolo, dados_simbolo)
+                self._atualizar_dados_historicos(simbolo, dados_simbolo)
                 
                 # Verificar se temos dados suficientes
-                if len(self.dados_historicos[simbolo]) < self.periodo:
-                    continue
-                
-                # Calcular Bandas de Bollinger
-                bandas = await self._calcular_bandas_bollinger(simbolo)
+                if self._pontos_janela[simbolo] >= self.periodo:
+                    atualizados.append(simbolo)
+            
+            # Calcular as Bandas de Bollinger de todos os símbolos de uma vez
+            bandas_por_simbolo = self._calcular_bandas_lote(atualizados)
+            
+            for simbolo in atualizados:
+                bandas = bandas_por_simbolo.get(simbolo)
                 if not bandas:
                     continue
                 
                 # Armazenar bandas históricas
-                self.bandas_historicas[simbolo].append(bandas)
+                historico_bandas = self.bandas_historicas[simbolo]
+                if len(historico_bandas) < historico_bandas.maxlen:
+                    self._total_bandas += 1
+                historico_bandas.append(bandas)
                 
                 # Gerar sinais baseados nas bandas
-                sinal = await self._gerar_sinal_bollinger(simbolo, bandas, dados_simbolo)
+                sinal = self._gerar_sinal_bollinger(simbolo, bandas, dados_mercado[simbolo], self.ultima_analise)
                 if sinal:
                     sinais.append(sinal)
                     self.total_sinais_gerados += 1
@@ -145,7 +218,7 @@ class EstrategiaBollinger(BaseStrategy):
             if preco is None or preco <= 0:
                 return False
             
-            if volume < float(self.volume_minimo):
+            if volume < self._volume_minimo_float:
                 return False
             
             return True
@@ -153,10 +226,10 @@ class EstrategiaBollinger(BaseStrategy):
         except Exception:
             return False
     
-    async def _atualizar_dados_historicos(self, simbolo: str, dados_simbolo: Dict[str, Any]):
+    def _atualizar_dados_historicos(self, simbolo: str, dados_simbolo: Dict[str, Any]):
         """Atualiza dados históricos para o símbolo"""
         try:
-            preco = Decimal(str(dados_simbolo['preco']))
+            preco = float(dados_simbolo['preco'])
             timestamp = dados_simbolo.get('timestamp', datetime.now())
             
             ponto_dados = {
@@ -164,12 +237,61 @@ class EstrategiaBollinger(BaseStrategy):
                 'timestamp': timestamp
             }
             
-            self.dados_historicos[simbolo].append(ponto_dados)
+            historico = self.dados_historicos[simbolo]
+            if not historico:
+                self._simbolos_com_dados += 1
+            if len(historico) < historico.maxlen:
+                self._total_pontos += 1
+            historico.append(ponto_dados)
+            self._atualizar_janela(simbolo, preco)
+            self._ultimo_preco[simbolo] = preco
+            self._atualizacoes[simbolo] += 1
             
         except Exception as e:
             self.logger.error(f"❌ Erro ao atualizar dados históricos: {str(e)}")
     
-    async def _calcular_bandas_bollinger(self, simbolo: str) -> Optional[Dict[str, Decimal]]:
+    def _atualizar_janela(self, simbolo: str, preco: float):
+        """
+        Atualiza média e M2 da janela de `periodo` preços
+        
+        Ao substituir o preço mais antigo `y` pelo novo `x`:
+        media' = media + (x - y) / n e M2' = M2 + (x - y) * (x - media' + y - media).
+        A cada `periodo` substituições os valores são recalculados da janela.
+        """
+        linha = self._linha_simbolo[simbolo]
+        media = self._medias_janela.item(linha)
+        m2 = self._m2_janela.item(linha)
+        n = self._pontos_janela[simbolo]
+        
+        if n < self.periodo:
+            delta = preco - media
+            media += delta / (n + 1)
+            m2 += delta * (preco - media)
+            self._matriz_precos[linha, n] = preco
+            self._pontos_janela[simbolo] = n + 1
+        else:
+            inicio = self._inicio_buffer[simbolo]
+            antigo = self._matriz_precos.item(linha, inicio)
+            media_anterior = media
+            media += (preco - antigo) / n
+            m2 += (preco - antigo) * (preco - media + antigo - media_anterior)
+            if m2 < 0.0:
+                m2 = 0.0
+            self._matriz_precos[linha, inicio] = preco
+            inicio = (inicio + 1) % n
+            self._inicio_buffer[simbolo] = inicio
+            
+            # A cada volta completa do buffer, recalcular a partir da janela
+            # exata para que o erro de arredondamento não se acumule
+            if inicio == 0:
+                janela = self._matriz_precos[linha]
+                media = float(janela.mean())
+                m2 = float(np.square(janela - media).sum())
+        
+        self._medias_janela[linha] = media
+        self._m2_janela[linha] = m2
+    
+    def _calcular_bandas_bollinger(self, simbolo: str) -> Optional[Dict[str, float]]:
         """
         Calcula as Bandas de Bollinger para o símbolo
         
@@ -180,43 +302,95 @@ class EstrategiaBollinger(BaseStrategy):
             Dicionário com as bandas ou None se não for possível calcular
         """
         try:
-            dados = list(self.dados_historicos[simbolo])
-            
-            if len(dados) < self.periodo:
+            if self._pontos_janela[simbolo] < self.periodo:
                 return None
             
-            # Obter preços dos últimos períodos
-            precos = [ponto['preco'] for ponto in dados[-self.periodo:]]
-            
-            # Calcular média móvel simples (linha central)
-            media = sum(precos) / len(precos)
+            em_cache = self._cache_bandas.get(simbolo)
+            if em_cache is not None and em_cache[0] == self._atualizacoes[simbolo]:
+                return self._completar_bandas(em_cache[1])
             
-            # Calcular desvio padrão
-            variancia = sum((preco - media) ** 2 for preco in precos) / len(precos)
-            desvio_padrao = Decimal(str(math.sqrt(float(variancia))))
+            # Média móvel simples (linha central) e desvio padrão populacional da janela
+            linha = self._linha_simbolo[simbolo]
+            media = self._medias_janela.item(linha)
+            desvio_padrao, banda_superior, banda_inferior = _calcular_bandas(
+                media, self._m2_janela.item(linha), self.periodo, self._desvios_float
+            )
             
-            # Calcular bandas
-            banda_superior = media + (self.desvios_padrao * desvio_padrao)
-            banda_inferior = media - (self.desvios_padrao * desvio_padrao)
-            
-            # Preço atual
-            preco_atual = dados[-1]['preco']
-            
-            return {
-                'preco_atual': preco_atual,
-                'media': media,
-                'banda_superior': banda_superior,
-                'banda_inferior': banda_inferior,
-                'desvio_padrao': desvio_padrao,
-                'largura_banda': banda_superior - banda_inferior,
-                'posicao_percentual': (preco_atual - banda_inferior) / (banda_superior - banda_inferior) if banda_superior != banda_inferior else Decimal('0.5')
-            }
+            return self._completar_bandas(
+                self._montar_bandas(simbolo, media, desvio_padrao, banda_superior, banda_inferior)
+            )
             
         except Exception as e:
             self.logger.error(f"❌ Erro ao calcular Bandas de Bollinger: {str(e)}")
             return None
     
-    async def _gerar_sinal_bollinger(self, simbolo: str, bandas: Dict[str, Decimal], dados_simbolo: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _calcular_bandas_lote(self, simbolos: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Calcula as Bandas de Bollinger de vários símbolos em uma única operação vetorizada
+        
+        Args:
+            simbolos: Símbolos com dados suficientes
+            
+        Returns:
+            Dicionário simbolo -> bandas
+        """
+        resultado = {}
+        pendentes = []
+        for simbolo in simbolos:
+            em_cache = self._cache_bandas.get(simbolo)
+            if em_cache is not None and em_cache[0] == self._atualizacoes[simbolo]:
+                resultado[simbolo] = em_cache[1]
+            else:
+                pendentes.append(simbolo)
+        
+        if not pendentes:
+            return resultado
+        
+        linhas = [self._linha_simbolo[simbolo] for simbolo in pendentes]
+        medias = self._medias_janela[linhas]
+        desvios, superiores, inferiores = _calcular_bandas(
+            medias, self._m2_janela[linhas], self.periodo, self._desvios_float
+        )
+        
+        for simbolo, media, desvio_padrao, banda_superior, banda_inferior in zip(
+                pendentes, medias.tolist(), desvios.tolist(), superiores.tolist(), inferiores.tolist()):
+            resultado[simbolo] = self._montar_bandas(simbolo, media, desvio_padrao, banda_superior, banda_inferior)
+        
+        return resultado
+    
+    def _montar_bandas(self, simbolo: str, media: float, desvio_padrao: float,
+                       banda_superior: float, banda_inferior: float) -> Dict[str, float]:
+        """
+        Monta o dicionário de bandas do símbolo e o guarda no cache
+        
+        Largura e posição percentual ficam para `_completar_bandas`, chamado
+        apenas quando um sinal é emitido ou as bandas são consultadas.
+        """
+        bandas = {
+            'preco_atual': self._ultimo_preco[simbolo],
+            'media': media,
+            'banda_superior': banda_superior,
+            'banda_inferior': banda_inferior,
+            'desvio_padrao': desvio_padrao
+        }
+        self._cache_bandas[simbolo] = (self._atualizacoes[simbolo], bandas)
+        return bandas
+    
+    @staticmethod
+    def _completar_bandas(bandas: Dict[str, float]) -> Dict[str, float]:
+        """Acrescenta largura e posição percentual do preço às bandas"""
+        if 'largura_banda' not in bandas:
+            banda_superior = bandas['banda_superior']
+            banda_inferior = bandas['banda_inferior']
+            largura_banda = banda_superior - banda_inferior
+            bandas['largura_banda'] = largura_banda
+            bandas['posicao_percentual'] = (
+                (bandas['preco_atual'] - banda_inferior) / largura_banda if banda_superior != banda_inferior else 0.5
+            )
+        return bandas
+    
+    def _gerar_sinal_bollinger(self, simbolo: str, bandas: Dict[str, float], dados_simbolo: Dict[str, Any],
+                               timestamp: datetime) -> Optional[Dict[str, Any]]:
         """
         Gera sinal baseado nas Bandas de Bollinger
         
@@ -224,6 +398,7 @@ class EstrategiaBollinger(BaseStrategy):
             simbolo: Símbolo analisado
             bandas: Dados das bandas calculadas
             dados_simbolo: Dados do mercado
+            timestamp: Instante da análise em curso
             
         Returns:
             Sinal de trading ou None
@@ -248,40 +423,43 @@ class EstrategiaBollinger(BaseStrategy):
             
             # Estratégia de reversão à média (padrão)
             if self.usar_reversao:
-                acao, motivo, confianca = await self._sinal_reversao(
+                acao, motivo, confianca = self._sinal_reversao(
                     simbolo, preco_atual, bandas, volume, sinal_anterior, posicao_atual, posicao_anterior
                 )
             
             # Estratégia de breakout (alternativa)
             elif self.usar_breakout:
-                acao, motivo, confianca = await self._sinal_breakout(
+                acao, motivo, confianca = self._sinal_breakout(
                     simbolo, preco_atual, bandas, volume, sinal_anterior, posicao_atual, posicao_anterior
                 )
             
             # Verificar se deve gerar sinal
             if acao and confianca >= 0.3:  # Confiança mínima de 30%
                 self.sinais_anteriores[simbolo] = acao
+                motivo = _MOTIVOS_SINAL[motivo].format(
+                    preco=preco_atual, banda_superior=banda_superior, banda_inferior=banda_inferior
+                )
                 
                 self.logger.info(f"📈 Sinal Bollinger gerado: {acao} {simbolo} - {motivo}")
                 
+                self._completar_bandas(bandas)
+                parametros = self._modelo_parametros.copy()
+                parametros['banda_superior'] = banda_superior
+                parametros['banda_inferior'] = banda_inferior
+                parametros['media'] = media
+                parametros['posicao_percentual'] = bandas['posicao_percentual']
+                parametros['largura_banda'] = bandas['largura_banda']
+                parametros['volume'] = volume
+                
                 return {
                     'simbolo': simbolo,
                     'acao': acao,
-                    'preco': float(preco_atual),
-                    'timestamp': datetime.now(),
+                    'preco': preco_atual,
+                    'timestamp': timestamp,
                     'estrategia': 'Bollinger',
                     'motivo': motivo,
                     'confianca': confianca,
-                    'parametros': {
-                        'banda_superior': float(banda_superior),
-                        'banda_inferior': float(banda_inferior),
-                        'media': float(media),
-                        'posicao_percentual': float(bandas['posicao_percentual']),
-                        'largura_banda': float(bandas['largura_banda']),
-                        'periodo': self.periodo,
-                        'desvios_padrao': float(self.desvios_padrao),
-                        'volume': volume
-                    }
+                    'parametros': parametros
                 }
             
             return None
@@ -290,27 +468,18 @@ class EstrategiaBollinger(BaseStrategy):
             self.logger.error(f"❌ Erro ao gerar sinal Bollinger: {str(e)}")
             return None
     
-    def _determinar_posicao_banda(self, preco: Decimal, banda_superior: Decimal, 
-                                 banda_inferior: Decimal, media: Decimal) -> str:
+    def _determinar_posicao_banda(self, preco: float, banda_superior: float, 
+                                 banda_inferior: float, media: float) -> str:
         """Determina a posição do preço em relação às bandas"""
-        try:
-            margem = (banda_superior - banda_inferior) * self.percentual_banda
-            
-            if preco >= banda_superior - margem:
-                return 'SUPERIOR'
-            elif preco <= banda_inferior + margem:
-                return 'INFERIOR'
-            else:
-                return 'MEIO'
-                
-        except Exception:
-            return 'MEIO'
+        margem = (banda_superior - banda_inferior) * self._percentual_banda_float
+        return _POSICOES_BANDA[2 * (preco >= banda_superior - margem) + (preco <= banda_inferior + margem)]
     
-    async def _sinal_reversao(self, simbolo: str, preco: Decimal, bandas: Dict[str, Decimal], 
-                            volume: float, sinal_anterior: str, posicao_atual: str, 
-                            posicao_anterior: str) -> tuple:
-        """Gera sinais de reversão à média"""
+    def _sinal_reversao(self, simbolo: str, preco: float, bandas: Dict[str, float], 
+                      volume: float, sinal_anterior: str, posicao_atual: str, 
+                      posicao_anterior: str) -> tuple:
+        """Gera sinais de reversão à média (o motivo retornado é uma chave de _MOTIVOS_SINAL)"""
         try:
+            largura_banda = bandas['banda_superior'] - bandas['banda_inferior']
             acao = None
             motivo = ""
             confianca = 0.0
@@ -319,36 +488,45 @@ class EstrategiaBollinger(BaseStrategy):
             if (posicao_atual == 'INFERIOR' and (posicao_anterior != 'INFERIOR' or sinal_anterior != 'COMPRAR')):
                 self.toques_banda_inferior += 1
                 acao = 'COMPRAR'
-                motivo = f"Preço tocou banda inferior: ${preco:.2f} <= ${bandas['banda_inferior']:.2f}"
-                confianca = self._calcular_confianca_reversao_compra(preco, bandas, volume)
+                motivo = 'toque_inferior'
+                confianca = self._calcular_confianca(
+                    preco - bandas['banda_inferior'], largura_banda, bandas['media'], volume, False
+                )
             # Permitir sinal na primeira análise (quando posicao_anterior == 'MEIO' e sinal_anterior == 'NEUTRO')
             elif (posicao_atual == 'INFERIOR' and posicao_anterior == 'MEIO' and sinal_anterior == 'NEUTRO'):
                 self.toques_banda_inferior += 1
                 acao = 'COMPRAR'
-                motivo = f"Primeira análise: preço tocou banda inferior: ${preco:.2f} <= ${bandas['banda_inferior']:.2f}"
-                confianca = self._calcular_confianca_reversao_compra(preco, bandas, volume)
+                motivo = 'primeiro_toque_inferior'
+                confianca = self._calcular_confianca(
+                    preco - bandas['banda_inferior'], largura_banda, bandas['media'], volume, False
+                )
             # Sinal de venda: preço toca banda superior
             elif (posicao_atual == 'SUPERIOR' and (posicao_anterior != 'SUPERIOR' or sinal_anterior != 'VENDER')):
                 self.toques_banda_superior += 1
                 acao = 'VENDER'
-                motivo = f"Preço tocou banda superior: ${preco:.2f} >= ${bandas['banda_superior']:.2f}"
-                confianca = self._calcular_confianca_reversao_venda(preco, bandas, volume)
+                motivo = 'toque_superior'
+                confianca = self._calcular_confianca(
+                    preco - bandas['banda_superior'], largura_banda, bandas['media'], volume, False
+                )
             elif (posicao_atual == 'SUPERIOR' and posicao_anterior == 'MEIO' and sinal_anterior == 'NEUTRO'):
                 self.toques_banda_superior += 1
                 acao = 'VENDER'
-                motivo = f"Primeira análise: preço tocou banda superior: ${preco:.2f} >= ${bandas['banda_superior']:.2f}"
-                confianca = self._calcular_confianca_reversao_venda(preco, bandas, volume)
+                motivo = 'primeiro_toque_superior'
+                confianca = self._calcular_confianca(
+                    preco - bandas['banda_superior'], largura_banda, bandas['media'], volume, False
+                )
             return acao, motivo, confianca
             
         except Exception as e:
             self.logger.error(f"❌ Erro no sinal de reversão: {str(e)}")
             return None, "", 0.0
     
-    async def _sinal_breakout(self, simbolo: str, preco: Decimal, bandas: Dict[str, Decimal], 
-                            volume: float, sinal_anterior: str, posicao_atual: str, 
-                            posicao_anterior: str) -> tuple:
-        """Gera sinais de breakout"""
+    def _sinal_breakout(self, simbolo: str, preco: float, bandas: Dict[str, float], 
+                      volume: float, sinal_anterior: str, posicao_atual: str, 
+                      posicao_anterior: str) -> tuple:
+        """Gera sinais de breakout (o motivo retornado é uma chave de _MOTIVOS_SINAL)"""
         try:
+            largura_banda = bandas['banda_superior'] - bandas['banda_inferior']
             acao = None
             motivo = ""
             confianca = 0.0
@@ -358,16 +536,20 @@ class EstrategiaBollinger(BaseStrategy):
                 sinal_anterior != 'COMPRAR'):
                 
                 acao = 'COMPRAR'
-                motivo = f"Rompimento da banda superior: ${preco:.2f} > ${bandas['banda_superior']:.2f}"
-                confianca = self._calcular_confianca_breakout_compra(preco, bandas, volume)
+                motivo = 'rompimento_superior'
+                confianca = self._calcular_confianca(
+                    preco - bandas['banda_superior'], largura_banda, bandas['media'], volume, True
+                )
                 
             # Sinal de venda: rompimento da banda inferior
             elif (posicao_atual == 'INFERIOR' and posicao_anterior != 'INFERIOR' and 
                   sinal_anterior != 'VENDER'):
                 
                 acao = 'VENDER'
-                motivo = f"Rompimento da banda inferior: ${preco:.2f} < ${bandas['banda_inferior']:.2f}"
-                confianca = self._calcular_confianca_breakout_venda(preco, bandas, volume)
+                motivo = 'rompimento_inferior'
+                confianca = self._calcular_confianca(
+                    bandas['banda_inferior'] - preco, largura_banda, bandas['media'], volume, True
+                )
             
             return acao, motivo, confianca
             
@@ -375,93 +557,41 @@ class EstrategiaBollinger(BaseStrategy):
             self.logger.error(f"❌ Erro no sinal de breakout: {str(e)}")
             return None, "", 0.0
     
-    def _calcular_confianca_reversao_compra(self, preco: Decimal, bandas: Dict[str, Decimal], volume: float) -> float:
-        """Calcula confiança para sinal de compra por reversão"""
-        try:
-            # Confiança baseada na distância da banda inferior
-            distancia_banda = abs(preco - bandas['banda_inferior'])
-            largura_banda = bandas['largura_banda']
-            confianca_posicao = max(0, 0.5 - float(distancia_banda / largura_banda))
-            
-            # Confiança baseada na largura das bandas (volatilidade)
-            largura_normalizada = min(float(largura_banda / bandas['media']), 0.1)
-            confianca_volatilidade = largura_normalizada * 3  # Máximo 30%
-            
-            # Confiança baseada no volume
-            volume_normalizado = min(volume / float(self.volume_minimo), 3.0)
-            confianca_volume = min(volume_normalizado / 10.0, 0.2)  # Máximo 20%
-            
-            # Confiança total
-            confianca_total = confianca_posicao + confianca_volatilidade + confianca_volume
-            
-            return min(confianca_total, 1.0)
-            
-        except Exception:
-            return 0.3  # Confiança padrão
-    
-    def _calcular_confianca_reversao_venda(self, preco: Decimal, bandas: Dict[str, Decimal], volume: float) -> float:
-        """Calcula confiança para sinal de venda por reversão"""
-        try:
-            # Confiança baseada na distância da banda superior
-            distancia_banda = abs(preco - bandas['banda_superior'])
-            largura_banda = bandas['largura_banda']
-            confianca_posicao = max(0, 0.5 - float(distancia_banda / largura_banda))
-            
-            # Confiança baseada na largura das bandas
-            largura_normalizada = min(float(largura_banda / bandas['media']), 0.1)
-            confianca_volatilidade = largura_normalizada * 3  # Máximo 30%
-            
-            # Confiança baseada no volume
-            volume_normalizado = min(volume / float(self.volume_minimo), 3.0)
-            confianca_volume = min(volume_normalizado / 10.0, 0.2)  # Máximo 20%
-            
-            # Confiança total
-            confianca_total = confianca_posicao + confianca_volatilidade + confianca_volume
-            
-            return min(confianca_total, 1.0)
-            
-        except Exception:
-            return 0.3  # Confiança padrão
-    
-    def _calcular_confianca_breakout_compra(self, preco: Decimal, bandas: Dict[str, Decimal], volume: float) -> float:
-        """Calcula confiança para sinal de compra por breakout"""
-        try:
-            # Confiança baseada na força do rompimento
-            distancia_rompimento = preco - bandas['banda_superior']
-            largura_banda = bandas['largura_banda']
-            confianca_rompimento = min(float(distancia_rompimento / largura_banda) * 2, 0.4)
-            
-            # Confiança baseada no volume (mais importante em breakouts)
-            volume_normalizado = min(volume / float(self.volume_minimo), 5.0)
-            confianca_volume = min(volume_normalizado / 10.0, 0.4)  # Máximo 40%
-            
-            # Confiança total
-            confianca_total = confianca_rompimento + confianca_volume + 0.2  # Base 20%
-            
-            return min(confianca_total, 1.0)
-            
-        except Exception:
-            return 0.3  # Confiança padrão
+    def _normalizar_volume(self, volume: float, limite: float) -> float:
+        """Volume relativo ao mínimo, limitado a `limite`; sem mínimo configurado qualquer volume satura"""
+        if self._inverso_volume_minimo is None:
+            return limite if volume > 0 else 0.0
+        return min(volume * self._inverso_volume_minimo, limite)
     
-    def _calcular_confianca_breakout_venda(self, preco: Decimal, bandas: Dict[str, Decimal], volume: float) -> float:
-        """Calcula confiança para sinal de venda por breakout"""
-        try:
-            # Confiança baseada na força do rompimento
-            distancia_rompimento = bandas['banda_inferior'] - preco
-            largura_banda = bandas['largura_banda']
-            confianca_rompimento = min(float(distancia_rompimento / largura_banda) * 2, 0.4)
-            
-            # Confiança baseada no volume
-            volume_normalizado = min(volume / float(self.volume_minimo), 5.0)
-            confianca_volume = min(volume_normalizado / 10.0, 0.4)  # Máximo 40%
-            
-            # Confiança total
-            confianca_total = confianca_rompimento + confianca_volume + 0.2  # Base 20%
-            
-            return min(confianca_total, 1.0)
+    def _calcular_confianca(self, distancia: float, largura_banda: float, media: float,
+                            volume: float, rompimento: bool) -> float:
+        """
+        Calcula a confiança de um sinal de reversão ou de rompimento
+        
+        Args:
+            distancia: Preço menos a banda de referência (no sentido do rompimento, se for o caso)
+            largura_banda: Distância entre as bandas
+            media: Linha central das bandas
+            volume: Volume de 24h
+            rompimento: True para sinais de breakout
             
-        except Exception:
-            return 0.3  # Confiança padrão
+        Returns:
+            Confiança entre 0 e 1
+        """
+        if not largura_banda:
+            return 0.3  # Bandas sem largura: confiança padrão
+        
+        if rompimento:
+            # Força do rompimento e volume (mais importante em breakouts), base de 20%
+            confianca_rompimento = min(distancia / largura_banda * 2, 0.4)
+            confianca_volume = min(self._normalizar_volume(volume, 5.0) / 10.0, 0.4)  # Máximo 40%
+            return min(confianca_rompimento + confianca_volume + 0.2, 1.0)
+        
+        # Proximidade da banda, largura das bandas (volatilidade) e volume
+        confianca_posicao = max(0, 0.5 - abs(distancia) / largura_banda)
+        confianca_volatilidade = min(largura_banda / media, 0.1) * 3  # Máximo 30%
+        confianca_volume = min(self._normalizar_volume(volume, 3.0) / 10.0, 0.2)  # Máximo 20%
+        return min(confianca_posicao + confianca_volatilidade + confianca_volume, 1.0)
     
     async def obter_status(self) -> Dict[str, Any]:
         """
@@ -476,23 +606,30 @@ class EstrategiaBollinger(BaseStrategy):
             dados_suficientes = {}
             
             for simbolo in self.simbolos:
-                bandas = await self._calcular_bandas_bollinger(simbolo)
+                # Reaproveitar as bandas do último cálculo se nenhum preço chegou desde então
+                em_cache = self._cache_bandas.get(simbolo)
+                if em_cache is not None and em_cache[0] == self._atualizacoes[simbolo]:
+                    bandas = self._completar_bandas(em_cache[1])
+                else:
+                    bandas = self._calcular_bandas_bollinger(simbolo)
+                
                 if bandas:
                     bandas_atuais[simbolo] = {
-                        'preco_atual': float(bandas['preco_atual']),
-                        'banda_superior': float(bandas['banda_superior']),
-                        'banda_inferior': float(bandas['banda_inferior']),
-                        'media': float(bandas['media']),
-                        'posicao_percentual': float(bandas['posicao_percentual']),
-                        'largura_banda': float(bandas['largura_banda'])
+                        'preco_atual': bandas['preco_atual'],
+                        'banda_superior': bandas['banda_superior'],
+                        'banda_inferior': bandas['banda_inferior'],
+                        'media': bandas['media'],
+                        'posicao_percentual': bandas['posicao_percentual'],
+                        'largura_banda': bandas['largura_banda']
                     }
                 else:
                     bandas_atuais[simbolo] = None
                 
+                pontos_dados = len(self.dados_historicos[simbolo])
                 dados_suficientes[simbolo] = {
-                    'pontos_dados': len(self.dados_historicos[simbolo]),
+                    'pontos_dados': pontos_dados,
                     'minimo_necessario': self.periodo,
-                    'suficiente': len(self.dados_historicos[simbolo]) >= self.periodo
+                    'suficiente': pontos_dados >= self.periodo
                 }
             
             return {
@@ -500,7 +637,7 @@ class EstrategiaBollinger(BaseStrategy):
                 'ativa': self.ativa,
                 'simbolos_monitorados': len(self.simbolos),
                 'periodo': self.periodo,
-                'desvios_padrao': float(self.desvios_padrao),
+                'desvios_padrao': self._desvios_float,
                 'modo': 'Reversão' if self.usar_reversao else 'Breakout',
                 'total_sinais_gerados': self.total_sinais_gerados,
                 'sinais_compra': self.sinais_compra,
@@ -538,9 +675,9 @@ class EstrategiaBollinger(BaseStrategy):
                 'taxa_sinais_venda': (self.sinais_venda / max(self.total_sinais_gerados, 1)) * 100,
                 'toques_banda_superior': self.toques_banda_superior,
                 'toques_banda_inferior': self.toques_banda_inferior,
-                'simbolos_ativos': len([s for s in self.simbolos if len(self.dados_historicos[s]) > 0]),
-                'dados_historicos_total': sum(len(dados) for dados in self.dados_historicos.values()),
-                'bandas_armazenadas': sum(len(bandas) for bandas in self.bandas_historicas.values()),
+                'simbolos_ativos': self._simbolos_com_dados,
+                'dados_historicos_total': self._total_pontos,
+                'bandas_armazenadas': self._total_bandas,
                 'ultima_atualizacao': self.ultima_analise.isoformat() if self.ultima_analise else None
             }
             
@@ -4,15 +4,32 @@ Sistema de Trading de Criptomoedas - Português Brasileiro
 """
 
 import asyncio
+import math
 from typing import Dict, List, Any, Optional
-from decimal import Decimal
 from datetime import datetime
 from collections import deque
 
+import numpy as np
+
 from src.strategies.base_strategy import BaseStrategy
 from src.utils.logger import obter_logger, log_performance
 
 
+def _suavizar_wilder(media, valor, periodo: int):
+    """Um passo da média suavizada de Wilder: (M * (n - 1) + v) / n"""
+    return (media * (periodo - 1) + valor) / periodo
+
+
+def _rsi_de_medias(media_ganhos: np.ndarray, media_perdas: np.ndarray) -> np.ndarray:
+    """
+    RSI a partir das médias de ganhos e perdas (uma posição por símbolo)
+    
+    Retorna 100 onde a média de perdas é zero.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(media_perdas == 0, 100.0, 100.0 - 100.0 / (1.0 + media_ganhos / media_perdas))
+
+
 class EstrategiaRSI(BaseStrategy):
     # Métodos abstratos mínimos para compatibilidade com testes
     def _analisar_especifica(self, *args, **kwargs):
@@ -47,15 +64,24 @@ class EstrategiaRSI(BaseStrategy):
         
         # Parâmetros da estratégia
         self.periodo_rsi = configuracao.get('periodo_rsi', 14)
-        self.nivel_sobrecompra = Decimal(str(configuracao.get('nivel_sobrecompra', 70)))
-        self.nivel_sobrevenda = Decimal(str(configuracao.get('nivel_sobrevenda', 30)))
+        self.nivel_sobrecompra = float(configuracao.get('nivel_sobrecompra', 70))
+        self.nivel_sobrevenda = float(configuracao.get('nivel_sobrevenda', 30))
         self.simbolos = configuracao.get('simbolos', ['BTC/USDT'])
-        self.volume_minimo = Decimal(str(configuracao.get('volume_minimo', 1000)))
+        self.volume_minimo = float(configuracao.get('volume_minimo', 1000))
+        self._inverso_volume_minimo = 1.0 / self.volume_minimo if self.volume_minimo else None
         
         # Dados históricos para cálculo do RSI
         self.dados_historicos = {simbolo: deque(maxlen=self.periodo_rsi + 10) for simbolo in self.simbolos}
         self.valores_rsi = {simbolo: deque(maxlen=100) for simbolo in self.simbolos}
         
+        # Médias suavizadas de Wilder, uma linha por símbolo, atualizadas em lote
+        num_simbolos = len(self.simbolos)
+        self._linha_simbolo = {simbolo: linha for linha, simbolo in enumerate(self.simbolos)}
+        self._ultimo_preco_rsi = np.full(num_simbolos, np.nan)
+        self._media_ganhos = np.zeros(num_simbolos)
+        self._media_perdas = np.zeros(num_simbolos)
+        self._variacoes = np.zeros(num_simbolos, dtype=np.int64)
+        
         # Estado da estratégia
         self.sinais_anteriores = {simbolo: 'NEUTRO' for simbolo in self.simbolos}
         self.ultima_analise = None
@@ -67,8 +93,8 @@ class EstrategiaRSI(BaseStrategy):
         
         self.logger.info("📊 Estratégia RSI inicializada:")
         self.logger.info(f"  • Período RSI: {self.periodo_rsi}")
-        self.logger.info(f"  • Sobrecompra: {self.nivel_sobrecompra}")
-        self.logger.info(f"  • Sobrevenda: {self.nivel_sobrevenda}")
+        self.logger.info(f"  • Sobrecompra: {self.nivel_sobrecompra:g}")
+        self.logger.info(f"  • Sobrevenda: {self.nivel_sobrevenda:g}")
         self.logger.info(f"  • Símbolos: {', '.join(self.simbolos)}")
     
     @log_performance
@@ -86,6 +112,9 @@ class EstrategiaRSI(BaseStrategy):
         self.ultima_analise = datetime.now()
         
         try:
+            # Registrar o tick de todos os símbolos válidos
+            simbolos_lote = []
+            precos_lote = []
             for simbolo in self.simbolos:
                 if simbolo not in dados_mercado:
                     continue
@@ -96,23 +125,29 @@ class EstrategiaRSI(BaseStrategy):
                 if not self._validar_dados(dados_simbolo):
                     continue
                 
-                # Atualizar dados históricos
-                await self._atualizar_dados_historicos(simbolo, dados_simbolo)
-                
-                # Verificar se temos dados suficientes
-                if len(self.dados_historicos[simbolo]) < self.periodo_rsi:
+                simbolos_lote.append(simbolo)
+                precos_lote.append(self._registrar_historico(simbolo, dados_simbolo))
+            
+            if not simbolos_lote:
+                return sinais
+            
+            # Atualizar médias e calcular o RSI de todos os símbolos de uma vez
+            linhas = np.array([self._linha_simbolo[simbolo] for simbolo in simbolos_lote])
+            self._atualizar_medias_lote(linhas, np.array(precos_lote, dtype=np.float64))
+            rsi_lote = self._calcular_rsi_lote(linhas)
+            
+            for simbolo, rsi_atual in zip(simbolos_lote, rsi_lote.tolist()):
+                # Dados insuficientes para o RSI
+                if math.isnan(rsi_atual):
                     continue
                 
-                # Calcular RSI
-                rsi_atual = await self._calcular_rsi(simbolo)
-                if rsi_atual is None:
-                    continue
+                dados_simbolo = dados_mercado[simbolo]
                 
                 # Armazenar valor RSI
                 self.valores_rsi[simbolo].append(rsi_atual)
                 
                 # Gerar sinais baseados no RSI
-                sinal = await self._gerar_sinal_rsi(simbolo, rsi_atual, dados_simbolo)
+                sinal = self._gerar_sinal_rsi(simbolo, rsi_atual, dados_simbolo)
                 if sinal:
                     sinais.append(sinal)
                     self.total_sinais_gerados += 1
@@ -136,7 +171,7 @@ class EstrategiaRSI(BaseStrategy):
             if preco is None or preco <= 0:
                 return False
             
-            if volume < float(self.volume_minimo):
+            if volume < self.volume_minimo:
                 return False
             
             return True
@@ -144,23 +179,69 @@ class EstrategiaRSI(BaseStrategy):
         except Exception:
             return False
     
-    async def _atualizar_dados_historicos(self, simbolo: str, dados_simbolo: Dict[str, Any]):
+    def _atualizar_dados_historicos(self, simbolo: str, dados_simbolo: Dict[str, Any]):
         """Atualiza dados históricos para o símbolo"""
         try:
-            preco = Decimal(str(dados_simbolo['preco']))
-            timestamp = dados_simbolo.get('timestamp', datetime.now())
-            
-            ponto_dados = {
-                'preco': preco,
-                'timestamp': timestamp
-            }
-            
-            self.dados_historicos[simbolo].append(ponto_dados)
+            preco = self._registrar_historico(simbolo, dados_simbolo)
+            linha = self._linha_simbolo[simbolo]
+            self._atualizar_medias_lote(np.array([linha]), np.array([preco], dtype=np.float64))
             
         except Exception as e:
             self.logger.error(f"❌ Erro ao atualizar dados históricos: {str(e)}")
     
-    async def _calcular_rsi(self, simbolo: str) -> Optional[Decimal]:
+    def _registrar_historico(self, simbolo: str, dados_simbolo: Dict[str, Any]) -> float:
+        """Anexa o ponto ao histórico do símbolo e retorna o preço como float"""
+        preco = float(dados_simbolo['preco'])
+        timestamp = dados_simbolo.get('timestamp') or datetime.now()
+        
+        self.dados_historicos[simbolo].append({'preco': preco, 'timestamp': timestamp})
+        return preco
+    
+    def _atualizar_medias_lote(self, linhas: np.ndarray, precos: np.ndarray):
+        """
+        Atualiza as médias de ganhos e perdas das linhas com os novos preços
+        
+        As primeiras periodo_rsi variações de cada símbolo são acumuladas para a
+        média simples inicial; a partir daí aplica-se a suavização de Wilder.
+        """
+        anteriores = self._ultimo_preco_rsi[linhas]
+        self._ultimo_preco_rsi[linhas] = precos
+        
+        # O primeiro preço de cada símbolo não gera variação
+        com_anterior = ~np.isnan(anteriores)
+        linhas = linhas[com_anterior]
+        variacoes = precos[com_anterior] - anteriores[com_anterior]
+        ganhos = np.maximum(variacoes, 0.0)
+        perdas = np.maximum(-variacoes, 0.0)
+        n = self.periodo_rsi
+        
+        # Fase inicial: acumular somas até completar o período
+        iniciais = self._variacoes[linhas] < n
+        if iniciais.any():
+            linhas_iniciais = linhas[iniciais]
+            self._media_ganhos[linhas_iniciais] += ganhos[iniciais]
+            self._media_perdas[linhas_iniciais] += perdas[iniciais]
+            self._variacoes[linhas_iniciais] += 1
+            completas = linhas_iniciais[self._variacoes[linhas_iniciais] == n]
+            self._media_ganhos[completas] /= n
+            self._media_perdas[completas] /= n
+        
+        # Suavização de Wilder
+        suavizadas = ~iniciais
+        if suavizadas.any():
+            linhas_suavizadas = linhas[suavizadas]
+            self._media_ganhos[linhas_suavizadas] = _suavizar_wilder(
+                self._media_ganhos[linhas_suavizadas], ganhos[suavizadas], n)
+            self._media_perdas[linhas_suavizadas] = _suavizar_wilder(
+                self._media_perdas[linhas_suavizadas], perdas[suavizadas], n)
+    
+    def _calcular_rsi_lote(self, linhas: np.ndarray) -> np.ndarray:
+        """Calcula o RSI das linhas; NaN onde ainda não há dados suficientes"""
+        rsi = _rsi_de_medias(self._media_ganhos[linhas], self._media_perdas[linhas])
+        rsi[self._variacoes[linhas] < self.periodo_rsi] = np.nan
+        return rsi
+    
+    def _calcular_rsi(self, simbolo: str) -> Optional[float]:
         """
         Calcula o RSI para o símbolo
         
@@ -171,40 +252,17 @@ class EstrategiaRSI(BaseStrategy):
             Valor do RSI ou None se não for possível calcular
         """
         try:
-            dados = list(self.dados_historicos[simbolo])
-            
-            if len(dados) < self.periodo_rsi + 1:
+            linha = self._linha_simbolo[simbolo]
+            if self._variacoes[linha] < self.periodo_rsi:
                 return None
             
-            # Calcular mudanças de preço
-            mudancas = []
-            for i in range(1, len(dados)):
-                mudanca = dados[i]['preco'] - dados[i-1]['preco']
-                mudancas.append(mudanca)
-            
-            # Separar ganhos e perdas
-            ganhos = [max(mudanca, Decimal('0')) for mudanca in mudancas[-self.periodo_rsi:]]
-            perdas = [abs(min(mudanca, Decimal('0'))) for mudanca in mudancas[-self.periodo_rsi:]]
-            
-            # Calcular médias
-            media_ganhos = sum(ganhos) / len(ganhos) if ganhos else Decimal('0')
-            media_perdas = sum(perdas) / len(perdas) if perdas else Decimal('0')
-            
-            # Evitar divisão por zero
-            if media_perdas == 0:
-                return Decimal('100')
-            
-            # Calcular RSI
-            rs = media_ganhos / media_perdas
-            rsi = Decimal('100') - (Decimal('100') / (Decimal('1') + rs))
-            
-            return rsi
+            return float(_rsi_de_medias(self._media_ganhos[linha], self._media_perdas[linha]))
             
         except Exception as e:
             self.logger.error(f"❌ Erro ao calcular RSI: {str(e)}")
             return None
     
-    async def _gerar_sinal_rsi(self, simbolo: str, rsi: Decimal, dados_simbolo: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _gerar_sinal_rsi(self, simbolo: str, rsi: float, dados_simbolo: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Gera sinal baseado no valor do RSI
         
@@ -217,7 +275,7 @@ class EstrategiaRSI(BaseStrategy):
             Sinal de trading ou None
         """
         try:
-            preco_atual = Decimal(str(dados_simbolo['preco']))
+            preco_atual = float(dados_simbolo['preco'])
             volume = dados_simbolo.get('volume_24h', 0)
             
             sinal_anterior = self.sinais_anteriores[simbolo]
@@ -229,13 +287,13 @@ class EstrategiaRSI(BaseStrategy):
             if rsi <= self.nivel_sobrevenda and sinal_anterior != 'COMPRAR':
                 # Condição de sobrevenda - sinal de compra
                 acao = 'COMPRAR'
-                motivo = f"RSI em sobrevenda: {rsi:.2f} <= {self.nivel_sobrevenda}"
+                motivo = f"RSI em sobrevenda: {rsi:.2f} <= {self.nivel_sobrevenda:g}"
                 confianca = self._calcular_confianca_compra(rsi, volume)
                 
             elif rsi >= self.nivel_sobrecompra and sinal_anterior != 'VENDER':
                 # Condição de sobrecompra - sinal de venda
                 acao = 'VENDER'
-                motivo = f"RSI em sobrecompra: {rsi:.2f} >= {self.nivel_sobrecompra}"
+                motivo = f"RSI em sobrecompra: {rsi:.2f} >= {self.nivel_sobrecompra:g}"
                 confianca = self._calcular_confianca_venda(rsi, volume)
             
             # Verificar se deve gerar sinal
@@ -247,16 +305,16 @@ class EstrategiaRSI(BaseStrategy):
                 return {
                     'simbolo': simbolo,
                     'acao': acao,
-                    'preco': float(preco_atual),
+                    'preco': preco_atual,
                     'timestamp': datetime.now(),
                     'estrategia': 'RSI',
                     'motivo': motivo,
                     'confianca': confianca,
                     'parametros': {
-                        'rsi': float(rsi),
+                        'rsi': rsi,
                         'periodo': self.periodo_rsi,
-                        'sobrecompra': float(self.nivel_sobrecompra),
-                        'sobrevenda': float(self.nivel_sobrevenda),
+                        'sobrecompra': self.nivel_sobrecompra,
+                        'sobrevenda': self.nivel_sobrevenda,
                         'volume': volume
                     }
                 }
@@ -271,15 +329,21 @@ class EstrategiaRSI(BaseStrategy):
             self.logger.error(f"❌ Erro ao gerar sinal RSI: {str(e)}")
             return None
     
-    def _calcular_confianca_compra(self, rsi: Decimal, volume: float) -> float:
+    def _normalizar_volume(self, volume: float) -> float:
+        """Volume relativo ao mínimo, limitado a 3x; sem mínimo configurado qualquer volume satura"""
+        if self._inverso_volume_minimo is None:
+            return 3.0 if volume > 0 else 0.0
+        return min(volume * self._inverso_volume_minimo, 3.0)
+    
+    def _calcular_confianca_compra(self, rsi: float, volume: float) -> float:
         """Calcula confiança para sinal de compra"""
         try:
             # Confiança baseada em quão baixo está o RSI
-            distancia_sobrevenda = max(0, float(self.nivel_sobrevenda - rsi))
+            distancia_sobrevenda = max(0.0, self.nivel_sobrevenda - float(rsi))
             confianca_rsi = min(distancia_sobrevenda / 20.0, 0.5)  # Máximo 50%
             
             # Confiança baseada no volume
-            volume_normalizado = min(volume / float(self.volume_minimo), 3.0)
+            volume_normalizado = self._normalizar_volume(volume)
             confianca_volume = min(volume_normalizado / 6.0, 0.3)  # Máximo 30%
             
             # Confiança total
@@ -290,15 +354,15 @@ class EstrategiaRSI(BaseStrategy):
         except Exception:
             return 0.3  # Confiança padrão
     
-    def _calcular_confianca_venda(self, rsi: Decimal, volume: float) -> float:
+    def _calcular_confianca_venda(self, rsi: float, volume: float) -> float:
         """Calcula confiança para sinal de venda"""
         try:
             # Confiança baseada em quão alto está o RSI
-            distancia_sobrecompra = max(0, float(rsi - self.nivel_sobrecompra))
+            distancia_sobrecompra = max(0.0, float(rsi) - self.nivel_sobrecompra)
             confianca_rsi = min(distancia_sobrecompra / 20.0, 0.5)  # Máximo 50%
             
             # Confiança baseada no volume
-            volume_normalizado = min(volume / float(self.volume_minimo), 3.0)
+            volume_normalizado = self._normalizar_volume(volume)
             confianca_volume = min(volume_normalizado / 6.0, 0.3)  # Máximo 30%
             
             # Confiança total
@@ -322,8 +386,8 @@ class EstrategiaRSI(BaseStrategy):
             dados_suficientes = {}
             
             for simbolo in self.simbolos:
-                rsi = await self._calcular_rsi(simbolo)
-                rsi_atual[simbolo] = float(rsi) if rsi else None
+                rsi = self._calcular_rsi(simbolo)
+                rsi_atual[simbolo] = rsi if rsi else None
                 
                 dados_suficientes[simbolo] = {
                     'pontos_dados': len(self.dados_historicos[simbolo]),
@@ -336,8 +400,8 @@ class EstrategiaRSI(BaseStrategy):
                 'ativa': self.ativa,
                 'simbolos_monitorados': len(self.simbolos),
                 'periodo_rsi': self.periodo_rsi,
-                'nivel_sobrecompra': float(self.nivel_sobrecompra),
-                'nivel_sobrevenda': float(self.nivel_sobrevenda),
+                'nivel_sobrecompra': self.nivel_sobrecompra,
+                'nivel_sobrevenda': self.nivel_sobrevenda,
                 'total_sinais_gerados': self.total_sinais_gerados,
                 'sinais_compra': self.sinais_compra,
                 'sinais_venda': self.sinais_venda,
@@ -387,6 +451,11 @@ class EstrategiaRSI(BaseStrategy):
                 self.valores_rsi[simbolo].clear()
                 self.sinais_anteriores[simbolo] = 'NEUTRO'
             
+            self._ultimo_preco_rsi.fill(np.nan)
+            self._media_ganhos.fill(0.0)
+            self._media_perdas.fill(0.0)
+            self._variacoes.fill(0)
+            
             self.total_sinais_gerados = 0
             self.sinais_compra = 0
             self.sinais_venda = 0
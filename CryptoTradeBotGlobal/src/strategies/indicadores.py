@@ -0,0 +1,364 @@
+"""
+Indicadores Técnicos Vetorizados para CryptoTradeBotGlobal
+Kernels NumPy sobre arrays float64, sem objetos pandas intermediários
+
+Os kernels em lote operam sobre o último eixo: aceitam uma série (n,) ou
+uma matriz (símbolos, n) com vários ativos alinhados.
+"""
+
+from collections import deque
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter, lfilter_zi
+
+
+def media_movel(valores: np.ndarray, periodo: int) -> np.ndarray:
+    """
+    Média móvel simples
+
+    Args:
+        valores: Série de valores (float64)
+        periodo: Tamanho da janela
+
+    Returns:
+        Array do mesmo tamanho, com NaN nas primeiras `periodo - 1` posições
+    """
+    saida = np.full(valores.shape, np.nan)
+    if valores.shape[-1] >= periodo:
+        base = valores[..., :1]
+        np.divide(_somas_janela(valores - base, periodo), periodo, out=saida[..., periodo - 1:])
+        saida[..., periodo - 1:] += base
+    return saida
+
+
+def media_movel_exponencial(valores: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Média móvel exponencial recursiva: y[i] = alpha * x[i] + (1 - alpha) * y[i-1]
+
+    A recorrência roda em C via `lfilter`, partindo de y[0] = x[0].
+
+    Args:
+        valores: Série de valores (float64)
+        alpha: Fator de suavização (2 / (span + 1) ou 1 / periodo no caso de Wilder)
+
+    Returns:
+        Array com a média exponencial
+    """
+    if valores.shape[-1] == 0:
+        return np.empty(valores.shape)
+    saida, _ = lfilter([alpha], [1.0, alpha - 1.0], valores, axis=-1, zi=(1.0 - alpha) * valores[..., :1])
+    return saida
+
+
+def rsi(precos: np.ndarray, periodo: int = 14) -> np.ndarray:
+    """
+    Índice de Força Relativa com suavização de Wilder
+
+    A primeira média de ganhos/perdas é a média simples dos `periodo`
+    primeiros deltas; as seguintes usam a recorrência com alpha = 1 / periodo.
+
+    Args:
+        precos: Preços de fechamento (float64)
+        periodo: Período do RSI
+
+    Returns:
+        Array do mesmo tamanho, com NaN nas primeiras `periodo` posições
+    """
+    saida = np.full(precos.shape, np.nan)
+    if precos.shape[-1] <= periodo:
+        return saida
+
+    media_ganhos, media_perdas = _medias_wilder(precos, periodo)
+
+    # 100 - 100 / (1 + G/P) == 100 * G / (G + P); sem movimento o RSI fica neutro
+    total = media_ganhos + media_perdas
+    np.divide(100.0 * media_ganhos, total, out=saida[..., periodo:], where=total > 0)
+    saida[..., periodo:][total <= 0] = 50.0
+    return saida
+
+
+def _medias_wilder(precos: np.ndarray, periodo: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Médias suavizadas de ganhos e perdas a partir do índice `periodo` (requer mais de `periodo` preços)"""
+    # Ganhos e perdas empilhados (2, ..., n) para semear e suavizar numa só passada
+    movimentos = np.empty((2,) + precos.shape[:-1] + (precos.shape[-1] - 1,))
+    np.subtract(precos[..., 1:], precos[..., :-1], out=movimentos[0])
+    np.negative(movimentos[0], out=movimentos[1])
+    np.maximum(movimentos, 0.0, out=movimentos)
+
+    alpha = 1.0 / periodo
+    medias = np.empty(movimentos.shape[:-1] + (movimentos.shape[-1] - periodo + 1,))
+    medias[..., 0] = movimentos[..., :periodo].mean(axis=-1)
+    medias[..., 1:], _ = lfilter([alpha], [1.0, alpha - 1.0], movimentos[..., periodo:], axis=-1,
+                                 zi=(1.0 - alpha) * medias[..., :1])
+    return medias[0], medias[1]
+
+
+def bandas_bollinger(precos: np.ndarray, periodo: int = 20,
+                     desvios: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bandas de Bollinger
+
+    Args:
+        precos: Preços de fechamento (float64)
+        periodo: Janela da média e do desvio padrão amostral
+        desvios: Número de desvios padrão das bandas
+
+    Returns:
+        Tupla (banda_superior, media, banda_inferior)
+    """
+    media = np.full(precos.shape, np.nan)
+    desvio = np.full(precos.shape, np.nan)
+    if precos.shape[-1] >= periodo:
+        # Cada janela é centrada na própria média antes de elevar ao
+        # quadrado; somas acumuladas de x e x^2 sobre a série inteira perdem
+        # precisão com o comprimento e a deriva dos preços
+        janelas = sliding_window_view(precos, periodo, axis=-1)
+        np.mean(janelas, axis=-1, out=media[..., periodo - 1:])
+        np.std(janelas, axis=-1, ddof=1, out=desvio[..., periodo - 1:])
+
+    return media + desvios * desvio, media, media - desvios * desvio
+
+
+def _somas_janela(valores: np.ndarray, periodo: int) -> np.ndarray:
+    """Soma de cada janela de tamanho `periodo` ao longo do último eixo (n - periodo + 1 janelas)"""
+    acumulado = np.cumsum(valores, axis=-1)
+    acumulado[..., periodo:] -= acumulado[..., :-periodo].copy()
+    return acumulado[..., periodo - 1:]
+
+
+def volatilidade(precos: np.ndarray, periodos: int = 20) -> float:
+    """
+    Desvio padrão amostral dos últimos `periodos` retornos simples
+
+    Só a cauda de `periodos + 1` preços é lida.
+
+    Args:
+        precos: Preços de fechamento (float64)
+        periodos: Número de retornos considerados
+
+    Returns:
+        Volatilidade atual (NaN se não houver preços suficientes)
+    """
+    if precos.size < periodos + 1:
+        return float('nan')
+    cauda = precos[-(periodos + 1):]
+    retornos = np.diff(cauda) / cauda[:-1]
+    return float(retornos.std(ddof=1))
+
+
+def macd(precos: np.ndarray, rapida: int = 12, lenta: int = 26,
+         sinal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD com médias exponenciais recursivas
+
+    A diferença das duas médias é um único filtro de segunda ordem
+    (af / (1 - rf z^-1) - al / (1 - rl z^-1)), então a linha MACD sai de
+    uma só passada sobre os preços, sem materializar as duas EMAs.
+
+    Args:
+        precos: Preços de fechamento (float64)
+        rapida: Span da média rápida
+        lenta: Span da média lenta
+        sinal: Span da linha de sinal
+
+    Returns:
+        Tupla (macd, linha_sinal, histograma)
+    """
+    if precos.shape[-1] == 0:
+        return np.empty(precos.shape), np.empty(precos.shape), np.empty(precos.shape)
+
+    af = 2.0 / (rapida + 1)
+    al = 2.0 / (lenta + 1)
+    rf = 1.0 - af
+    rl = 1.0 - al
+    b = [af - al, al * rf - af * rl]
+    a = [1.0, -(rf + rl), rf * rl]
+    # Estado estacionário para preço constante = ambas as EMAs em precos[0]
+    linha_macd, _ = lfilter(b, a, precos, axis=-1, zi=lfilter_zi(b, a) * precos[..., :1])
+
+    linha_sinal = media_movel_exponencial(linha_macd, 2.0 / (sinal + 1))
+    histograma = np.subtract(linha_macd, linha_sinal)
+    return linha_macd, linha_sinal, histograma
+
+
+# ==================== INDICADORES INCREMENTAIS ====================
+
+
+class MediaMovelIncremental:
+    """
+    Média móvel simples atualizada em O(1) por novo valor
+
+    Mantém a janela e a soma corrente: soma += novo - mais_antigo.
+    """
+
+    __slots__ = ('periodo', 'janela', 'soma')
+
+    def __init__(self, periodo: int):
+        self.periodo = periodo
+        self.janela: deque = deque(maxlen=periodo)
+        self.soma = 0.0
+
+    def aquecer(self, valores: np.ndarray) -> float:
+        """Reconstrói o estado a partir do histórico e retorna o valor atual"""
+        cauda = valores[-self.periodo:]
+        self.janela = deque(cauda.tolist(), maxlen=self.periodo)
+        self.soma = float(cauda.sum())
+        return self.valor()
+
+    def atualizar(self, valor: float) -> float:
+        """Incorpora um novo valor e retorna a média atual"""
+        if len(self.janela) == self.periodo:
+            self.soma -= self.janela[0]
+        self.janela.append(valor)
+        self.soma += valor
+        return self.valor()
+
+    def valor(self) -> float:
+        """Média atual (NaN enquanto a janela não estiver completa)"""
+        if len(self.janela) < self.periodo:
+            return float('nan')
+        return self.soma / self.periodo
+
+
+class MediaExponencialIncremental:
+    """Média móvel exponencial: s = alpha * x + (1 - alpha) * s_anterior"""
+
+    __slots__ = ('alpha', 'media')
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.media = float('nan')
+
+    def aquecer(self, valores: np.ndarray) -> float:
+        """Reconstrói o estado a partir do histórico e retorna o valor atual"""
+        if valores.size:
+            self.media = float(media_movel_exponencial(valores, self.alpha)[-1])
+        return self.media
+
+    def atualizar(self, valor: float) -> float:
+        """Incorpora um novo valor e retorna a média atual"""
+        if self.media != self.media:  # primeiro valor (NaN)
+            self.media = valor
+        else:
+            self.media += self.alpha * (valor - self.media)
+        return self.media
+
+
+class BollingerIncremental:
+    """
+    Bandas de Bollinger com média e M2 de Welford sobre janela deslizante
+
+    Ao substituir o valor mais antigo `y` pelo novo `x`:
+    media' = media + (x - y) / n e M2' = M2 + (x - y) * (x - media' + y - media).
+    A cada `periodo` substituições média e M2 são recalculados da janela,
+    para que o erro de arredondamento não se acumule.
+    """
+
+    __slots__ = ('periodo', 'desvios', 'janela', 'media', 'm2', 'substituicoes')
+
+    def __init__(self, periodo: int, desvios: float = 2.0):
+        self.periodo = periodo
+        self.desvios = desvios
+        self.janela: deque = deque(maxlen=periodo)
+        self.media = 0.0
+        self.m2 = 0.0
+        self.substituicoes = 0
+
+    def aquecer(self, valores: np.ndarray) -> Tuple[float, float, float]:
+        """Reconstrói o estado a partir do histórico e retorna as bandas atuais"""
+        cauda = valores[-self.periodo:]
+        self.janela = deque(cauda.tolist(), maxlen=self.periodo)
+        self.media = float(cauda.mean()) if cauda.size else 0.0
+        self.m2 = float(((cauda - self.media) ** 2).sum())
+        self.substituicoes = 0
+        return self.valor()
+
+    def atualizar(self, valor: float) -> Tuple[float, float, float]:
+        """Incorpora um novo valor e retorna (banda_superior, media, banda_inferior)"""
+        n = len(self.janela)
+        if n < self.periodo:
+            self.janela.append(valor)
+            delta = valor - self.media
+            self.media += delta / (n + 1)
+            self.m2 += delta * (valor - self.media)
+        else:
+            antigo = self.janela[0]
+            self.janela.append(valor)
+            self.substituicoes += 1
+            if self.substituicoes == self.periodo:
+                self._recalcular()
+            else:
+                media_anterior = self.media
+                self.media += (valor - antigo) / n
+                self.m2 += (valor - antigo) * (valor - self.media + antigo - media_anterior)
+                if self.m2 < 0.0:
+                    self.m2 = 0.0
+        return self.valor()
+
+    def _recalcular(self):
+        """Recalcula média e M2 a partir da janela atual"""
+        janela = np.fromiter(self.janela, dtype=np.float64, count=len(self.janela))
+        self.media = float(janela.mean())
+        self.m2 = float(np.square(janela - self.media).sum())
+        self.substituicoes = 0
+
+    def valor(self) -> Tuple[float, float, float]:
+        """Bandas atuais (NaN enquanto a janela não estiver completa)"""
+        if len(self.janela) < self.periodo:
+            nan = float('nan')
+            return nan, nan, nan
+        largura = self.desvios * (self.m2 / (self.periodo - 1)) ** 0.5
+        return self.media + largura, self.media, self.media - largura
+
+
+class RSIIncremental:
+    """RSI de Wilder atualizado em O(1) por novo preço"""
+
+    __slots__ = ('periodo', 'preco_anterior', 'deltas', 'media_ganhos', 'media_perdas')
+
+    def __init__(self, periodo: int = 14):
+        self.periodo = periodo
+        self.preco_anterior = float('nan')
+        self.deltas = 0
+        self.media_ganhos = 0.0
+        self.media_perdas = 0.0
+
+    def aquecer(self, precos: np.ndarray) -> float:
+        """Reconstrói o estado a partir do histórico e retorna o valor atual"""
+        self.__init__(self.periodo)
+        if precos.size <= self.periodo:
+            for preco in precos.tolist():
+                self.atualizar(preco)
+            return self.valor()
+        media_ganhos, media_perdas = _medias_wilder(precos, self.periodo)
+        self.preco_anterior = float(precos[-1])
+        self.deltas = precos.size - 1
+        self.media_ganhos = float(media_ganhos[-1])
+        self.media_perdas = float(media_perdas[-1])
+        return self.valor()
+
+    def atualizar(self, preco: float) -> float:
+        """Incorpora um novo preço e retorna o RSI atual"""
+        if self.preco_anterior == self.preco_anterior:
+            delta = preco - self.preco_anterior
+            ganho = delta if delta > 0 else 0.0
+            perda = -delta if delta < 0 else 0.0
+            self.deltas += 1
+            if self.deltas <= self.periodo:
+                # Semente: média simples dos primeiros deltas
+                self.media_ganhos += (ganho - self.media_ganhos) / self.deltas
+                self.media_perdas += (perda - self.media_perdas) / self.deltas
+            else:
+                self.media_ganhos += (ganho - self.media_ganhos) / self.periodo
+                self.media_perdas += (perda - self.media_perdas) / self.periodo
+        self.preco_anterior = preco
+        return self.valor()
+
+    def valor(self) -> float:
+        """RSI atual (NaN antes de `periodo` deltas)"""
+        if self.deltas < self.periodo:
+            return float('nan')
+        total = self.media_ganhos + self.media_perdas
+        return 100.0 * self.media_ganhos / total if total > 0 else 50.0
@@ -6,6 +6,7 @@ Implementação de estratégia baseada em rompimentos de níveis de suporte e re
 import asyncio
 import logging
 import time
+from collections import deque
 from typing import Dict, List, Optional, Any, Tuple
 import pandas as pd
 import numpy as np
@@ -65,7 +66,7 @@ class EstrategiaBreakout(EstrategiaBase):
         # Estado interno
         self.niveis_suporte: Dict[str, List[Dict[str, Any]]] = {}
         self.niveis_resistencia: Dict[str, List[Dict[str, Any]]] = {}
-        self.historico_rompimentos: Dict[str, List[Dict[str, Any]]] = {}
+        self.historico_rompimentos: Dict[str, deque] = {}
     
     async def _inicializar_especifica(self):
         """Inicialização específica da estratégia"""
@@ -93,7 +94,7 @@ class EstrategiaBreakout(EstrategiaBase):
         """
         try:
             simbolo = dados_mercado.simbolo
-            precos = dados_mercado.precos
+            precos, volume = self.reamostrar(simbolo, dados_mercado.precos, dados_mercado.volume)
             
             # Verificar se temos dados suficientes
             min_periodos = max(self.periodo_lookback, self.periodo_volume) + 20
@@ -105,11 +106,11 @@ class EstrategiaBreakout(EstrategiaBase):
             self._identificar_niveis(simbolo, precos)
             
             # Verificar rompimentos
-            rompimento = self._verificar_rompimento(simbolo, precos, dados_mercado.volume)
+            rompimento = self._verificar_rompimento(simbolo, precos, volume)
             
             if rompimento:
                 # Criar sinal baseado no rompimento
-                sinal = self._criar_sinal_rompimento(simbolo, precos, dados_mercado.volume, rompimento)
+                sinal = self._criar_sinal_rompimento(simbolo, precos, volume, rompimento)
                 return sinal
             
             return None
@@ -159,14 +160,15 @@ class EstrategiaBreakout(EstrategiaBase):
         """
         maximos = []
         janela = self.periodo_lookback // 2
+        valores = serie_precos.to_numpy()  # indexação direta, sem o motor do iloc
         
-        for i in range(janela, len(serie_precos) - janela):
-            preco_atual = serie_precos.iloc[i]
+        for i in range(janela, len(valores) - janela):
+            preco_atual = valores[i]
             
             # Verificar se é máximo local
             is_maximo = True
             for j in range(i - janela, i + janela + 1):
-                if j != i and serie_precos.iloc[j] >= preco_atual:
+                if j != i and valores[j] >= preco_atual:
                     is_maximo = False
                     break
             
@@ -187,14 +189,15 @@ class EstrategiaBreakout(EstrategiaBase):
         """
         minimos = []
         janela = self.periodo_lookback // 2
+        valores = serie_precos.to_numpy()  # indexação direta, sem o motor do iloc
         
-        for i in range(janela, len(serie_precos) - janela):
-            preco_atual = serie_precos.iloc[i]
+        for i in range(janela, len(valores) - janela):
+            preco_atual = valores[i]
             
             # Verificar se é mínimo local
             is_minimo = True
             for j in range(i - janela, i + janela + 1):
-                if j != i and serie_precos.iloc[j] <= preco_atual:
+                if j != i and valores[j] <= preco_atual:
                     is_minimo = False
                     break
             
@@ -346,9 +349,9 @@ class EstrategiaBreakout(EstrategiaBase):
         Returns:
             Dados do rompimento ou None
         """
-        preco_atual = precos['close'].iloc[-1]
-        volume_atual = volume.iloc[-1]
-        volume_medio = volume.rolling(window=self.periodo_volume).mean().iloc[-1]
+        preco_atual = precos['close'].iat[-1]
+        volume_atual = volume.iat[-1]
+        volume_medio = volume.rolling(window=self.periodo_volume).mean().iat[-1]
         
         # Verificar se volume confirma o rompimento
         if pd.isna(volume_medio) or volume_atual < volume_medio * self.multiplicador_volume:
@@ -396,23 +399,23 @@ class EstrategiaBreakout(EstrategiaBase):
         Returns:
             Sinal de trading
         """
-        preco_atual = Decimal(str(rompimento['preco_rompimento']))
+        # Cálculos em float; Decimal só na criação do sinal
+        preco_atual = float(rompimento['preco_rompimento'])
         nivel_rompido = rompimento['nivel_rompido']
-        preco_nivel = Decimal(str(nivel_rompido['preco']))
+        preco_nivel = float(nivel_rompido['preco'])
+        distancia_stop = abs(preco_atual - preco_nivel) * self.multiplicador_stop
         
         # Calcular stop loss
         if rompimento['tipo'] == TipoSinal.COMPRA:
             # Stop loss abaixo do nível rompido
-            distancia_stop = abs(preco_atual - preco_nivel) * Decimal(str(self.multiplicador_stop))
             stop_loss = preco_nivel - distancia_stop
         else:
             # Stop loss acima do nível rompido
-            distancia_stop = abs(preco_nivel - preco_atual) * Decimal(str(self.multiplicador_stop))
             stop_loss = preco_nivel + distancia_stop
         
         # Calcular take profit baseado na razão risco/retorno
         risco = abs(preco_atual - stop_loss)
-        retorno_esperado = risco * Decimal(str(self.razao_risco_retorno))
+        retorno_esperado = risco * self.razao_risco_retorno
         
         if rompimento['tipo'] == TipoSinal.COMPRA:
             take_profit = preco_atual + retorno_esperado
@@ -429,9 +432,9 @@ class EstrategiaBreakout(EstrategiaBase):
             simbolo=simbolo,
             tipo=rompimento['tipo'],
             forca=forca,
-            preco_entrada=preco_atual,
-            stop_loss=stop_loss,
-            take_profit=take_profit,
+            preco_entrada=Decimal(str(preco_atual)),
+            stop_loss=Decimal(str(stop_loss)),
+            take_profit=Decimal(str(take_profit)),
             razao_risco_retorno=self.razao_risco_retorno,
             confianca=confianca,
             metadados={
@@ -448,21 +451,17 @@ class EstrategiaBreakout(EstrategiaBase):
         
         # Registrar no histórico
         if simbolo not in self.historico_rompimentos:
-            self.historico_rompimentos[simbolo] = []
+            self.historico_rompimentos[simbolo] = deque(maxlen=50)
         
         self.historico_rompimentos[simbolo].append({
             'timestamp': sinal.timestamp,
             'tipo': sinal.tipo.value,
-            'preco': float(preco_atual),
+            'preco': preco_atual,
             'nivel_rompido': nivel_rompido['preco'],
             'forca_nivel': nivel_rompido['forca'],
             'volume_confirmacao': rompimento['volume_confirmacao']
         })
         
-        # Limitar histórico
-        if len(self.historico_rompimentos[simbolo]) > 50:
-            self.historico_rompimentos[simbolo].pop(0)
-        
         return sinal
     
     def _calcular_confianca_rompimento(self, rompimento: Dict[str, Any]) -> float:
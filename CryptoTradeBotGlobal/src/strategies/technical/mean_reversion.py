@@ -6,7 +6,8 @@ Implementação de estratégia baseada em Bandas de Bollinger e RSI
 import asyncio
 import logging
 import time
-from typing import Dict, List, Optional, Any
+from collections import deque
+from typing import Dict, Optional, Any
 import pandas as pd
 import numpy as np
 from decimal import Decimal
@@ -66,7 +67,7 @@ class EstrategiaReversaoMedia(EstrategiaBase):
         
         # Estado interno
         self.posicoes_ativas: Dict[str, Dict[str, Any]] = {}
-        self.historico_reversoes: Dict[str, List[Dict[str, Any]]] = {}
+        self.historico_reversoes: Dict[str, deque] = {}
     
     async def _inicializar_especifica(self):
         """Inicialização específica da estratégia"""
@@ -92,7 +93,7 @@ class EstrategiaReversaoMedia(EstrategiaBase):
         """
         try:
             simbolo = dados_mercado.simbolo
-            precos = dados_mercado.precos
+            precos, volume = self.reamostrar(simbolo, dados_mercado.precos, dados_mercado.volume)
             
             # Verificar se temos dados suficientes
             min_periodos = max(self.periodo_bollinger, self.periodo_rsi, self.periodo_atr) + 10
@@ -101,7 +102,7 @@ class EstrategiaReversaoMedia(EstrategiaBase):
                 return None
             
             # Calcular indicadores
-            indicadores = self._calcular_indicadores(precos, dados_mercado.volume)
+            indicadores = self._calcular_indicadores(precos, volume)
             
             # Verificar condições de mercado
             if not self._verificar_condicoes_mercado(indicadores):
@@ -138,20 +139,20 @@ class EstrategiaReversaoMedia(EstrategiaBase):
         
         # Bandas de Bollinger
         banda_superior, media_movel, banda_inferior = self.calcular_bandas_bollinger(
-            precos['close'], self.periodo_bollinger, self.desvios_bollinger
+            precos['close'], self.periodo_bollinger, self.desvios_bollinger, como_array=True
         )
         indicadores['banda_superior'] = banda_superior
         indicadores['media_movel'] = media_movel
         indicadores['banda_inferior'] = banda_inferior
         
         # RSI
-        indicadores['rsi'] = self.calcular_rsi(precos['close'], self.periodo_rsi)
+        indicadores['rsi'] = self.calcular_rsi(precos['close'], self.periodo_rsi, como_array=True)
         
         # ATR para stop loss
         indicadores['atr'] = self._calcular_atr(precos, self.periodo_atr)
         
-        # Volatilidade
-        indicadores['volatilidade'] = precos['close'].pct_change().rolling(window=20).std()
+        # Volatilidade (só o valor atual é usado)
+        indicadores['volatilidade'] = self.calcular_volatilidade(precos['close'], 20)
         
         # Volume relativo
         indicadores['volume_ma'] = volume.rolling(window=20).mean()
@@ -198,18 +199,18 @@ class EstrategiaReversaoMedia(EstrategiaBase):
             True se condições são adequadas
         """
         # Verificar volatilidade
-        volatilidade_atual = indicadores['volatilidade'].iloc[-1]
+        volatilidade_atual = indicadores['volatilidade']
         if pd.isna(volatilidade_atual) or volatilidade_atual > self.max_volatilidade:
             return False
         
         # Verificar volume
-        volume_relativo = indicadores['volume_relativo'].iloc[-1]
+        volume_relativo = indicadores['volume_relativo'].iat[-1]
         if pd.isna(volume_relativo) or volume_relativo < self.min_volume_relativo:
             return False
         
         # Verificar se as bandas não estão muito próximas (mercado sem volatilidade)
-        distancia_banda_sup = indicadores['distancia_banda_sup'].iloc[-1]
-        distancia_banda_inf = indicadores['distancia_banda_inf'].iloc[-1]
+        distancia_banda_sup = indicadores['distancia_banda_sup'].iat[-1]
+        distancia_banda_inf = indicadores['distancia_banda_inf'].iat[-1]
         
         if (pd.isna(distancia_banda_sup) or pd.isna(distancia_banda_inf) or
             max(distancia_banda_sup, distancia_banda_inf) < self.min_distancia_banda):
@@ -229,8 +230,8 @@ class EstrategiaReversaoMedia(EstrategiaBase):
         Returns:
             Dicionário com dados da oportunidade ou None
         """
-        rsi_atual = indicadores['rsi'].iloc[-1]
-        posicao_banda = indicadores['posicao_banda'].iloc[-1]
+        rsi_atual = indicadores['rsi'][-1]
+        posicao_banda = indicadores['posicao_banda'].iat[-1]
         
         # Verificar se RSI e posição nas bandas indicam extremos
         if pd.isna(rsi_atual) or pd.isna(posicao_banda):
@@ -302,30 +303,31 @@ class EstrategiaReversaoMedia(EstrategiaBase):
         Returns:
             Sinal de trading
         """
-        preco_atual = Decimal(str(precos['close'].iloc[-1]))
-        media_movel = Decimal(str(indicadores['media_movel'].iloc[-1]))
-        atr = indicadores['atr'].iloc[-1]
+        # Cálculos em float; Decimal só na criação do sinal
+        preco_atual = float(precos['close'].iat[-1])
+        media_movel = float(indicadores['media_movel'][-1])
+        atr = indicadores['atr'].iat[-1]
         
         if oportunidade['tipo'] == TipoSinal.COMPRA:
             # Sinal de compra (reversão de baixa para alta)
-            stop_loss = preco_atual - Decimal(str(atr * self.multiplicador_stop))
+            stop_loss = preco_atual - atr * self.multiplicador_stop
             
             # Take profit em direção à média móvel
             distancia_media = media_movel - preco_atual
-            take_profit = preco_atual + (distancia_media * Decimal(str(self.percentual_take_profit)))
+            take_profit = preco_atual + distancia_media * self.percentual_take_profit
             
         else:  # VENDA
             # Sinal de venda (reversão de alta para baixa)
-            stop_loss = preco_atual + Decimal(str(atr * self.multiplicador_stop))
+            stop_loss = preco_atual + atr * self.multiplicador_stop
             
             # Take profit em direção à média móvel
             distancia_media = preco_atual - media_movel
-            take_profit = preco_atual - (distancia_media * Decimal(str(self.percentual_take_profit)))
+            take_profit = preco_atual - distancia_media * self.percentual_take_profit
         
         # Calcular razão risco/retorno
         risco = abs(preco_atual - stop_loss)
         retorno = abs(take_profit - preco_atual)
-        razao_rr = float(retorno / risco) if risco > 0 else 1.0
+        razao_rr = retorno / risco if risco > 0 else 1.0
         
         # Calcular confiança
         confianca = self._calcular_confianca_sinal(oportunidade, indicadores)
@@ -334,9 +336,9 @@ class EstrategiaReversaoMedia(EstrategiaBase):
             simbolo=simbolo,
             tipo=oportunidade['tipo'],
             forca=oportunidade['forca'],
-            preco_entrada=preco_atual,
-            stop_loss=stop_loss,
-            take_profit=take_profit,
+            preco_entrada=Decimal(str(preco_atual)),
+            stop_loss=Decimal(str(stop_loss)),
+            take_profit=Decimal(str(take_profit)),
             razao_risco_retorno=razao_rr,
             confianca=confianca,
             metadados={
@@ -344,29 +346,25 @@ class EstrategiaReversaoMedia(EstrategiaBase):
                 'razao_reversao': oportunidade['razao'],
                 'rsi': oportunidade['rsi'],
                 'posicao_banda': oportunidade['posicao_banda'],
-                'media_movel': float(media_movel),
+                'media_movel': media_movel,
                 'atr': atr,
-                'volatilidade': indicadores['volatilidade'].iloc[-1],
-                'volume_relativo': indicadores['volume_relativo'].iloc[-1]
+                'volatilidade': indicadores['volatilidade'],
+                'volume_relativo': indicadores['volume_relativo'].iat[-1]
             }
         )
         
         # Registrar no histórico
         if simbolo not in self.historico_reversoes:
-            self.historico_reversoes[simbolo] = []
+            self.historico_reversoes[simbolo] = deque(maxlen=100)
         
         self.historico_reversoes[simbolo].append({
             'timestamp': sinal.timestamp,
             'tipo': sinal.tipo.value,
-            'preco': float(preco_atual),
+            'preco': preco_atual,
             'rsi': oportunidade['rsi'],
             'posicao_banda': oportunidade['posicao_banda']
         })
         
-        # Limitar histórico
-        if len(self.historico_reversoes[simbolo]) > 100:
-            self.historico_reversoes[simbolo].pop(0)
-        
         return sinal
     
     def _calcular_confianca_sinal(self, oportunidade: Dict[str, Any], 
@@ -407,12 +405,12 @@ class EstrategiaReversaoMedia(EstrategiaBase):
         fatores_confianca.append(fator_banda)
         
         # Volume (maior volume = maior confiança)
-        volume_relativo = indicadores['volume_relativo'].iloc[-1]
+        volume_relativo = indicadores['volume_relativo'].iat[-1]
         fator_volume = min(volume_relativo / 2.0, 1.0)  # Normalizar
         fatores_confianca.append(fator_volume)
         
         # Volatilidade (volatilidade moderada é melhor)
-        volatilidade = indicadores['volatilidade'].iloc[-1]
+        volatilidade = indicadores['volatilidade']
         if pd.notna(volatilidade):
             # Volatilidade ideal entre 1% e 3%
             if 0.01 <= volatilidade <= 0.03:
@@ -90,7 +90,7 @@ class EstrategiaSeguimentoTendencia(EstrategiaBase):
         """
         try:
             simbolo = dados_mercado.simbolo
-            precos = dados_mercado.precos
+            precos, volume = self.reamostrar(simbolo, dados_mercado.precos, dados_mercado.volume)
             
             # Verificar se temos dados suficientes
             min_periodos = max(self.periodo_ema_lenta, self.periodo_rsi, self.periodo_atr) + 10
@@ -99,7 +99,7 @@ class EstrategiaSeguimentoTendencia(EstrategiaBase):
                 return None
             
             # Calcular indicadores
-            indicadores = self._calcular_indicadores(precos, dados_mercado.volume)
+            indicadores = self._calcular_indicadores(precos, volume)
             
             # Analisar tendência
             analise_tendencia = self._analisar_tendencia(indicadores, simbolo)
@@ -129,14 +129,14 @@ class EstrategiaSeguimentoTendencia(EstrategiaBase):
         indicadores = {}
         
         # Médias móveis exponenciais
-        indicadores['ema_rapida'] = precos['close'].ewm(span=self.periodo_ema_rapida).mean()
-        indicadores['ema_lenta'] = precos['close'].ewm(span=self.periodo_ema_lenta).mean()
+        indicadores['ema_rapida'] = self.calcular_media_exponencial(precos['close'], self.periodo_ema_rapida)
+        indicadores['ema_lenta'] = self.calcular_media_exponencial(precos['close'], self.periodo_ema_lenta)
         
         # RSI
-        indicadores['rsi'] = self.calcular_rsi(precos['close'], self.periodo_rsi)
+        indicadores['rsi'] = self.calcular_rsi(precos['close'], self.periodo_rsi, como_array=True)
         
         # MACD
-        macd, linha_sinal, histograma = self.calcular_macd(precos['close'])
+        macd, linha_sinal, histograma = self.calcular_macd(precos['close'], como_array=True)
         indicadores['macd'] = macd
         indicadores['macd_sinal'] = linha_sinal
         indicadores['macd_histograma'] = histograma
@@ -185,12 +185,12 @@ class EstrategiaSeguimentoTendencia(EstrategiaBase):
         Returns:
             Dicionário com análise da tendência
         """
-        ema_rapida = indicadores['ema_rapida'].iloc[-1]
-        ema_lenta = indicadores['ema_lenta'].iloc[-1]
-        rsi = indicadores['rsi'].iloc[-1]
-        macd = indicadores['macd'].iloc[-1]
-        macd_sinal = indicadores['macd_sinal'].iloc[-1]
-        forca_tendencia = indicadores['forca_tendencia'].iloc[-1]
+        ema_rapida = indicadores['ema_rapida'].iat[-1]
+        ema_lenta = indicadores['ema_lenta'].iat[-1]
+        rsi = indicadores['rsi'][-1]
+        macd = indicadores['macd'][-1]
+        macd_sinal = indicadores['macd_sinal'][-1]
+        forca_tendencia = indicadores['forca_tendencia'].iat[-1]
         
         # Determinar direção da tendência
         if ema_rapida > ema_lenta:
@@ -238,9 +238,9 @@ class EstrategiaSeguimentoTendencia(EstrategiaBase):
         Returns:
             Sinal de trading se condições forem atendidas
         """
-        preco_atual = Decimal(str(precos['close'].iloc[-1]))
-        volume_relativo = indicadores['volume_relativo'].iloc[-1]
-        atr = indicadores['atr'].iloc[-1]
+        preco_atual = float(precos['close'].iat[-1])
+        volume_relativo = indicadores['volume_relativo'].iat[-1]
+        atr = indicadores['atr'].iat[-1]
         
         # Verificar condições básicas
         if analise_tendencia['forca'] < self.min_forca_tendencia:
@@ -278,7 +278,7 @@ class EstrategiaSeguimentoTendencia(EstrategiaBase):
         
         return None
     
-    def _criar_sinal_compra(self, simbolo: str, preco_atual: Decimal, 
+    def _criar_sinal_compra(self, simbolo: str, preco_atual: float, 
                            atr: float, analise_tendencia: Dict[str, Any]) -> SinalTrade:
         """
         Cria sinal de compra
@@ -292,12 +292,12 @@ class EstrategiaSeguimentoTendencia(EstrategiaBase):
         Returns:
             Sinal de compra
         """
-        # Calcular stop loss baseado em ATR
-        stop_loss = preco_atual - Decimal(str(atr * self.multiplicador_stop))
+        # Calcular stop loss baseado em ATR (float; Decimal só na criação do sinal)
+        stop_loss = preco_atual - atr * self.multiplicador_stop
         
         # Calcular take profit
         risco = preco_atual - stop_loss
-        take_profit = preco_atual + (risco * Decimal(str(self.multiplicador_take_profit)))
+        take_profit = preco_atual + risco * self.multiplicador_take_profit
         
         # Calcular confiança do sinal
         confianca = self._calcular_confianca_sinal(analise_tendencia, TipoSinal.COMPRA)
@@ -306,9 +306,9 @@ class EstrategiaSeguimentoTendencia(EstrategiaBase):
             simbolo=simbolo,
             tipo=TipoSinal.COMPRA,
             forca=analise_tendencia['forca'],
-            preco_entrada=preco_atual,
-            stop_loss=stop_loss,
-            take_profit=take_profit,
+            preco_entrada=Decimal(str(preco_atual)),
+            stop_loss=Decimal(str(stop_loss)),
+            take_profit=Decimal(str(take_profit)),
             razao_risco_retorno=self.multiplicador_take_profit,
             confianca=confianca,
             metadados={
@@ -328,7 +328,7 @@ class EstrategiaSeguimentoTendencia(EstrategiaBase):
         
         return sinal
     
-    def _criar_sinal_venda(self, simbolo: str, preco_atual: Decimal, 
+    def _criar_sinal_venda(self, simbolo: str, preco_atual: float, 
                           atr: float, analise_tendencia: Dict[str, Any]) -> SinalTrade:
         """
         Cria sinal de venda
@@ -342,12 +342,12 @@ class EstrategiaSeguimentoTendencia(EstrategiaBase):
         Returns:
             Sinal de venda
         """
-        # Calcular stop loss baseado em ATR
-        stop_loss = preco_atual + Decimal(str(atr * self.multiplicador_stop))
+        # Calcular stop loss baseado em ATR (float; Decimal só na criação do sinal)
+        stop_loss = preco_atual + atr * self.multiplicador_stop
         
         # Calcular take profit
         risco = stop_loss - preco_atual
-        take_profit = preco_atual - (risco * Decimal(str(self.multiplicador_take_profit)))
+        take_profit = preco_atual - risco * self.multiplicador_take_profit
         
         # Calcular confiança do sinal
         confianca = self._calcular_confianca_sinal(analise_tendencia, TipoSinal.VENDA)
@@ -356,9 +356,9 @@ class EstrategiaSeguimentoTendencia(EstrategiaBase):
             simbolo=simbolo,
             tipo=TipoSinal.VENDA,
             forca=analise_tendencia['forca'],
-            preco_entrada=preco_atual,
-            stop_loss=stop_loss,
-            take_profit=take_profit,
+            preco_entrada=Decimal(str(preco_atual)),
+            stop_loss=Decimal(str(stop_loss)),
+            take_profit=Decimal(str(take_profit)),
             razao_risco_retorno=self.multiplicador_take_profit,
             confianca=confianca,
             metadados={
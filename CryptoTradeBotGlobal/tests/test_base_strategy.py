@@ -0,0 +1,217 @@
+"""
+Testes para a Estratégia Base
+Sistema de Trading de Criptomoedas - Português Brasileiro
+"""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.strategies import indicadores
+from src.strategies.base_strategy import BaseStrategy
+
+
+class EstrategiaTeste(BaseStrategy):
+    """Estratégia concreta mínima para exercitar a classe base"""
+
+    async def _inicializar_especifica(self):
+        pass
+
+    async def _finalizar_especifica(self):
+        pass
+
+    async def _analisar_especifica(self, dados_mercado):
+        return []
+
+    def _validar_configuracao_especifica(self):
+        return True
+
+
+def criar_candles(barras: int = 30, frequencia: str = '1min') -> pd.DataFrame:
+    """Cria candles OHLCV sintéticos indexados por timestamp"""
+    indice = pd.date_range('2024-01-01', periods=barras, freq=frequencia)
+    fechamento = 100.0 + np.arange(barras, dtype=np.float64)
+    return pd.DataFrame({
+        'open': fechamento - 0.5,
+        'high': fechamento + 1.0,
+        'low': fechamento - 1.0,
+        'close': fechamento,
+        'volume': np.full(barras, 10.0)
+    }, index=indice)
+
+
+class TestReamostragem:
+    """Testes para a reamostragem de candles"""
+
+    def test_sem_tf_resample_retorna_dados_originais(self):
+        """Sem tf_resample os dados são devolvidos sem cópia"""
+        estrategia = EstrategiaTeste({})
+        precos = criar_candles()
+        volume_original = precos['volume']
+
+        reamostrados, volume = estrategia.reamostrar('BTC/USDT', precos, volume_original)
+
+        assert reamostrados is precos
+        assert volume is volume_original
+
+    def test_com_tf_resample_agrega_ohlcv(self):
+        """Com tf_resample os candles são agregados no timeframe configurado"""
+        estrategia = EstrategiaTeste({'tf_resample': '5min'})
+        precos = criar_candles(30)
+
+        reamostrados, volume = estrategia.reamostrar('BTC/USDT', precos, precos['volume'])
+
+        assert len(reamostrados) == 6
+        primeiro = reamostrados.iloc[0]
+        assert primeiro['open'] == precos['open'].iat[0]
+        assert primeiro['high'] == precos['high'].iloc[:5].max()
+        assert primeiro['low'] == precos['low'].iloc[:5].min()
+        assert primeiro['close'] == precos['close'].iat[4]
+        assert primeiro['volume'] == 50.0
+        assert volume.tolist() == [50.0] * 6
+        assert volume.index.equals(reamostrados.index)
+
+    def test_reamostragem_reaproveitada_ate_novo_candle(self):
+        """O resultado é reaproveitado enquanto a série de origem não avançar"""
+        estrategia = EstrategiaTeste({'tf_resample': '5min'})
+        precos = criar_candles(30)
+
+        primeiro, _ = estrategia.reamostrar('BTC/USDT', precos)
+        segundo, _ = estrategia.reamostrar('BTC/USDT', precos)
+        assert segundo is primeiro
+
+        terceiro, volume = estrategia.reamostrar('BTC/USDT', criar_candles(31))
+        assert terceiro is not primeiro
+        assert len(terceiro) == 7
+        assert volume is None
+
+    def test_candle_atualizado_invalida_reamostragem(self):
+        """Atualizar o último candle no lugar recalcula a barra reamostrada"""
+        estrategia = EstrategiaTeste({'tf_resample': '5min'})
+        precos = criar_candles(28)
+
+        primeiro, _ = estrategia.reamostrar('BTC/USDT', precos, precos['volume'])
+        precos.iloc[-1, precos.columns.get_loc('close')] = 200.0
+        segundo, _ = estrategia.reamostrar('BTC/USDT', precos, precos['volume'])
+        precos.iloc[-1, precos.columns.get_loc('volume')] = 25.0
+        terceiro, volume = estrategia.reamostrar('BTC/USDT', precos, precos['volume'])
+
+        assert segundo is not primeiro
+        assert segundo['close'].iat[-1] == 200.0
+        assert terceiro is not segundo
+        assert volume.iat[-1] == 45.0
+
+
+def criar_serie(barras: int = 120, semente: int = 3) -> pd.Series:
+    """Série de fechamentos sintética indexada por timestamp"""
+    rng = np.random.default_rng(semente)
+    indice = pd.date_range('2024-01-01', periods=barras, freq='1min')
+    return pd.Series(100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, barras))), index=indice, name='close')
+
+
+class TestIndicadoresEstrategia:
+    """Testes para os indicadores expostos pela classe base"""
+
+    def test_cache_reaproveitado_para_mesma_serie(self):
+        """A mesma série devolve o resultado memorizado"""
+        estrategia = EstrategiaTeste({})
+        precos = criar_serie()
+
+        primeiro = estrategia.calcular_rsi(precos, 14)
+
+        assert estrategia.calcular_rsi(precos, 14) is primeiro
+        assert estrategia.calcular_rsi(precos, 10) is not primeiro
+
+    def test_cache_invalidado_por_novo_candle(self):
+        """Um novo candle invalida a entrada e recalcula o indicador"""
+        estrategia = EstrategiaTeste({})
+        completa = criar_serie(121)
+        precos = completa.iloc[:120]
+
+        anterior = estrategia.calcular_media_movel(precos, 20)
+        atual = estrategia.calcular_media_movel(completa, 20)
+
+        assert atual is not anterior
+        assert len(atual) == 121
+        assert atual.iat[-1] == pytest.approx(completa.iloc[-20:].mean())
+
+    def test_como_array_retorna_ndarray(self):
+        """como_array devolve os mesmos valores sem construir a Série"""
+        estrategia = EstrategiaTeste({})
+        precos = criar_serie()
+
+        serie = estrategia.calcular_media_exponencial(precos, 12)
+        array = estrategia.calcular_media_exponencial(precos, 12, como_array=True)
+
+        assert isinstance(serie, pd.Series)
+        assert isinstance(array, np.ndarray)
+        np.testing.assert_array_equal(serie.to_numpy(), array)
+
+    def test_atualizacao_incremental_apos_aquecer(self):
+        """Após aquecer com o histórico, cada novo preço acompanha o cálculo em lote"""
+        estrategia = EstrategiaTeste({})
+        precos = criar_serie(150)
+
+        estrategia.atualizar_rsi('BTC/USDT', precos.iat[99], 14, historico=precos.iloc[:100])
+        for barra in range(100, 150):
+            rsi = estrategia.atualizar_rsi('BTC/USDT', precos.iat[barra], 14)
+
+        assert rsi == pytest.approx(estrategia.calcular_rsi(precos, 14).iat[-1], rel=1e-9)
+
+    def test_indicadores_lote_iguais_aos_individuais(self):
+        """O cálculo em matriz equivale ao cálculo por símbolo"""
+        estrategia = EstrategiaTeste({})
+        precos = {'BTC/USDT': criar_serie(120, 1), 'ETH/USDT': criar_serie(120, 2)}
+
+        resultado = estrategia.calcular_indicadores_lote(precos)
+
+        for simbolo, serie in precos.items():
+            valores = serie.to_numpy()
+            superior, media, inferior = indicadores.bandas_bollinger(valores, 20, 2.0)
+            assert resultado[simbolo]['rsi'] == pytest.approx(indicadores.rsi(valores, 14)[-1])
+            assert resultado[simbolo]['banda_superior'] == pytest.approx(superior[-1])
+            assert resultado[simbolo]['media_movel'] == pytest.approx(media[-1])
+            assert resultado[simbolo]['banda_inferior'] == pytest.approx(inferior[-1])
+            assert resultado[simbolo]['macd'] == pytest.approx(indicadores.macd(valores)[0][-1])
+
+
+class TestSinalParaJson:
+    """Testes para a serialização de sinais"""
+
+    def test_tipos_nao_nativos(self):
+        """Decimal, tipos NumPy e datetime são convertidos"""
+        sinal = {
+            'simbolo': 'BTC/USDT',
+            'acao': 'COMPRAR',
+            'preco': Decimal('50000.5'),
+            'quantidade': np.float64(0.25),
+            'barras': np.int64(3),
+            'bandas': np.array([1.0, 2.0]),
+            'timestamp': datetime(2024, 1, 1, 12, 30)
+        }
+
+        bruto = BaseStrategy.sinal_para_json(sinal)
+
+        assert isinstance(bruto, bytes)
+        assert json.loads(bruto) == {
+            'simbolo': 'BTC/USDT',
+            'acao': 'COMPRAR',
+            'preco': 50000.5,
+            'quantidade': 0.25,
+            'barras': 3,
+            'bandas': [1.0, 2.0],
+            'timestamp': '2024-01-01T12:30:00'
+        }
+
+    def test_tipo_desconhecido(self):
+        """Tipos sem conversão conhecida geram TypeError"""
+        with pytest.raises(TypeError):
+            BaseStrategy.sinal_para_json({'simbolo': object()})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
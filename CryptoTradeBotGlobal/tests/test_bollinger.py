@@ -5,6 +5,7 @@ Sistema de Trading de Criptomoedas - Português Brasileiro
 
 import pytest
 import asyncio
+import numpy as np
 from datetime import datetime
 from decimal import Decimal
 
@@ -78,7 +79,7 @@ class TestEstrategiaBollinger:
         assert len(estrategia_bollinger.dados_historicos['BTC/USDT']) == 0
         
         # Adicionar dados
-        await estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados_simbolo)
+        estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados_simbolo)
         
         # Verificar se foi adicionado
         assert len(estrategia_bollinger.dados_historicos['BTC/USDT']) == 1
@@ -94,10 +95,10 @@ class TestEstrategiaBollinger:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
         
         # Bandas devem retornar None
-        bandas = await estrategia_bollinger._calcular_bandas_bollinger('BTC/USDT')
+        bandas = estrategia_bollinger._calcular_bandas_bollinger('BTC/USDT')
         assert bandas is None
     
     @pytest.mark.asyncio
@@ -112,9 +113,9 @@ class TestEstrategiaBollinger:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
         
-        bandas = await estrategia_bollinger._calcular_bandas_bollinger('BTC/USDT')
+        bandas = estrategia_bollinger._calcular_bandas_bollinger('BTC/USDT')
         
         # Verificar se as bandas foram calculadas
         assert bandas is not None
@@ -137,28 +138,28 @@ class TestEstrategiaBollinger:
         """Testa determinação da posição em relação às bandas"""
         # Preço na banda superior
         posicao_superior = estrategia_bollinger._determinar_posicao_banda(
-            Decimal('52000'),  # preco
-            Decimal('52000'),  # banda_superior
-            Decimal('48000'),  # banda_inferior
-            Decimal('50000')   # media
+            52000.0,  # preco
+            52000.0,  # banda_superior
+            48000.0,  # banda_inferior
+            50000.0   # media
         )
         assert posicao_superior == 'SUPERIOR'
         
         # Preço na banda inferior
         posicao_inferior = estrategia_bollinger._determinar_posicao_banda(
-            Decimal('48000'),  # preco
-            Decimal('52000'),  # banda_superior
-            Decimal('48000'),  # banda_inferior
-            Decimal('50000')   # media
+            48000.0,  # preco
+            52000.0,  # banda_superior
+            48000.0,  # banda_inferior
+            50000.0   # media
         )
         assert posicao_inferior == 'INFERIOR'
         
         # Preço no meio
         posicao_meio = estrategia_bollinger._determinar_posicao_banda(
-            Decimal('50000'),  # preco
-            Decimal('52000'),  # banda_superior
-            Decimal('48000'),  # banda_inferior
-            Decimal('50000')   # media
+            50000.0,  # preco
+            52000.0,  # banda_superior
+            48000.0,  # banda_inferior
+            50000.0   # media
         )
         assert posicao_meio == 'MEIO'
     
@@ -175,7 +176,7 @@ class TestEstrategiaBollinger:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
         
         # Simular análise com preço na banda inferior
         dados_mercado = {
@@ -207,7 +208,7 @@ class TestEstrategiaBollinger:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
         
         # Simular análise com preço na banda superior
         dados_mercado = {
@@ -249,7 +250,7 @@ class TestEstrategiaBollinger:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_breakout._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_breakout._atualizar_dados_historicos('BTC/USDT', dados)
         
         # Simular análise com rompimento
         dados_mercado = {
@@ -280,7 +281,7 @@ class TestEstrategiaBollinger:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
         
         dados_mercado = {
             'BTC/USDT': {
@@ -304,17 +305,18 @@ class TestEstrategiaBollinger:
         """Testa cálculo de confiança para compra por reversão"""
         # Simular bandas
         bandas = {
-            'banda_inferior': Decimal('45000'),
-            'banda_superior': Decimal('55000'),
-            'media': Decimal('50000'),
-            'largura_banda': Decimal('10000')
+            'banda_inferior': 45000.0,
+            'banda_superior': 55000.0,
+            'media': 50000.0,
+            'largura_banda': 10000.0
         }
         
-        preco_banda_inferior = Decimal('45000')
+        preco_banda_inferior = 45000.0
         volume_alto = 5000
         
-        confianca = estrategia_bollinger._calcular_confianca_reversao_compra(
-            preco_banda_inferior, bandas, volume_alto
+        confianca = estrategia_bollinger._calcular_confianca(
+            preco_banda_inferior - bandas['banda_inferior'], bandas['largura_banda'], bandas['media'],
+            volume_alto, False
         )
         
         # Confiança deve ser razoável
@@ -326,17 +328,18 @@ class TestEstrategiaBollinger:
         """Testa cálculo de confiança para venda por reversão"""
         # Simular bandas
         bandas = {
-            'banda_inferior': Decimal('45000'),
-            'banda_superior': Decimal('55000'),
-            'media': Decimal('50000'),
-            'largura_banda': Decimal('10000')
+            'banda_inferior': 45000.0,
+            'banda_superior': 55000.0,
+            'media': 50000.0,
+            'largura_banda': 10000.0
         }
         
-        preco_banda_superior = Decimal('55000')
+        preco_banda_superior = 55000.0
         volume_alto = 5000
         
-        confianca = estrategia_bollinger._calcular_confianca_reversao_venda(
-            preco_banda_superior, bandas, volume_alto
+        confianca = estrategia_bollinger._calcular_confianca(
+            preco_banda_superior - bandas['banda_superior'], bandas['largura_banda'], bandas['media'],
+            volume_alto, False
         )
         
         # Confiança deve ser razoável
@@ -365,7 +368,7 @@ class TestEstrategiaBollinger:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_multi._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_multi._atualizar_dados_historicos('BTC/USDT', dados)
         
         # Adicionar dados para ETH (alta para banda superior)
         precos_eth_base = [3000] * 5
@@ -377,7 +380,7 @@ class TestEstrategiaBollinger:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_multi._atualizar_dados_historicos('ETH/USDT', dados)
+            estrategia_multi._atualizar_dados_historicos('ETH/USDT', dados)
         
         # Analisar ambos os símbolos
         dados_mercado = {
@@ -423,7 +426,7 @@ class TestEstrategiaBollinger:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
         
         dados_mercado = {
             'BTC/USDT': {
@@ -450,7 +453,7 @@ class TestEstrategiaBollinger:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
         
         status = await estrategia_bollinger.obter_status()
         
@@ -478,7 +481,7 @@ class TestEstrategiaBollinger:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_bollinger._atualizar_dados_historicos('BTC/USDT', dados)
         
         dados_mercado = {
             'BTC/USDT': {
@@ -524,9 +527,9 @@ class TestEstrategiaBollingerEdgeCases:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia._atualizar_dados_historicos('BTC/USDT', dados)
         
-        bandas = await estrategia._calcular_bandas_bollinger('BTC/USDT')
+        bandas = estrategia._calcular_bandas_bollinger('BTC/USDT')
         
         # Com preços idênticos, desvio padrão deve ser zero
         assert bandas is not None
@@ -535,6 +538,53 @@ class TestEstrategiaBollingerEdgeCases:
         assert bandas['banda_inferior'] == bandas['media']
         assert bandas['largura_banda'] == Decimal('0')
     
+    @pytest.mark.asyncio
+    async def test_bandas_serie_longa_sem_deriva(self):
+        """Testa que a janela incremental não acumula erro em séries longas"""
+        estrategia = criar_estrategia_bollinger({'periodo': 20, 'simbolos': ['BTC/USDT']})
+        rng = np.random.default_rng(0)
+        precos = np.concatenate([60000 + rng.normal(0, 50, 100000), 1.0 + rng.normal(0, 0.001, 1000)])
+        
+        for preco in precos.tolist():
+            estrategia._atualizar_dados_historicos('BTC/USDT', {'preco': preco, 'volume_24h': 2000})
+        
+        bandas = estrategia._calcular_bandas_bollinger('BTC/USDT')
+        
+        assert bandas['media'] == pytest.approx(precos[-20:].mean(), rel=1e-12)
+        assert bandas['desvio_padrao'] == pytest.approx(precos[-20:].std(), rel=1e-6)
+    
+    @pytest.mark.asyncio
+    async def test_volume_minimo_zero(self):
+        """Testa sinais e confiança sem volume mínimo configurado"""
+        config = {
+            'periodo': 10,
+            'simbolos': ['BTC/USDT'],
+            'volume_minimo': 0,
+            'usar_reversao': True,
+            'usar_breakout': False
+        }
+        estrategia = criar_estrategia_bollinger(config)
+        
+        # Nove preços estáveis e uma queda que toca a banda inferior
+        for preco in [50000] * 9:
+            estrategia._atualizar_dados_historicos('BTC/USDT', {
+                'preco': preco,
+                'volume_24h': 2000,
+                'timestamp': datetime.now()
+            })
+        
+        sinais = await estrategia.analisar({
+            'BTC/USDT': {'preco': 45000, 'volume_24h': 2000, 'timestamp': datetime.now()}
+        })
+        
+        assert len(sinais) > 0
+        assert sinais[0]['acao'] == 'COMPRAR'
+        
+        # Sem volume não há parcela de volume; qualquer volume satura a parcela
+        assert estrategia._calcular_confianca(0.0, 10000.0, 50000.0, 0, False) == pytest.approx(0.8)
+        assert estrategia._calcular_confianca(0.0, 10000.0, 50000.0, 5000, False) == pytest.approx(1.0)
+        assert estrategia._calcular_confianca(100.0, 10000.0, 50000.0, 5000, True) == pytest.approx(0.62)
+    
     @pytest.mark.asyncio
     async def test_bandas_com_dados_extremos(self):
         """Testa cálculo das bandas com dados extremos"""
@@ -553,10 +603,10 @@ class TestEstrategiaBollingerEdgeCases:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia._atualizar_dados_historicos('BTC/USDT', dados)
         
         # Bandas devem ser calculadas sem erros
-        bandas = await estrategia._calcular_bandas_bollinger('BTC/USDT')
+        bandas = estrategia._calcular_bandas_bollinger('BTC/USDT')
         assert bandas is not None
         assert bandas['banda_superior'] > bandas['banda_inferior']
         assert bandas['largura_banda'] > 0
@@ -598,7 +648,7 @@ class TestEstrategiaBollingerEdgeCases:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia._atualizar_dados_historicos('BTC/USDT', dados)
         
         # Simular análise com volume muito baixo
         dados_mercado = {
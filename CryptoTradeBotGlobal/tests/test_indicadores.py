@@ -0,0 +1,200 @@
+"""
+Testes para os Indicadores Técnicos Vetorizados
+Sistema de Trading de Criptomoedas - Português Brasileiro
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.strategies import indicadores
+
+
+def gerar_precos(barras: int = 300, semente: int = 7) -> np.ndarray:
+    """Passeio aleatório positivo usado como série de preços"""
+    rng = np.random.default_rng(semente)
+    return 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, barras)))
+
+
+def rsi_wilder_referencia(precos: np.ndarray, periodo: int) -> pd.Series:
+    """RSI de Wilder com pandas: semente pela média simples e depois ewm(alpha=1/periodo, adjust=False)"""
+    deltas = pd.Series(precos).diff()
+    ganhos = deltas.clip(lower=0.0)
+    perdas = (-deltas).clip(lower=0.0)
+
+    def suavizar(movimentos: pd.Series) -> pd.Series:
+        serie = movimentos.copy()
+        serie.iloc[:periodo] = np.nan
+        serie.iloc[periodo] = movimentos.iloc[1:periodo + 1].mean()
+        return serie.ewm(alpha=1.0 / periodo, adjust=False, ignore_na=True).mean().where(serie.index >= periodo)
+
+    media_ganhos = suavizar(ganhos)
+    media_perdas = suavizar(perdas)
+    return 100.0 - 100.0 / (1.0 + media_ganhos / media_perdas)
+
+
+class TestKernelsContraPandas:
+    """Compara os kernels em lote com as implementações de referência do pandas"""
+
+    def test_media_movel(self):
+        """Média móvel simples igual a rolling().mean()"""
+        precos = gerar_precos()
+        esperado = pd.Series(precos).rolling(20).mean().to_numpy()
+
+        np.testing.assert_allclose(indicadores.media_movel(precos, 20), esperado, rtol=1e-10, equal_nan=True)
+
+    def test_media_movel_exponencial(self):
+        """Média exponencial igual a ewm(adjust=False)"""
+        precos = gerar_precos()
+        esperado = pd.Series(precos).ewm(span=12, adjust=False).mean().to_numpy()
+
+        np.testing.assert_allclose(indicadores.media_movel_exponencial(precos, 2.0 / 13), esperado, rtol=1e-10)
+
+    def test_rsi_wilder(self):
+        """RSI igual à suavização de Wilder semeada pela média simples"""
+        precos = gerar_precos()
+        esperado = rsi_wilder_referencia(precos, 14).to_numpy()
+
+        resultado = indicadores.rsi(precos, 14)
+
+        assert np.isnan(resultado[:14]).all()
+        np.testing.assert_allclose(resultado[14:], esperado[14:], rtol=1e-9)
+        assert ((resultado[14:] >= 0) & (resultado[14:] <= 100)).all()
+
+    def test_rsi_sem_movimento_neutro(self):
+        """Preços constantes resultam em RSI neutro"""
+        resultado = indicadores.rsi(np.full(30, 50.0), 14)
+
+        assert (resultado[14:] == 50.0).all()
+
+    def test_bandas_bollinger(self):
+        """Bandas iguais a rolling mean +/- desvios * rolling std amostral"""
+        precos = gerar_precos()
+        serie = pd.Series(precos)
+        media = serie.rolling(20).mean().to_numpy()
+        desvio = serie.rolling(20).std().to_numpy()
+
+        superior, centro, inferior = indicadores.bandas_bollinger(precos, 20, 2.0)
+
+        np.testing.assert_allclose(centro, media, rtol=1e-10, equal_nan=True)
+        np.testing.assert_allclose(superior, media + 2.0 * desvio, rtol=1e-10, equal_nan=True)
+        np.testing.assert_allclose(inferior, media - 2.0 * desvio, rtol=1e-10, equal_nan=True)
+
+    def test_bandas_bollinger_serie_longa(self):
+        """O desvio não perde precisão em séries longas com deriva de preço"""
+        precos = np.concatenate([np.linspace(100.0, 60000.0, 199000), np.full(1000, 60000.0)])
+        precos[-20:] += np.tile([0.01, -0.01], 10)
+        esperado = np.std(precos[-20:], ddof=1)
+
+        superior, media, inferior = indicadores.bandas_bollinger(precos, 20, 2.0)
+
+        assert media[-1] == pytest.approx(precos[-20:].mean(), rel=1e-12)
+        assert (superior[-1] - media[-1]) / 2.0 == pytest.approx(esperado, rel=1e-6)
+        assert (media[-1] - inferior[-1]) / 2.0 == pytest.approx(esperado, rel=1e-6)
+
+    def test_macd(self):
+        """MACD igual à diferença das ewm(adjust=False) e sinal sobre ela"""
+        precos = gerar_precos()
+        serie = pd.Series(precos)
+        linha = serie.ewm(span=12, adjust=False).mean() - serie.ewm(span=26, adjust=False).mean()
+        sinal = linha.ewm(span=9, adjust=False).mean()
+
+        linha_macd, linha_sinal, histograma = indicadores.macd(precos)
+
+        np.testing.assert_allclose(linha_macd, linha.to_numpy(), rtol=1e-7, atol=1e-9)
+        np.testing.assert_allclose(linha_sinal, sinal.to_numpy(), rtol=1e-7, atol=1e-9)
+        np.testing.assert_allclose(histograma, (linha - sinal).to_numpy(), rtol=1e-7, atol=1e-9)
+
+    def test_volatilidade(self):
+        """Volatilidade igual ao desvio padrão dos últimos retornos"""
+        precos = gerar_precos()
+        esperado = pd.Series(precos).pct_change().iloc[-20:].std()
+
+        assert indicadores.volatilidade(precos, 20) == pytest.approx(esperado, rel=1e-10)
+        assert np.isnan(indicadores.volatilidade(precos[:5], 20))
+
+
+class TestKernelsMatriz:
+    """Cada linha de uma matriz (símbolos, barras) equivale à série 1-D"""
+
+    @pytest.mark.parametrize('kernel', [
+        lambda x: (indicadores.media_movel(x, 10),),
+        lambda x: (indicadores.media_movel_exponencial(x, 0.2),),
+        lambda x: (indicadores.rsi(x, 14),),
+        lambda x: indicadores.bandas_bollinger(x, 20, 2.0),
+        lambda x: indicadores.macd(x),
+    ])
+    def test_linhas_iguais_a_series(self, kernel):
+        matriz = np.vstack([gerar_precos(200, semente) for semente in range(3)])
+
+        resultados_matriz = kernel(matriz)
+        for linha in range(matriz.shape[0]):
+            for resultado_matriz, resultado_serie in zip(resultados_matriz, kernel(matriz[linha])):
+                np.testing.assert_allclose(resultado_matriz[linha], resultado_serie,
+                                           rtol=1e-12, atol=1e-12, equal_nan=True)
+
+
+class TestIndicadoresIncrementais:
+    """Atualizações O(1) após aquecer equivalem ao cálculo em lote"""
+
+    def test_media_movel_incremental(self):
+        precos = gerar_precos()
+        estado = indicadores.MediaMovelIncremental(20)
+        estado.aquecer(precos[:100])
+
+        valores = [estado.atualizar(preco) for preco in precos[100:].tolist()]
+
+        np.testing.assert_allclose(valores, indicadores.media_movel(precos, 20)[100:], rtol=1e-10)
+
+    def test_media_exponencial_incremental(self):
+        precos = gerar_precos()
+        estado = indicadores.MediaExponencialIncremental(2.0 / 13)
+        estado.aquecer(precos[:100])
+
+        valores = [estado.atualizar(preco) for preco in precos[100:].tolist()]
+
+        np.testing.assert_allclose(valores, indicadores.media_movel_exponencial(precos, 2.0 / 13)[100:], rtol=1e-10)
+
+    def test_rsi_incremental(self):
+        precos = gerar_precos()
+        estado = indicadores.RSIIncremental(14)
+        estado.aquecer(precos[:100])
+
+        valores = [estado.atualizar(preco) for preco in precos[100:].tolist()]
+
+        np.testing.assert_allclose(valores, indicadores.rsi(precos, 14)[100:], rtol=1e-9)
+
+    def test_rsi_incremental_desde_o_inicio(self):
+        """Sem histórico o estado semeia pela média simples dos primeiros deltas"""
+        precos = gerar_precos(60)
+        estado = indicadores.RSIIncremental(14)
+
+        valores = [estado.atualizar(preco) for preco in precos.tolist()]
+
+        np.testing.assert_allclose(valores, indicadores.rsi(precos, 14), rtol=1e-9, equal_nan=True)
+
+    def test_bollinger_incremental_serie_longa(self):
+        """Média e M2 não acumulam erro de arredondamento em séries longas"""
+        rng = np.random.default_rng(0)
+        precos = np.concatenate([60000.0 + rng.normal(0.0, 50.0, 200000), 1.0 + rng.normal(0.0, 0.001, 1000)])
+        estado = indicadores.BollingerIncremental(20, 2.0)
+
+        for preco in precos.tolist():
+            superior, media, inferior = estado.atualizar(preco)
+
+        assert media == pytest.approx(precos[-20:].mean(), rel=1e-12)
+        assert (superior - media) / 2.0 == pytest.approx(np.std(precos[-20:], ddof=1), rel=1e-6)
+
+    def test_bollinger_incremental(self):
+        precos = gerar_precos()
+        estado = indicadores.BollingerIncremental(20, 2.0)
+        estado.aquecer(precos[:100])
+
+        valores = np.array([estado.atualizar(preco) for preco in precos[100:].tolist()])
+
+        for coluna, banda in enumerate(indicadores.bandas_bollinger(precos, 20, 2.0)):
+            np.testing.assert_allclose(valores[:, coluna], banda[100:], rtol=1e-9)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
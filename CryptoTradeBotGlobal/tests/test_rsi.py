@@ -82,7 +82,7 @@ class TestEstrategiaRSI:
         assert len(estrategia_rsi.dados_historicos['BTC/USDT']) == 0
         
         # Adicionar dados
-        await estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados_simbolo)
+        estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados_simbolo)
         
         # Verificar se foi adicionado
         assert len(estrategia_rsi.dados_historicos['BTC/USDT']) == 1
@@ -98,10 +98,10 @@ class TestEstrategiaRSI:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
         
         # RSI deve retornar None
-        rsi = await estrategia_rsi._calcular_rsi('BTC/USDT')
+        rsi = estrategia_rsi._calcular_rsi('BTC/USDT')
         assert rsi is None
     
     @pytest.mark.asyncio
@@ -116,9 +116,9 @@ class TestEstrategiaRSI:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
         
-        rsi = await estrategia_rsi._calcular_rsi('BTC/USDT')
+        rsi = estrategia_rsi._calcular_rsi('BTC/USDT')
         
         # RSI deve ser alto (próximo de 100) em tendência de alta
         assert rsi is not None
@@ -136,9 +136,9 @@ class TestEstrategiaRSI:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
         
-        rsi = await estrategia_rsi._calcular_rsi('BTC/USDT')
+        rsi = estrategia_rsi._calcular_rsi('BTC/USDT')
         
         # RSI deve ser baixo (próximo de 0) em tendência de baixa
         assert rsi is not None
@@ -156,7 +156,7 @@ class TestEstrategiaRSI:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
         
         # Simular análise
         dados_mercado = {
@@ -187,7 +187,7 @@ class TestEstrategiaRSI:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
         
         # Simular análise
         dados_mercado = {
@@ -218,7 +218,7 @@ class TestEstrategiaRSI:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
         
         dados_mercado = {
             'BTC/USDT': {
@@ -249,7 +249,7 @@ class TestEstrategiaRSI:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
         
         # Gerar sinal de compra
         dados_mercado = {
@@ -273,7 +273,7 @@ class TestEstrategiaRSI:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
         
         # Analisar com preço neutro
         dados_neutro = {
@@ -313,6 +313,18 @@ class TestEstrategiaRSI:
         assert confianca > 0.5
         assert confianca <= 1.0
     
+    @pytest.mark.asyncio
+    async def test_calculo_confianca_volume_minimo_zero(self):
+        """Testa confiança sem volume mínimo configurado"""
+        estrategia = criar_estrategia_rsi({'volume_minimo': 0})
+        
+        confianca_sem_volume = estrategia._calcular_confianca_compra(20.0, 0)
+        confianca_com_volume = estrategia._calcular_confianca_venda(80.0, 5000)
+        
+        # Nunca NaN: sem volume não soma confiança, qualquer volume satura
+        assert confianca_sem_volume == pytest.approx(0.7)
+        assert confianca_com_volume == pytest.approx(1.0)
+    
     @pytest.mark.asyncio
     async def test_multiplos_simbolos(self, estrategia_rsi):
         """Testa estratégia com múltiplos símbolos"""
@@ -334,7 +346,7 @@ class TestEstrategiaRSI:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_multi._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_multi._atualizar_dados_historicos('BTC/USDT', dados)
         
         for preco in precos_eth:
             dados = {
@@ -342,7 +354,7 @@ class TestEstrategiaRSI:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_multi._atualizar_dados_historicos('ETH/USDT', dados)
+            estrategia_multi._atualizar_dados_historicos('ETH/USDT', dados)
         
         # Analisar ambos os símbolos
         dados_mercado = {
@@ -383,7 +395,7 @@ class TestEstrategiaRSI:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
         
         status = await estrategia_rsi.obter_status()
         
@@ -409,7 +421,7 @@ class TestEstrategiaRSI:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
         
         dados_mercado = {
             'BTC/USDT': {
@@ -443,7 +455,7 @@ class TestEstrategiaRSI:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia_rsi._atualizar_dados_historicos('BTC/USDT', dados)
         
         dados_mercado = {
             'BTC/USDT': {
@@ -494,10 +506,10 @@ class TestEstrategiaRSIEdgeCases:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia._atualizar_dados_historicos('BTC/USDT', dados)
         
         # RSI deve ser 50 (neutro) ou próximo
-        rsi = await estrategia._calcular_rsi('BTC/USDT')
+        rsi = estrategia._calcular_rsi('BTC/USDT')
         assert rsi is not None
         # Com preços idênticos, RSI pode ser indefinido, mas nossa implementação deve lidar com isso
     
@@ -519,10 +531,10 @@ class TestEstrategiaRSIEdgeCases:
                 'volume_24h': 2000,
                 'timestamp': datetime.now()
             }
-            await estrategia._atualizar_dados_historicos('BTC/USDT', dados)
+            estrategia._atualizar_dados_historicos('BTC/USDT', dados)
         
         # RSI deve ser calculado sem erros
-        rsi = await estrategia._calcular_rsi('BTC/USDT')
+        rsi = estrategia._calcular_rsi('BTC/USDT')
         assert rsi is not None
         assert 0 <= rsi <= 100
     
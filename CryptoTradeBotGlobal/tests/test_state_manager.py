@@ -0,0 +1,157 @@
+"""
+Test suite for State Manager
+Snapshot persistence: delta encoding, legacy rows and schema upgrade.
+"""
+
+import json
+import sqlite3
+import zlib
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core.event_bus import EventBus
+
+state_manager = pytest.importorskip(
+    "src.core.state_manager",
+    reason="src.core.state_manager needs config.settings (config/ package)"
+)
+StateManager = state_manager.StateManager
+SystemState = state_manager.SystemState
+
+
+def make_state(step: int, orders=None) -> SystemState:
+    """Build a snapshot whose fields change with `step`"""
+    return SystemState(
+        timestamp=1700000000.0 + step,
+        trading_engine_state="running" if step % 2 else "paused",
+        active_orders={} if orders is None else dict(orders),
+        active_positions={'p1': {'symbol': 'BTC/USDT', 'qty': 0.5}},
+        portfolio_metrics={'equity': 10000.0 + step},
+        performance_metrics={'step': step},
+        configuration_hash='cfg-1',
+        uptime_seconds=float(step)
+    )
+
+
+def expected_dict(snapshot: SystemState) -> dict:
+    """Snapshot as it should come back from load_snapshot"""
+    return json.loads(json.dumps(snapshot.to_dict_copy()))
+
+
+class TestStateManagerSnapshots:
+    """Test cases for snapshot storage and reconstruction"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create StateManager writing to a temporary data dir"""
+        settings = Mock(data_dir=str(tmp_path))
+        with patch.object(state_manager, 'get_settings', return_value=settings):
+            manager = StateManager(EventBus(enable_persistence=False))
+        yield manager
+        if manager.db_connection:
+            manager.db_connection.close()
+
+    def _row_kinds(self, manager):
+        return manager.db_connection.execute(
+            "SELECT id, is_delta, base_id FROM state_snapshots ORDER BY id"
+        ).fetchall()
+
+    def test_round_trip_across_base_interval(self, manager):
+        """Every snapshot reconstructs exactly, before and after a new base"""
+        manager.snapshot_base_interval = 3
+        snapshots = [make_state(step) for step in range(8)]
+
+        for snapshot in snapshots:
+            manager._store_snapshot(snapshot)
+
+        assert self._row_kinds(manager) == [
+            (1, 0, None), (2, 1, 1), (3, 1, 1), (4, 1, 1),
+            (5, 0, None), (6, 1, 5), (7, 1, 5), (8, 1, 5)
+        ]
+        for snapshot_id, snapshot in enumerate(snapshots, start=1):
+            loaded = manager.load_snapshot(snapshot_id)
+            assert loaded.to_dict() == expected_dict(snapshot)
+
+    def test_removed_key_not_resurrected(self, manager):
+        """A nested key dropped between snapshots is gone after reload"""
+        first = make_state(1, orders={'a': {'qty': 1.0}, 'b': {'qty': 2.0}})
+        second = make_state(1, orders={'a': {'qty': 1.0}})
+
+        manager._store_snapshot(first)
+        manager._store_snapshot(second)
+
+        assert manager.load_snapshot(1).active_orders == {'a': {'qty': 1.0}, 'b': {'qty': 2.0}}
+        assert manager.load_snapshot(2).active_orders == {'a': {'qty': 1.0}}
+
+    def test_unchanged_fields_omitted_from_delta(self, manager):
+        """Deltas only carry the top-level fields that changed"""
+        manager._store_snapshot(make_state(1))
+        manager._store_snapshot(make_state(3))
+
+        (state_data,) = manager.db_connection.execute(
+            "SELECT state_data FROM state_snapshots WHERE id = 2"
+        ).fetchone()
+
+        assert set(StateManager._decode_snapshot_data(state_data)) == {
+            'timestamp', 'portfolio_metrics', 'performance_metrics', 'uptime_seconds'
+        }
+
+    def test_decode_legacy_plain_json(self, manager):
+        """Rows written before compression are plain JSON text"""
+        snapshot = make_state(4)
+        payload = json.dumps(snapshot.to_dict())
+
+        assert StateManager._decode_snapshot_data(payload) == expected_dict(snapshot)
+        assert StateManager._decode_snapshot_data(
+            zlib.compress(payload.encode('utf-8'))
+        ) == expected_dict(snapshot)
+
+        manager.db_connection.execute(
+            "INSERT INTO state_snapshots (timestamp, state_data) VALUES (?, ?)",
+            (snapshot.timestamp, payload)
+        )
+        assert manager.load_snapshot(1).to_dict() == expected_dict(snapshot)
+
+    def test_migrates_table_without_delta_columns(self, tmp_path):
+        """A pre-delta snapshot table gains is_delta/base_id and stays readable"""
+        legacy = make_state(2)
+        connection = sqlite3.connect(str(tmp_path / "trading_history.db"))
+        connection.execute("""
+            CREATE TABLE state_snapshots (
+                id INTEGER PRIMARY KEY,
+                timestamp REAL NOT NULL,
+                state_data TEXT NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        connection.execute(
+            "INSERT INTO state_snapshots (timestamp, state_data) VALUES (?, ?)",
+            (legacy.timestamp, json.dumps(legacy.to_dict()))
+        )
+        connection.commit()
+        connection.close()
+
+        settings = Mock(data_dir=str(tmp_path))
+        with patch.object(state_manager, 'get_settings', return_value=settings):
+            manager = StateManager(EventBus(enable_persistence=False))
+
+        try:
+            columns = {
+                row[1] for row in
+                manager.db_connection.execute("PRAGMA table_info(state_snapshots)")
+            }
+            assert {'is_delta', 'base_id'} <= columns
+            assert manager.load_snapshot(1).to_dict() == expected_dict(legacy)
+
+            current = make_state(5)
+            manager._store_snapshot(current)
+            manager._store_snapshot(make_state(6))
+            assert manager.load_snapshot(2).to_dict() == expected_dict(current)
+            assert manager.load_snapshot(3).to_dict() == expected_dict(make_state(6))
+        finally:
+            manager.db_connection.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])